@@ -1,4 +1,5 @@
 import os
+import json
 from typing import Optional, List
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
@@ -24,6 +25,8 @@ class Settings(BaseSettings):
     dje_timeout: int = Field(default=60, env="DJE_TIMEOUT")
     dje_retry_attempts: int = Field(default=5, env="DJE_RETRY_ATTEMPTS")
     dje_delay_between_requests: float = Field(default=2.0, env="DJE_DELAY")
+    dje_rate_limit: int = Field(default=2, env="DJE_RATE_LIMIT")  # Downloads por período, somando todas as sessões
+    dje_rate_period: float = Field(default=1.0, env="DJE_RATE_PERIOD")
     
     # Scraping Configuration
     target_caderno: str = Field(default="12", env="TARGET_CADERNO")  # Value do select HTML
@@ -34,17 +37,73 @@ class Settings(BaseSettings):
     )  # String com operadores lógicos do DJE
     max_pages_per_execution: int = Field(default=50, env="MAX_PAGES")
     concurrent_requests: int = Field(default=3, env="CONCURRENT_REQUESTS")
+    memory_budget_mb: int = Field(default=512, env="MEMORY_BUDGET_MB")  # Bytes retidos (downloads, texto, cache de páginas, uploads) antes de despejar cache/pausar downloads (0 = sem limite)
+    name_cache_size: int = Field(default=4096, env="NAME_CACHE_SIZE")  # Nomes de autores/advogados já normalizados (LRU)
+    stitch_cross_page_sections: bool = Field(default=True, env="STITCH_CROSS_PAGE_SECTIONS")  # Costurar seções que continuam na página seguinte
+    
+    # Particionamento da busca (sub-consultas em sessões de navegador paralelas)
+    query_partitioning: bool = Field(default=False, env="QUERY_PARTITIONING")
+    query_parallel_sessions: int = Field(default=2, env="QUERY_PARALLEL_SESSIONS")
+    query_partition_cadernos: str = Field(default="", env="QUERY_PARTITION_CADERNOS")  # Vírgula; vazio = target_caderno
+    search_term_variants: str = Field(default="", env="SEARCH_TERM_VARIANTS")  # ';' separado; vazio = ramos OU de search_terms
+    query_page_block_size: int = Field(default=10, env="QUERY_PAGE_BLOCK_SIZE")  # Páginas de resultado por sub-consulta (0 = sem blocos)
+    query_max_total_pages: int = Field(default=500, env="QUERY_MAX_TOTAL_PAGES")  # Limite de segurança por busca particionada
+    
+    # Perfis de busca executados juntos no mesmo processo (JSON: [{"name", "caderno", "search_terms"}])
+    scrape_profiles: str = Field(default="", env="SCRAPE_PROFILES")
     
     # PDF Processing Configuration - NOVO
     pdf_timeout: int = Field(default=30, env="PDF_TIMEOUT")
     pdf_max_size_mb: int = Field(default=50, env="PDF_MAX_SIZE_MB")
     ocr_language: str = Field(default="por", env="OCR_LANGUAGE")
     ocr_config: str = Field(default="--psm 6", env="OCR_CONFIG")
+    ocr_engine: str = Field(default="auto", env="OCR_ENGINE")  # auto | tesserocr (modelo em memória) | pytesseract (subprocesso)
+    ocr_preprocessing: bool = Field(default=True, env="OCR_PREPROCESSING")  # Recorte + 1 bit antes do OCR
+    ocr_binarize_threshold: int = Field(default=180, env="OCR_BINARIZE_THRESHOLD")  # Tons abaixo viram tinta
+    ocr_column_split: bool = Field(default=True, env="OCR_COLUMN_SPLIT")  # OCR de cada coluna do DJE separadamente
+    ocr_column_psm: int = Field(default=4, env="OCR_COLUMN_PSM")  # Coluna única de texto
+    pdf_extraction_workers: int = Field(default=4, env="PDF_EXTRACTION_WORKERS")  # Processos para extração de PDFs grandes
+    pdf_parallel_min_pages: int = Field(default=4, env="PDF_PARALLEL_MIN_PAGES")  # Páginas a partir das quais um PDF é dividido entre processos
+    pdf_shared_buffers: bool = Field(default=True, env="PDF_SHARED_BUFFERS")  # Baixar PDFs direto em memória compartilhada (workers leem sem cópia)
+    pdf_shared_buffer_pool_size: int = Field(default=4, env="PDF_SHARED_BUFFER_POOL_SIZE")  # Segmentos ociosos mantidos para reuso
+    pdf_stream_chunk_pages: int = Field(default=8, env="PDF_STREAM_CHUNK_PAGES")  # Páginas por bloco entregue ao parser durante a extração
+    pdf_text_backends: str = Field(default="pypdfium2,pypdf2,pdfplumber", env="PDF_TEXT_BACKENDS")  # Ordem de tentativa (mais rápido primeiro)
+    parse_time_budget_ms: int = Field(default=250, env="PARSE_TIME_BUDGET_MS")  # Tempo de regex por seção; esgotado, os padrões restantes são pulados (0 = sem limite)
+    text_normalization: bool = Field(default=True, env="TEXT_NORMALIZATION")  # NFC, espaços e hifenização normalizados uma vez por página
+    batch_parsing: bool = Field(default=False, env="BATCH_PARSING")  # Parse vetorizado (pandas) de todas as seções do documento/página
+    keyword_prefilter: bool = Field(default=True, env="KEYWORD_PREFILTER")  # Pular layout/OCR de páginas sem palavra-chave no texto nativo
+    prefilter_keywords: str = Field(default="RPV,pagamento pelo INSS", env="PREFILTER_KEYWORDS")
+    
+    # Download do caderno completo (uma requisição por caderno em vez de uma por página)
+    caderno_bulk_mode: bool = Field(default=False, env="CADERNO_BULK_MODE")
+    dje_caderno_download_url: str = Field(
+        default="https://dje.tjsp.jus.br/cdje/downloadCaderno.do?dtDiario={date}&cdCaderno={caderno}&tpDownload=D",
+        env="DJE_CADERNO_DOWNLOAD_URL"
+    )
+    caderno_max_size_mb: int = Field(default=500, env="CADERNO_MAX_SIZE_MB")
+    caderno_download_timeout: int = Field(default=300, env="CADERNO_DOWNLOAD_TIMEOUT")
     
     # Browser Configuration (Selenium)
     headless_browser: bool = Field(default=True, env="HEADLESS_BROWSER")
     browser_timeout: int = Field(default=30, env="BROWSER_TIMEOUT")
     implicit_wait: int = Field(default=10, env="IMPLICIT_WAIT")
+    pagination_timeout: int = Field(default=30, env="PAGINATION_TIMEOUT")  # Máximo para o DJE trocar a página de resultados
+    browser_performance_profile: bool = Field(default=True, env="BROWSER_PERFORMANCE_PROFILE")  # eager load + bloqueio de recursos via CDP
+    browser_blocked_url_patterns: str = Field(
+        default=(
+            "*.png,*.jpg,*.jpeg,*.gif,*.webp,*.svg,*.ico,*.css,*.woff,*.woff2,*.ttf,*.otf,"
+            "*google-analytics.com*,*googletagmanager.com*,*doubleclick.net*"
+        ),
+        env="BROWSER_BLOCKED_URL_PATTERNS"
+    )
+    
+    # Checkpoints (retomada de execuções interrompidas)
+    checkpoint_enabled: bool = Field(default=True, env="CHECKPOINT_ENABLED")
+    checkpoint_dir: str = Field(default="checkpoints", env="CHECKPOINT_DIR")
+    
+    # Scraping incremental (somente páginas novas do dia)
+    incremental_mode: bool = Field(default=False, env="INCREMENTAL_MODE")
+    incremental_recheck_pages: bool = Field(default=False, env="INCREMENTAL_RECHECK_PAGES")  # Rebaixa páginas conhecidas e só reprocessa se o PDF mudou
     
     # Environment
     environment: str = Field(default="production", env="ENVIRONMENT")
@@ -92,7 +151,8 @@ class Settings(BaseSettings):
         options = Options()
         
         if self.headless_browser:
-            options.add_argument('--headless')
+            # Novo modo headless (o antigo é um browser separado e desatualizado)
+            options.add_argument('--headless=new')
             
         # Otimizações para performance
         options.add_argument('--no-sandbox')
@@ -100,13 +160,49 @@ class Settings(BaseSettings):
         options.add_argument('--disable-gpu')
         options.add_argument('--disable-web-security')
         options.add_argument('--disable-extensions')
-        options.add_argument('--disable-images')
         options.add_argument('--disable-plugins')
         
+        if self.browser_performance_profile:
+            # Retorna no DOMContentLoaded; elementos são aguardados explicitamente
+            options.page_load_strategy = 'eager'
+            # '--disable-images' é ignorado pelo Chrome; este flag realmente desativa imagens
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        
         # User agent
         options.add_argument(f'--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         return options
+    
+    def get_blocked_url_patterns(self) -> List[str]:
+        """🚫 Padrões de URL bloqueados via CDP no perfil de performance"""
+        return [p.strip() for p in self.browser_blocked_url_patterns.split(',') if p.strip()]
+    
+    def get_pdf_text_backends(self) -> List[str]:
+        """📄 Backends de extração de texto, na ordem de tentativa"""
+        return [b.strip().lower() for b in self.pdf_text_backends.split(',') if b.strip()]
+    
+    def get_prefilter_keywords(self) -> List[str]:
+        """🔎 Palavras-chave do prefiltro (as mesmas exigidas na validação das seções)"""
+        return [k.strip() for k in self.prefilter_keywords.split(',') if k.strip()]
+    
+    def get_partition_cadernos(self) -> List[str]:
+        """📚 Cadernos buscados no modo particionado"""
+        cadernos = [c.strip() for c in self.query_partition_cadernos.split(',') if c.strip()]
+        return cadernos or [self.target_caderno]
+    
+    def get_scrape_profiles(self) -> List[dict]:
+        """🧭 Perfis de busca configurados (vazio = perfil único das settings)"""
+        if not self.scrape_profiles.strip():
+            return []
+        
+        profiles = json.loads(self.scrape_profiles)
+        if not isinstance(profiles, list):
+            raise ValueError("SCRAPE_PROFILES must be a JSON list")
+        return profiles
+    
+    def get_search_term_variants(self) -> List[str]:
+        """🔤 Variantes de termos configuradas explicitamente"""
+        return [t.strip() for t in self.search_term_variants.split(';') if t.strip()]
 
 # Singleton instance
 settings = Settings()
@@ -4,6 +4,7 @@ import asyncio
 import sys
 import signal
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Optional
 import click
 import structlog
@@ -16,14 +17,28 @@ try:
     from .config.settings import settings, logger
     from .services.api_client import get_api_client, close_api_client
     from .services.dje_scraper import get_dje_scraper, close_dje_scraper
-    from .models.publication import ExecutionData, ScrapingResult
+    from .services.query_planner import scrape_mode
+    from .models.publication import ExecutionData, ScrapingResult, ExecutionCheckpoint
+    from .utils.checkpoint_store import CheckpointStore
+    from .utils.page_ledger import PageLedger
+    from .utils.benchmark import (
+        benchmark_ocr, benchmark_ocr_preprocessing, benchmark_parse_stress, benchmark_pdf_text,
+        benchmark_section_parsing
+    )
 except ImportError:
     # If relative imports fail, try absolute imports
     try:
         from src.config.settings import settings, logger
         from src.services.api_client import get_api_client, close_api_client
         from src.services.dje_scraper import get_dje_scraper, close_dje_scraper
-        from src.models.publication import ExecutionData, ScrapingResult
+        from src.services.query_planner import scrape_mode
+        from src.models.publication import ExecutionData, ScrapingResult, ExecutionCheckpoint
+        from src.utils.checkpoint_store import CheckpointStore
+        from src.utils.page_ledger import PageLedger
+        from src.utils.benchmark import (
+            benchmark_ocr, benchmark_ocr_preprocessing, benchmark_parse_stress, benchmark_pdf_text,
+            benchmark_section_parsing
+        )
     except ImportError:
         # Last resort - direct imports
         import sys
@@ -32,7 +47,14 @@ except ImportError:
         from config.settings import settings, logger
         from services.api_client import get_api_client, close_api_client
         from services.dje_scraper import get_dje_scraper, close_dje_scraper
-        from models.publication import ExecutionData, ScrapingResult
+        from services.query_planner import scrape_mode
+        from models.publication import ExecutionData, ScrapingResult, ExecutionCheckpoint
+        from utils.checkpoint_store import CheckpointStore
+        from utils.page_ledger import PageLedger
+        from utils.benchmark import (
+            benchmark_ocr, benchmark_ocr_preprocessing, benchmark_parse_stress, benchmark_pdf_text,
+            benchmark_section_parsing
+        )
 
 console = Console()
 
@@ -43,6 +65,7 @@ class ScraperOrchestrator:
         self.api_client = None
         self.dje_scraper = None
         self.current_execution: Optional[ExecutionData] = None
+        self.checkpoint_store: Optional[CheckpointStore] = None
         self.should_stop = False
         
         # Setup signal handlers for graceful shutdown
@@ -69,26 +92,89 @@ class ScraperOrchestrator:
             # Initialize DJE scraper
             self.dje_scraper = await get_dje_scraper()
             
+            if settings.checkpoint_enabled:
+                self.checkpoint_store = CheckpointStore()
+            
             console.print("[green]✅ All components initialized successfully[/green]")
             
         except Exception as e:
             console.print(f"[red]❌ Initialization failed: {str(e)}[/red]")
             raise
     
-    async def execute_scraping(self, target_date: Optional[date] = None) -> bool:
-        """🕷️ Executar scraping para data específica"""
+    async def execute_scraping(
+        self,
+        target_date: Optional[date] = None,
+        checkpoint: Optional[ExecutionCheckpoint] = None,
+        incremental: bool = False,
+        execution: Optional[ExecutionData] = None
+    ) -> bool:
+        """🕷️ Executar scraping para data específica (ou retomar a partir de um checkpoint)
+        
+        Com `incremental=True` apenas páginas do diário ainda não registradas no
+        ledger do dia são baixadas; `execution` reaproveita uma execução já
+        concluída (atualização intradiária) somando os novos contadores.
+        """
         
-        if target_date is None:
+        if checkpoint:
+            target_date = checkpoint.target_date
+        elif target_date is None:
             target_date = date.today()
         
         console.print(f"\n[blue]🚀 Starting scraping execution for {target_date}[/blue]")
         
         try:
-            # Create execution record
-            with console.status("[bold green]Creating execution record..."):
-                self.current_execution = await self.api_client.create_execution(target_date)
+            if checkpoint:
+                # Retomada: reutilizar execução existente, de volta a "running" (checkpoints costumam estar "failed")
+                checkpoint.status = "running"
+                self.current_execution = ExecutionData(
+                    id=checkpoint.execution_id,
+                    execution_date=checkpoint.target_date,
+                    status=checkpoint.status
+                )
+                self._save_checkpoint(checkpoint)
+                await self.api_client.report_progress(
+                    execution_id=checkpoint.execution_id,
+                    publications_found=checkpoint.publications_found,
+                    publications_new=checkpoint.publications_new
+                )
+                console.print(
+                    f"[cyan]🔁 Resuming execution {checkpoint.execution_id} "
+                    f"after {checkpoint.progress_label} "
+                    f"({len(checkpoint.uploaded_process_numbers)} publications already uploaded)[/cyan]"
+                )
+            elif execution:
+                # Atualização incremental sobre execução existente do dia
+                self.current_execution = execution
+                console.print(f"[cyan]🔄 Incremental refresh of execution {execution.id}[/cyan]")
+                
+                checkpoint = ExecutionCheckpoint(
+                    execution_id=execution.id,
+                    target_date=target_date,
+                    mode=scrape_mode(),
+                    publications_found=execution.publications_found,
+                    publications_new=execution.publications_new,
+                    publications_duplicated=execution.publications_duplicated
+                )
+            else:
+                # Create execution record
+                with console.status("[bold green]Creating execution record..."):
+                    self.current_execution = await self.api_client.create_execution(target_date)
+                
+                console.print(f"[green]✅ Execution created with ID: {self.current_execution.id}[/green]")
+                
+                checkpoint = ExecutionCheckpoint(
+                    execution_id=self.current_execution.id,
+                    target_date=target_date,
+                    mode=scrape_mode()
+                )
             
-            console.print(f"[green]✅ Execution created with ID: {self.current_execution.id}[/green]")
+            created_count, duplicate_count = 0, 0
+            
+            page_ledger = None
+            if self.checkpoint_store:
+                page_ledger = PageLedger(target_date, incremental=incremental)
+            elif incremental:
+                console.print("[yellow]⚠️ Incremental mode requires CHECKPOINT_ENABLED - running full scrape[/yellow]")
             
             # Perform scraping
             with Progress(
@@ -102,28 +188,41 @@ class ScraperOrchestrator:
                     total=None
                 )
                 
-                result = await self.dje_scraper.scrape_publications(
-                    target_date=target_date,
-                    execution_id=self.current_execution.id
-                )
-                
-                progress.update(scraping_task, description="Processing results...")
-                
-                # Upload publications to API
-                if result.publications:
-                    upload_task = progress.add_task(
-                        description="Uploading publications to API...",
-                        total=len(result.publications)
+                async def on_page_complete(page_number: int, page_publications):
+                    nonlocal created_count, duplicate_count
+                    
+                    progress.update(
+                        scraping_task,
+                        description=f"Uploading publications from page {page_number}..."
                     )
                     
-                    created_count, duplicate_count = await self.api_client.bulk_create_publications(
-                        result.publications
+                    created, duplicates = await self._upload_page_publications(
+                        page_publications, checkpoint
                     )
+                    created_count += created
+                    duplicate_count += duplicates
+                    
+                    # A página já foi registrada no checkpoint pelo scraper
+                    self._save_checkpoint(checkpoint)
+                    if page_ledger:
+                        self._save_page_ledger(page_ledger)
                     
-                    progress.update(upload_task, completed=len(result.publications))
+                    if self.current_execution.is_running():
+                        await self.api_client.report_progress(
+                            execution_id=checkpoint.execution_id,
+                            publications_found=checkpoint.publications_found,
+                            publications_new=checkpoint.publications_new
+                        )
                     
-                else:
-                    created_count, duplicate_count = 0, 0
+                    progress.update(scraping_task, description="Scraping DJE publications...")
+                
+                result = await self.dje_scraper.scrape_publications(
+                    target_date=target_date,
+                    execution_id=self.current_execution.id,
+                    checkpoint=checkpoint,
+                    on_page_complete=on_page_complete,
+                    page_ledger=page_ledger
+                )
                 
                 # Update execution as completed
                 progress.update(scraping_task, description="Finalizing execution...")
@@ -131,10 +230,14 @@ class ScraperOrchestrator:
                 await self.api_client.update_execution(
                     execution_id=self.current_execution.id,
                     status="completed",
-                    publications_found=result.total_found,
-                    publications_new=created_count
+                    publications_found=checkpoint.publications_found,
+                    publications_new=checkpoint.publications_new
                 )
             
+            checkpoint.status = "completed"
+            if self.checkpoint_store:
+                self.checkpoint_store.delete(checkpoint.execution_id)
+            
             # Display results
             self._display_results(result, created_count, duplicate_count)
             
@@ -142,8 +245,10 @@ class ScraperOrchestrator:
             return True
             
         except Exception as e:
-            # Update execution as failed
-            if self.current_execution:
+            # Update execution as failed (a refresh over a completed execution keeps it completed)
+            if self.current_execution and not self.current_execution.is_completed():
+                self._mark_checkpoint_failed(self.current_execution.id, target_date)
+                
                 try:
                     await self.api_client.update_execution(
                         execution_id=self.current_execution.id,
@@ -157,6 +262,94 @@ class ScraperOrchestrator:
             logger.error("Scraping execution failed", error=str(e))
             return False
     
+    async def _upload_page_publications(
+        self,
+        publications,
+        checkpoint: ExecutionCheckpoint
+    ) -> tuple[int, int]:
+        """📤 Enviar publicações de uma página, ignorando as já enviadas antes da retomada"""
+        pending = [
+            pub for pub in publications
+            if pub.process_number not in checkpoint.uploaded_process_numbers
+        ]
+        
+        if not pending:
+            return 0, 0
+        
+        created, duplicates = await self.api_client.bulk_create_publications(pending)
+        
+        checkpoint.uploaded_process_numbers.update(pub.process_number for pub in pending)
+        checkpoint.publications_new += created
+        checkpoint.publications_duplicated += duplicates
+        
+        return created, duplicates
+    
+    def _save_checkpoint(self, checkpoint: ExecutionCheckpoint):
+        """💾 Persistir checkpoint (falhas de disco não interrompem o scraping)"""
+        if not self.checkpoint_store:
+            return
+        
+        try:
+            self.checkpoint_store.save(checkpoint)
+        except OSError as e:
+            logger.warning("Failed to save checkpoint", execution_id=checkpoint.execution_id, error=str(e))
+    
+    def _save_page_ledger(self, page_ledger: PageLedger):
+        """📒 Persistir ledger de páginas processadas"""
+        try:
+            page_ledger.save()
+        except OSError as e:
+            logger.warning("Failed to save page ledger", target_date=page_ledger.target_date.isoformat(), error=str(e))
+    
+    def _mark_checkpoint_failed(self, execution_id: int, target_date: date):
+        """🚩 Marcar checkpoint em disco como falho, preservando o último estado consistente"""
+        if not self.checkpoint_store:
+            return
+        
+        # O checkpoint em memória pode conter PDFs de uma página não concluída,
+        # então partimos do último estado gravado
+        stored = self.checkpoint_store.load(execution_id) or ExecutionCheckpoint(
+            execution_id=execution_id,
+            target_date=target_date,
+            mode=scrape_mode()
+        )
+        stored.status = "failed"
+        self._save_checkpoint(stored)
+        
+        console.print(
+            f"[yellow]💾 Checkpoint kept at {stored.progress_label} - "
+            f"use 'resume --execution-id {execution_id}' to continue[/yellow]"
+        )
+    
+    async def resume_execution(
+        self,
+        execution_id: Optional[int] = None,
+        target_date: Optional[date] = None
+    ) -> bool:
+        """🔁 Retomar execução interrompida a partir do último checkpoint"""
+        if not self.checkpoint_store:
+            console.print("[red]❌ Checkpoints are disabled (CHECKPOINT_ENABLED=false)[/red]")
+            return False
+        
+        if execution_id is not None:
+            checkpoint = self.checkpoint_store.load(execution_id)
+        else:
+            checkpoint = self.checkpoint_store.find_resumable(target_date)
+        
+        if not checkpoint or not checkpoint.is_resumable():
+            console.print("[yellow]ℹ️ No resumable checkpoint found[/yellow]")
+            return False
+        
+        # Páginas concluídas na busca única e nas particionadas não são intercambiáveis
+        if checkpoint.mode != scrape_mode():
+            console.print(
+                f"[red]❌ Checkpoint {checkpoint.execution_id} was written in '{checkpoint.mode}' mode but the "
+                f"scraper is configured for '{scrape_mode()}' (QUERY_PARTITIONING / SCRAPE_PROFILES)[/red]"
+            )
+            return False
+        
+        return await self.execute_scraping(checkpoint=checkpoint)
+    
     def _display_results(
         self, 
         result: ScrapingResult, 
@@ -176,12 +369,58 @@ class ScraperOrchestrator:
         table.add_row("📤 Successfully Created", str(created_count))
         table.add_row("🔄 Duplicates Found", str(duplicate_count))
         table.add_row("❌ Errors", str(summary['errors_count']))
+        if summary['invalid_publications']:
+            reasons = ", ".join(f"{reason}: {count}" for reason, count in summary['invalid_reasons'].items())
+            table.add_row("🚫 Invalid Publications", f"{summary['invalid_publications']} ({reasons})")
         table.add_row("📄 Pages Scraped", str(summary['pages_scraped']))
+        if summary['search_queries'] > 1:
+            table.add_row("🗺️ Search Queries", str(summary['search_queries']))
+        if summary['truncated_searches']:
+            table.add_row("⚠️ Searches Truncated (page limit)", str(summary['truncated_searches']))
+        if summary['duplicate_pages_skipped']:
+            table.add_row("🔁 Duplicate Pages Skipped", str(summary['duplicate_pages_skipped']))
+        if summary['prefilter_pages_skipped']:
+            table.add_row("🔎 Pages Skipped (no keywords)", str(summary['prefilter_pages_skipped']))
+        if summary['incremental_pages_skipped']:
+            table.add_row("⏭️ Pages Skipped (incremental)", str(summary['incremental_pages_skipped']))
+        table.add_row("🧮 Memory High-Water", f"{summary['memory_high_water_mb']} MB")
+        if summary['backpressure_waits']:
+            table.add_row("⏳ Downloads Throttled (memory)", str(summary['backpressure_waits']))
+        if summary['page_cache_evicted_mb']:
+            table.add_row("♻️ Page Cache Evicted", f"{summary['page_cache_evicted_mb']} MB")
+        if summary['sections_over_parse_budget']:
+            table.add_row("⏱️ Sections Over Parse Budget", str(summary['sections_over_parse_budget']))
+        table.add_row(
+            "♻️ Duplicate Sections Skipped",
+            f"{summary['duplicate_sections_skipped']} ({summary['section_dedup_rate']:.1f}%)"
+        )
+        table.add_row(
+            "🪪 Name Cache Hits",
+            f"{summary['name_cache_hits']} ({summary['name_cache_hit_rate']:.1f}%)"
+        )
+        if summary['navigations']:
+            profile = "performance" if settings.browser_performance_profile else "default"
+            table.add_row(
+                "🌐 Avg Navigation Time",
+                f"{summary['avg_navigation_time']:.2f}s over {summary['navigations']} ({profile} profile)"
+            )
         table.add_row("⏱️ Execution Time", f"{summary['execution_time']:.2f}s")
         table.add_row("📈 Success Rate", f"{summary['success_rate']:.1f}%")
         
         console.print(table)
         
+        if len(summary['profiles']) > 1:
+            profiles_table = Table(title="🧭 Results per Profile")
+            profiles_table.add_column("Profile", style="cyan")
+            profiles_table.add_column("Pages", justify="right")
+            profiles_table.add_column("Found", justify="right")
+            profiles_table.add_column("Valid", justify="right", style="bold white")
+            
+            for name, stats in summary['profiles'].items():
+                profiles_table.add_row(name, str(stats['pages']), str(stats['found']), str(stats['valid']))
+            
+            console.print(profiles_table)
+        
         # Show errors if any
         if result.errors:
             console.print("\n[yellow]⚠️ Errors encountered:[/yellow]")
@@ -191,14 +430,28 @@ class ScraperOrchestrator:
             if len(result.errors) > 5:
                 console.print(f"   ... and {len(result.errors) - 5} more errors")
     
-    async def run_scheduled_execution(self):
-        """⏰ Executar scraping agendado"""
+    async def run_scheduled_execution(self, incremental: Optional[bool] = None):
+        """⏰ Executar scraping agendado
+        
+        No modo incremental uma execução já concluída hoje é atualizada apenas
+        com as páginas publicadas depois dela (barato o bastante para rodar de hora em hora).
+        """
+        if incremental is None:
+            incremental = settings.incremental_mode
+        
         console.print("[blue]⏰ Running scheduled scraping execution[/blue]")
         
         # Check if there's already an execution for today
         today_execution = await self.api_client.get_today_execution()
         
         if today_execution and today_execution.is_completed():
+            if incremental:
+                return await self.execute_scraping(
+                    date.today(),
+                    incremental=True,
+                    execution=today_execution
+                )
+            
             console.print("[yellow]ℹ️ Scraping already completed for today[/yellow]")
             return True
         
@@ -207,7 +460,7 @@ class ScraperOrchestrator:
             return False
         
         # Execute scraping for today
-        return await self.execute_scraping(date.today())
+        return await self.execute_scraping(date.today(), incremental=incremental)
     
     async def run_historical_scraping(self, start_date: date, end_date: date):
         """📅 Executar scraping histórico"""
@@ -297,14 +550,40 @@ async def scrape(date_param):
         await orchestrator.cleanup()
 
 @cli.command()
+@click.option('--execution-id', type=int, help='Execution ID to resume (defaults to latest resumable)')
+@click.option('--date', 'date_param', type=click.DateTime(formats=['%Y-%m-%d']), help='Resume latest checkpoint for this date')
 @run_async
-async def scheduled():
+async def resume(execution_id, date_param):
+    """🔁 Resume an interrupted execution from its last checkpoint"""
+    orchestrator = ScraperOrchestrator()
+    
+    try:
+        await orchestrator.initialize()
+        
+        target_date = date_param.date() if date_param else None
+        success = await orchestrator.resume_execution(execution_id, target_date)
+        
+        sys.exit(0 if success else 1)
+        
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Resume interrupted by user[/yellow]")
+        sys.exit(130)
+    except Exception as e:
+        console.print(f"[red]Fatal error: {str(e)}[/red]")
+        sys.exit(1)
+    finally:
+        await orchestrator.cleanup()
+
+@cli.command()
+@click.option('--incremental/--full', default=None, help='Only process diary pages not seen in earlier runs today')
+@run_async
+async def scheduled(incremental):
     """⏰ Run scheduled scraping (for cron/Azure Functions)"""
     orchestrator = ScraperOrchestrator()
     
     try:
         await orchestrator.initialize()
-        success = await orchestrator.run_scheduled_execution()
+        success = await orchestrator.run_scheduled_execution(incremental)
         sys.exit(0 if success else 1)
         
     except Exception as e:
@@ -336,6 +615,142 @@ async def historical(start_date, end_date):
     finally:
         await orchestrator.cleanup()
 
+@cli.group()
+def benchmark():
+    """⏱️ Benchmarks of the extraction stages"""
+    pass
+
+@benchmark.command('ocr')
+@click.option('--pdf', 'pdf_path', required=True, type=click.Path(exists=True, dir_okay=False), help='Recorded DJE PDF')
+@click.option('--pages', default=5, show_default=True, help='Pages to OCR (0 = all)')
+@click.option('--engine', 'engines', multiple=True, default=('pytesseract', 'tesserocr'), show_default=True)
+def benchmark_ocr_command(pdf_path, pages, engines):
+    """🔠 Compare OCR engines (pages/sec)"""
+    results = benchmark_ocr(Path(pdf_path), engines=engines, max_pages=pages or None)
+    
+    table = Table(title="🔠 OCR Benchmark")
+    table.add_column("Engine", style="cyan")
+    table.add_column("Pages", justify="right")
+    table.add_column("Setup", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Pages/s", justify="right", style="bold white")
+    
+    for row in results:
+        if "error" in row:
+            table.add_row(row["engine"], "-", "-", "-", f"[red]{row['error']}[/red]")
+            continue
+        table.add_row(
+            row["engine"],
+            str(row["pages"]),
+            f"{row['setup_time']:.2f}s",
+            f"{row['seconds']:.2f}s",
+            f"{row['pages_per_sec']:.2f}"
+        )
+    
+    console.print(table)
+
+@benchmark.command('ocr-preprocess')
+@click.option('--pdf', 'pdf_path', required=True, type=click.Path(exists=True, dir_okay=False), help='Recorded DJE PDF')
+@click.option('--pages', default=5, show_default=True, help='Pages to OCR (0 = all)')
+def benchmark_ocr_preprocess_command(pdf_path, pages):
+    """🖼️ Compare full-page OCR with crop/binarize/column-split preprocessing"""
+    results = benchmark_ocr_preprocessing(Path(pdf_path), max_pages=pages or None)
+    
+    table = Table(title="🖼️ OCR Preprocessing Benchmark")
+    table.add_column("Mode", style="cyan")
+    table.add_column("Megapixels", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Pages/s", justify="right", style="bold white")
+    
+    for row in results:
+        megapixels = f"{row['pixels'] / 1_000_000:.1f}"
+        if "error" in row:
+            table.add_row(row["mode"], megapixels, "-", f"[red]{row['error']}[/red]")
+            continue
+        table.add_row(row["mode"], megapixels, f"{row['seconds']:.2f}s", f"{row['pages_per_sec']:.2f}")
+    
+    console.print(table)
+
+@benchmark.command('pdf-text')
+@click.argument('pdf_paths', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--backend', 'backends', multiple=True, help='Backends to compare (default: all)')
+def benchmark_pdf_text_command(pdf_paths, backends):
+    """📄 Compare PDF text backends against the pdfplumber baseline"""
+    results = benchmark_pdf_text([Path(path) for path in pdf_paths], backends=backends or None)
+    
+    table = Table(title="📄 PDF Text Backend Benchmark")
+    table.add_column("Backend", style="cyan")
+    table.add_column("Pages", justify="right")
+    table.add_column("Pages/s", justify="right", style="bold white")
+    table.add_column("Equal to pdfplumber", justify="right")
+    table.add_column("Similarity", justify="right")
+    table.add_column("Quality OK", justify="right")
+    
+    for row in results:
+        if "error" in row:
+            table.add_row(row["backend"], "-", "-", "-", "-", f"[red]{row['error']}[/red]")
+            continue
+        table.add_row(
+            row["backend"],
+            str(row["pages"]),
+            f"{row['pages_per_sec']:.1f}",
+            f"{row['equal_pages']}/{row['pages']}",
+            f"{row['similarity'] * 100:.1f}%",
+            f"{row['quality_ok']}/{row['pages']}"
+        )
+    
+    console.print(table)
+
+@benchmark.command('parse')
+@click.argument('pdf_paths', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--repeat', default=50, show_default=True, help='Repeat the recorded sections to simulate a larger corpus')
+def benchmark_parse_command(pdf_paths, repeat):
+    """🐼 Compare per-section parsing with vectorized pandas batch parsing"""
+    results = benchmark_section_parsing([Path(path) for path in pdf_paths], repeat=repeat)
+    
+    table = Table(title="🐼 Section Parsing Benchmark")
+    table.add_column("Mode", style="cyan")
+    table.add_column("Sections", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Sections/s", justify="right", style="bold white")
+    table.add_column("Same fields", justify="right")
+    
+    for row in results:
+        table.add_row(
+            row["mode"],
+            str(row["sections"]),
+            f"{row['seconds']:.2f}s",
+            f"{row['sections_per_sec']:.0f}",
+            f"{row['matching']}/{row['sections']}"
+        )
+    
+    console.print(table)
+
+@benchmark.command('parse-stress')
+@click.option('--sizes', default='10000,100000,1000000', show_default=True, help='Section sizes in characters (comma-separated)')
+@click.option('--seed', default=0, show_default=True, help='Seed for the OCR-noise section')
+def benchmark_parse_stress_command(sizes, seed):
+    """🧨 Stress the section parser with huge, noisy sections (regex time budget)"""
+    results = benchmark_parse_stress([int(size) for size in sizes.split(',') if size.strip()], seed=seed)
+    
+    table = Table(title=f"🧨 Parser Stress (budget {settings.parse_time_budget_ms} ms/section)")
+    table.add_column("Case", style="cyan")
+    table.add_column("Chars", justify="right")
+    table.add_column("Time", justify="right", style="bold white")
+    table.add_column("Over budget", justify="center")
+    table.add_column("Parsed", justify="center")
+    
+    for row in results:
+        table.add_row(
+            row["case"],
+            f"{row['chars']:,}",
+            f"{row['seconds'] * 1000:.1f} ms",
+            "⏱️" if row["over_budget"] else "",
+            "✅" if row["parsed"] else "❌"
+        )
+    
+    console.print(table)
+
 @cli.command()
 @run_async
 async def test():
@@ -377,6 +792,8 @@ def main():
     console.print(f"[dim]API: {settings.api_base_url}[/dim]")
     console.print(f"[dim]Environment: {settings.environment}[/dim]")
     console.print(f"[dim]Host: {settings.execution_host}[/dim]")
+    if settings.scrape_profiles:
+        console.print(f"[dim]Profiles: {len(settings.get_scrape_profiles())} (concurrent)[/dim]")
     
     # Run CLI
     cli()
@@ -0,0 +1,58 @@
+"""📄 Referências a páginas físicas do Diário da Justiça Eletrônico"""
+
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+from urllib.parse import urlparse, parse_qs
+
+class DiaryPageRef(NamedTuple):
+    """📄 Página física do DJE (cdVolume, nuDiario, cdCaderno, nuSeqpagina)"""
+
+    cd_volume: int
+    nu_diario: int
+    cd_caderno: int
+    nu_seqpagina: int
+
+    @classmethod
+    def from_url(cls, url: str) -> Optional['DiaryPageRef']:
+        """🔗 Extrair referência de uma URL consultaSimples.do / getPaginaDoDiario.do"""
+        params = parse_qs(urlparse(url).query)
+        try:
+            return cls(
+                cd_volume=int(params['cdVolume'][0]),
+                nu_diario=int(params['nuDiario'][0]),
+                cd_caderno=int(params['cdCaderno'][0]),
+                nu_seqpagina=int(params['nuSeqpagina'][0])
+            )
+        except (KeyError, IndexError, ValueError):
+            return None
+
+    @property
+    def key(self) -> str:
+        """🔑 Chave estável usada em checkpoints e no ledger"""
+        return f"{self.cd_volume}:{self.nu_diario}:{self.cd_caderno}:{self.nu_seqpagina}"
+
+    def pdf_url(self, base_url: str) -> str:
+        """📥 URL direta do PDF da página"""
+        return (
+            f"{base_url.rstrip('/')}/cdje/getPaginaDoDiario.do"
+            f"?cdVolume={self.cd_volume}&nuDiario={self.nu_diario}"
+            f"&cdCaderno={self.cd_caderno}&nuSeqpagina={self.nu_seqpagina}&uuidCaptcha="
+        )
+
+    def adjacent(self, offset: int) -> 'DiaryPageRef':
+        """↔️ Página vizinha no mesmo caderno"""
+        return self._replace(nu_seqpagina=self.nu_seqpagina + offset)
+
+    def follows(self, other: 'DiaryPageRef') -> bool:
+        """➡️ Verificar se esta página vem logo após `other` no mesmo caderno"""
+        return self[:3] == other[:3] and self.nu_seqpagina == other.nu_seqpagina + 1
+
+@dataclass
+class DiaryPageText:
+    """📝 Texto extraído de uma página do diário"""
+
+    ref: DiaryPageRef
+    url: str
+    text: str
+    is_hit: bool = True  # False para páginas vizinhas baixadas apenas para costura
+    content_hash: Optional[str] = None
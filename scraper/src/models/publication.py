@@ -2,13 +2,66 @@
 
 import re
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Set
+from dataclasses import InitVar, dataclass, field
 from decimal import Decimal, InvalidOperation
+from enum import Enum
 import structlog
 
+from ..utils.keyword_anchors import AnchorHits, scan_anchors
+from ..utils.name_cache import normalize_name
+from ..utils.regex_budget import GAP, ParseBudget
+
 logger = structlog.get_logger(__name__)
 
+# Âncoras exigidas por pelo menos um padrão de cada valor (sem nenhuma, o valor é pulado)
+VALUE_ANCHORS = {
+    'main_value': ('principal', 'importe', 'currency'),
+    'interest_value': ('juros', 'correcao'),
+    'legal_fees': ('honorarios',)
+}
+
+# Padrões de valores do fallback de PublicationData, compilados uma vez (GAP: distância limitada entre termos)
+# Em minúsculas: rodam sobre a cópia case-folded (`AnchorHits.folded`)
+VALUE_PATTERNS = {
+    'main_value': [
+        # Padrões mais específicos primeiro
+        re.compile(r'r\$\s*([\d.,]+)\s*-\s*principal\s*bruto'),
+        re.compile(r'r\$\s*([\d.,]+)\s*-\s*principal\s*líquido'),
+        re.compile(r'r\$\s*([\d.,]+)\s*-\s*principal'),
+        re.compile(r'valor\s+principal[:\s]*r?\$?\s*([\d.,]+)'),
+        re.compile(r'principal[:\s]*r?\$?\s*([\d.,]+)'),
+        re.compile(rf'valor{GAP}principal{GAP}r\$?\s*([\d.,]+)'),
+        re.compile(r'importe total de r\$\s*([\d.,]+)'),
+        # Padrão mais genérico
+        re.compile(r'r\$\s*([\d.,]{4,})'),  # Pelo menos 4 dígitos (ex: 1.000)
+    ],
+    'interest_value': [
+        re.compile(r'r\$\s*([\d.,]+)\s*-\s*juros\s*moratórios'),
+        re.compile(r'juros\s*moratórios[:\s]*r?\$?\s*([\d.,]+)'),
+        re.compile(rf'juros{GAP}r\$\s*([\d.,]+)'),
+        re.compile(rf'correção{GAP}r\$\s*([\d.,]+)'),
+        re.compile(r'sem\s+juros\s+moratórios'),  # Caso especial - sem juros
+    ],
+    'legal_fees': [
+        re.compile(r'r\$\s*([\d.,]+)\s*-\s*honorários\s*advocatícios'),
+        re.compile(r'honorários\s*advocatícios[:\s]*r?\$?\s*([\d.,]+)'),
+        re.compile(rf'honorários{GAP}r\$\s*([\d.,]+)'),
+        re.compile(rf'verba{GAP}honorária{GAP}r\$\s*([\d.,]+)'),
+    ]
+}
+
+# Conteúdo mínimo (caracteres sem espaços nas pontas) para uma publicação válida
+MIN_CONTENT_LENGTH = 20
+
+class ValidationReason(Enum):
+    """🏷️ Resultado da validação de uma publicação"""
+    VALID = "valid"
+    MISSING_PROCESS_NUMBER = "missing_process_number"
+    NO_AUTHORS = "no_authors"
+    SHORT_CONTENT = "short_content"
+    EXTRACTION_FAILED = "extraction_failed"  # Seção sem publicação extraída (não há objeto para validar)
+
 @dataclass
 class PublicationData:
     """📄 Dados de uma publicação do DJE"""
@@ -24,19 +77,26 @@ class PublicationData:
     interest_value: Optional[Decimal] = None
     legal_fees: Optional[Decimal] = None
     scraper_execution_id: Optional[int] = None
+    _validation: Optional[ValidationReason] = field(default=None, init=False, repr=False, compare=False)
+    # Varredura de âncoras e prazo de parse da seção (reaproveitados na extração de valores)
+    anchors: InitVar[Optional[AnchorHits]] = None
+    budget: InitVar[Optional[ParseBudget]] = None
     
-    def __post_init__(self):
+    def __post_init__(self, anchors: Optional[AnchorHits] = None, budget: Optional[ParseBudget] = None):
         """🔧 Validações e limpeza após inicialização"""
         # Clean process number
         self.process_number = self._clean_process_number(self.process_number)
         
-        # Clean authors and lawyers
-        self.authors = [self._clean_name(author) for author in self.authors if author]
-        self.lawyers = [self._clean_lawyer_name(lawyer) for lawyer in self.lawyers if lawyer]
+        # Clean authors and lawyers (memoizado: os mesmos nomes se repetem entre seções).
+        # Único ponto de normalização: os parsers entregam os nomes brutos
+        self.authors = list(dict.fromkeys(
+            normalize_name('author', author, self._clean_name) for author in self.authors if author
+        ))
+        self.lawyers = [normalize_name('lawyer', lawyer, self._clean_lawyer_name) for lawyer in self.lawyers if lawyer]
         
         # Extract monetary values from content if not provided
         if self.full_content and not all([self.main_value, self.interest_value, self.legal_fees]):
-            extracted_values = self._extract_monetary_values(self.full_content)
+            extracted_values = self._extract_monetary_values(self.full_content, anchors, budget)
             
             if self.main_value is None:
                 self.main_value = extracted_values.get('main_value')
@@ -153,11 +213,8 @@ class PublicationData:
         if not name:
             return ""
         
-        # Remove extra spaces and normalize
-        cleaned = re.sub(r'\s+', ' ', name.strip())
-        
-        # Capitalize properly
-        cleaned = ' '.join(word.capitalize() for word in cleaned.split())
+        # Capitalize properly (split/join também colapsa os espaços)
+        cleaned = ' '.join(word.capitalize() for word in name.split())
         
         return cleaned
     
@@ -185,8 +242,16 @@ class PublicationData:
         return cleaned
     
     @staticmethod
-    def _extract_monetary_values(content: str) -> Dict[str, Optional[Decimal]]:
-        """💰 Extrair valores monetários do conteúdo - COM DEBUG MELHORADO"""
+    def _extract_monetary_values(
+        content: str,
+        anchors: Optional[AnchorHits] = None,
+        budget: Optional[ParseBudget] = None
+    ) -> Dict[str, Optional[Decimal]]:
+        """💰 Extrair valores monetários do conteúdo - COM DEBUG MELHORADO
+        
+        `anchors` reaproveita a varredura feita pelo parser da seção; `budget`
+        é o prazo da seção: esgotado, os padrões restantes são pulados.
+        """
         values = {
             'main_value': None,
             'interest_value': None,
@@ -197,45 +262,30 @@ class PublicationData:
             return values
         
         try:
-            # Patterns melhorados - mais flexíveis
-            patterns = {
-                'main_value': [
-                    # Padrões mais específicos primeiro
-                    r'R\$\s*([\d.,]+)\s*-\s*principal\s*bruto',
-                    r'R\$\s*([\d.,]+)\s*-\s*principal\s*líquido',
-                    r'R\$\s*([\d.,]+)\s*-\s*principal',
-                    r'valor\s+principal[:\s]*R?\$?\s*([\d.,]+)',
-                    r'principal[:\s]*R?\$?\s*([\d.,]+)',
-                    r'valor.*?principal.*?R\$?\s*([\d.,]+)',
-                    r'importe total de R\$\s*([\d.,]+)',
-                    # Padrão mais genérico
-                    r'R\$\s*([\d.,]{4,})',  # Pelo menos 4 dígitos (ex: 1.000)
-                ],
-                'interest_value': [
-                    r'R\$\s*([\d.,]+)\s*-\s*juros\s*moratórios',
-                    r'juros\s*moratórios[:\s]*R?\$?\s*([\d.,]+)',
-                    r'juros.*?R\$\s*([\d.,]+)',
-                    r'correção.*?R\$\s*([\d.,]+)',
-                    r'sem\s+juros\s+moratórios',  # Caso especial - sem juros
-                ],
-                'legal_fees': [
-                    r'R\$\s*([\d.,]+)\s*-\s*honorários\s*advocatícios',
-                    r'honorários\s*advocatícios[:\s]*R?\$?\s*([\d.,]+)',
-                    r'honorários.*?R\$\s*([\d.,]+)',
-                    r'verba.*?honorária.*?R\$\s*([\d.,]+)',
-                ]
-            }
+            # Uma varredura do texto decide quais grupos de padrões podem casar;
+            # os padrões (em minúsculas) rodam sobre a cópia case-folded
+            anchors = anchors or scan_anchors(content)
+            budget = budget or ParseBudget(0)
+            folded = anchors.folded
             
-            for value_type, pattern_list in patterns.items():
+            for value_type, pattern_list in VALUE_PATTERNS.items():
+                if not anchors.has(*VALUE_ANCHORS[value_type]):
+                    continue
+                
                 logger.debug(f"🔍 Buscando {value_type} no texto...")
                 
                 for i, pattern in enumerate(pattern_list):
-                    matches = re.findall(pattern, content, re.IGNORECASE)
+                    if budget.expired():
+                        break
+                    matches = [
+                        match.group(1) if pattern.groups else match.group(0)
+                        for match in budget.finditer(pattern, folded)
+                    ]
                     
                     if matches:
                         logger.info(
                             f"🎯 Pattern {i+1} encontrou matches para {value_type}",
-                            pattern=pattern,
+                            pattern=pattern.pattern,
                             matches=matches[:3],  # Primeiros 3 matches
                             total_matches=len(matches)
                         )
@@ -264,8 +314,8 @@ class PublicationData:
                             break  # Encontrou valor, sair do loop de patterns
                     
                     # Caso especial: "sem juros moratórios"
-                    if value_type == 'interest_value' and 'sem juros moratórios' in pattern.lower():
-                        if re.search(pattern, content, re.IGNORECASE):
+                    if value_type == 'interest_value' and 'sem juros moratórios' in pattern.pattern.lower():
+                        if budget.search(pattern, folded):
                             values[value_type] = Decimal('0.00')
                             logger.info("✅ Juros moratórios = 0 (sem juros)")
                             break
@@ -287,40 +337,36 @@ class PublicationData:
         
         return values
     
-    def is_valid(self) -> bool:
-        """✅ Verificar se a publicação é válida - COM DEBUG DETALHADO"""
-        
-        # Log detalhado para debug
-        logger.info(
-            "🔍 Validando publicação",
-            process_number=self.process_number,
-            authors_count=len(self.authors) if self.authors else 0,
-            authors=self.authors[:3] if self.authors else [],  # Primeiros 3 autores
-            content_length=len(self.full_content) if self.full_content else 0,
-            content_preview=self.full_content[:200] if self.full_content else None
-        )
-        
+    @property
+    def validation_reason(self) -> ValidationReason:
+        """🏷️ Motivo da validação (calculado uma vez e memoizado)"""
+        if self._validation is None:
+            self._validation = self._validate()
+            if self._validation is not ValidationReason.VALID:
+                logger.warning(
+                    "❌ Publicação inválida",
+                    process_number=self.process_number,
+                    reason=self._validation.value,
+                    authors_count=len(self.authors),
+                    content_length=len(self.full_content) if self.full_content else 0
+                )
+        return self._validation
+    
+    def _validate(self) -> ValidationReason:
         if not self.process_number:
-            logger.warning("❌ Validação falhou: process_number vazio", process_number=self.process_number)
-            return False
+            return ValidationReason.MISSING_PROCESS_NUMBER
         
         if not self.authors:
-            logger.warning("❌ Validação falhou: lista de authors vazia", 
-                        process_number=self.process_number, 
-                        authors=self.authors)
-            return False
+            return ValidationReason.NO_AUTHORS
         
-        # Reduzir critério de conteúdo mínimo de 50 para 20 caracteres
-        min_content_length = 20
-        if not self.full_content or len(self.full_content.strip()) < min_content_length:
-            logger.warning("❌ Validação falhou: conteúdo insuficiente", 
-                        process_number=self.process_number,
-                        content_length=len(self.full_content) if self.full_content else 0,
-                        min_required=min_content_length)
-            return False
+        if not self.full_content or len(self.full_content.strip()) < MIN_CONTENT_LENGTH:
+            return ValidationReason.SHORT_CONTENT
         
-        logger.info("✅ Publicação válida", process_number=self.process_number)
-        return True
+        return ValidationReason.VALID
+    
+    def is_valid(self) -> bool:
+        """✅ Verificar se a publicação é válida"""
+        return self.validation_reason is ValidationReason.VALID
     
     def to_dict(self) -> Dict[str, Any]:
         """📦 Converter para dicionário"""
@@ -387,6 +433,76 @@ class ExecutionData:
         """❌ Verificar se a execução falhou"""
         return self.status == "failed"
 
+@dataclass
+class ExecutionCheckpoint:
+    """💾 Checkpoint de progresso de uma execução (permite retomar após falha)"""
+    
+    execution_id: int
+    target_date: date
+    last_completed_page: int = 0  # Busca única: páginas 1..N concluídas
+    completed_pages: Dict[str, Set[int]] = field(default_factory=dict)  # Buscas particionadas: páginas concluídas por busca
+    mode: str = "search"  # search | partitioned (a retomada exige o mesmo modo)
+    processed_pdf_keys: Set[str] = field(default_factory=set)
+    uploaded_process_numbers: Set[str] = field(default_factory=set)
+    publications_found: int = 0
+    publications_new: int = 0
+    publications_duplicated: int = 0
+    status: str = "running"
+    updated_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExecutionCheckpoint':
+        """🔄 Criar instância a partir do JSON persistido"""
+        return cls(
+            execution_id=data['execution_id'],
+            target_date=date.fromisoformat(data['target_date']),
+            last_completed_page=data.get('last_completed_page', 0),
+            completed_pages={key: set(pages) for key, pages in data.get('completed_pages', {}).items()},
+            mode=data.get('mode', 'search'),
+            processed_pdf_keys=set(data.get('processed_pdf_keys', [])),
+            uploaded_process_numbers=set(data.get('uploaded_process_numbers', [])),
+            publications_found=data.get('publications_found', 0),
+            publications_new=data.get('publications_new', 0),
+            publications_duplicated=data.get('publications_duplicated', 0),
+            status=data.get('status', 'running'),
+            updated_at=datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else None
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """📦 Converter para dicionário serializável"""
+        return {
+            'execution_id': self.execution_id,
+            'target_date': self.target_date.isoformat(),
+            'last_completed_page': self.last_completed_page,
+            'completed_pages': {key: sorted(pages) for key, pages in self.completed_pages.items()},
+            'mode': self.mode,
+            'processed_pdf_keys': sorted(self.processed_pdf_keys),
+            'uploaded_process_numbers': sorted(self.uploaded_process_numbers),
+            'publications_found': self.publications_found,
+            'publications_new': self.publications_new,
+            'publications_duplicated': self.publications_duplicated,
+            'status': self.status,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+    
+    def is_resumable(self) -> bool:
+        """🔁 Verificar se a execução pode ser retomada"""
+        return self.status in ("running", "failed")
+    
+    def complete_page(self, page_number: int, search_key: Optional[str] = None):
+        """✅ Registrar página de resultados concluída (na busca única ou em uma busca particionada)"""
+        if search_key is None:
+            self.last_completed_page = max(self.last_completed_page, page_number)
+        else:
+            self.completed_pages.setdefault(search_key, set()).add(page_number)
+    
+    @property
+    def progress_label(self) -> str:
+        """🏷️ Progresso legível para mensagens de retomada"""
+        if self.mode == "partitioned":
+            return f"{sum(len(pages) for pages in self.completed_pages.values())} completed result pages"
+        return f"page {self.last_completed_page}"
+
 @dataclass
 class ScrapingResult:
     """📊 Resultado de uma operação de scraping"""
@@ -397,6 +513,22 @@ class ScrapingResult:
     duplicates_found: int = 0
     errors: List[str] = field(default_factory=list)
     pages_scraped: int = 0
+    incremental_pages_skipped: int = 0
+    duplicate_pages_skipped: int = 0
+    prefilter_pages_skipped: int = 0  # Páginas sem palavra-chave no texto nativo (sem layout/OCR/parse)
+    duplicate_sections_skipped: int = 0  # Seções repetidas na execução (parseadas só na primeira vez)
+    unique_sections: int = 0
+    navigation_times: List[float] = field(default_factory=list)
+    search_queries: int = 0
+    truncated_searches: int = 0  # Buscas interrompidas no limite de páginas com resultados restantes
+    profile_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)  # Por perfil de busca
+    memory_high_water_bytes: int = 0  # Pico de bytes em trânsito (downloads + texto + cache de páginas + publicações)
+    backpressure_waits: int = 0  # Downloads que esperaram o orçamento de memória
+    page_cache_evicted_bytes: int = 0  # Texto de páginas despejado do cache sob pressão de memória
+    sections_over_parse_budget: int = 0  # Seções que esgotaram o tempo de regex (padrões restantes pulados)
+    name_cache_hits: int = 0
+    name_cache_misses: int = 0
+    invalid_reasons: Dict[str, int] = field(default_factory=dict)  # Publicações descartadas por motivo
     execution_time: float = 0.0
     
     def add_publication(self, publication: PublicationData):
@@ -405,12 +537,23 @@ class ScrapingResult:
             self.publications.append(publication)
             self.total_processed += 1
         else:
-            self.errors.append(f"Invalid publication: {publication.process_number}")
+            self.add_invalid(publication.validation_reason)
+    
+    def add_invalid(self, reason: ValidationReason):
+        """🚫 Contabilizar publicação descartada (por motivo, não uma mensagem por publicação)"""
+        self.invalid_reasons[reason.value] = self.invalid_reasons.get(reason.value, 0) + 1
     
     def add_error(self, error: str):
         """❌ Adicionar erro ao resultado"""
         self.errors.append(error)
     
+    def add_profile_page(self, profile: str, found: int, valid: int):
+        """🧭 Contabilizar página de resultados de um perfil de busca"""
+        stats = self.profile_stats.setdefault(profile, {'pages': 0, 'found': 0, 'valid': 0})
+        stats['pages'] += 1
+        stats['found'] += found
+        stats['valid'] += valid
+    
     def get_summary(self) -> Dict[str, Any]:
         """📋 Obter resumo dos resultados"""
         return {
@@ -419,7 +562,35 @@ class ScrapingResult:
             'valid_publications': len(self.publications),
             'duplicates_found': self.duplicates_found,
             'errors_count': len(self.errors),
+            'invalid_publications': sum(self.invalid_reasons.values()),
+            'invalid_reasons': dict(self.invalid_reasons),
             'pages_scraped': self.pages_scraped,
+            'incremental_pages_skipped': self.incremental_pages_skipped,
+            'duplicate_pages_skipped': self.duplicate_pages_skipped,
+            'prefilter_pages_skipped': self.prefilter_pages_skipped,
+            'duplicate_sections_skipped': self.duplicate_sections_skipped,
+            'unique_sections': self.unique_sections,
+            'navigations': len(self.navigation_times),
+            'search_queries': self.search_queries,
+            'truncated_searches': self.truncated_searches,
+            'profiles': {name: dict(stats) for name, stats in self.profile_stats.items()},
+            'memory_high_water_mb': round(self.memory_high_water_bytes / 1024 / 1024, 1),
+            'backpressure_waits': self.backpressure_waits,
+            'page_cache_evicted_mb': round(self.page_cache_evicted_bytes / 1024 / 1024, 1),
+            'sections_over_parse_budget': self.sections_over_parse_budget,
+            'avg_navigation_time': (
+                sum(self.navigation_times) / len(self.navigation_times)
+                if self.navigation_times else 0
+            ),
+            'name_cache_hits': self.name_cache_hits,
+            'name_cache_hit_rate': (
+                (self.name_cache_hits / (self.name_cache_hits + self.name_cache_misses) * 100)
+                if (self.name_cache_hits + self.name_cache_misses) > 0 else 0
+            ),
+            'section_dedup_rate': (
+                (self.duplicate_sections_skipped / (self.duplicate_sections_skipped + self.unique_sections) * 100)
+                if (self.duplicate_sections_skipped + self.unique_sections) > 0 else 0
+            ),
             'execution_time': self.execution_time,
             'success_rate': (
                 (self.total_processed / self.total_found * 100) 
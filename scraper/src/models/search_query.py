@@ -0,0 +1,58 @@
+"""🔎 Sub-consultas independentes da busca avançada do DJE"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
+
+@dataclass(frozen=True)
+class ScrapeProfile:
+    """🧭 Perfil de busca (caderno + termos) executado junto com os demais
+
+    O código do caderno já identifica a parte (ex.: "12" = Caderno 3 - Parte I);
+    a busca avançada do DJE não tem outro campo de parte.
+    """
+
+    name: str
+    caderno: str
+    search_terms: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScrapeProfile':
+        """🔄 Criar perfil a partir da configuração (SCRAPE_PROFILES)"""
+        unknown = set(data) - {'name', 'caderno', 'search_terms'}
+        if unknown:
+            # Ex.: "part" - a parte vem do código do caderno
+            raise ValueError(f"SCRAPE_PROFILES: unsupported profile keys {sorted(unknown)}")
+        return cls(
+            name=str(data['name']),
+            caderno=str(data['caderno']),
+            search_terms=str(data['search_terms'])
+        )
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """🔎 Uma busca (caderno + termos) restrita a um bloco de páginas de resultado"""
+
+    caderno: str
+    search_terms: str
+    start_page: int = 1
+    end_page: Optional[int] = None  # None = até a última página disponível
+    profile: str = "default"
+
+    @property
+    def label(self) -> str:
+        """🏷️ Identificação curta para logs"""
+        pages = f"{self.start_page}-{self.end_page}" if self.end_page else f"{self.start_page}+"
+        return f"profile={self.profile} caderno={self.caderno} terms={self.search_terms} pages={pages}"
+
+    @property
+    def search_key(self) -> str:
+        """🔑 Busca (sem o bloco de páginas) usada no checkpoint"""
+        return f"{self.profile}|{self.caderno}|{self.search_terms}"
+
+    def next_block(self) -> Optional['SearchQuery']:
+        """⏭️ Próximo bloco de páginas da mesma busca"""
+        if self.end_page is None:
+            return None
+
+        size = self.end_page - self.start_page + 1
+        return replace(self, start_page=self.end_page + 1, end_page=self.end_page + size)
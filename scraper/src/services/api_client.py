@@ -242,6 +242,36 @@ class APIClient:
             )
             raise
     
+    async def report_progress(
+        self,
+        execution_id: int,
+        publications_found: int,
+        publications_new: int
+    ) -> bool:
+        """📈 Reportar progresso parcial de uma execução em andamento"""
+
+        try:
+            await self._make_request(
+                "PATCH",
+                f"/api/scraper/executions/{execution_id}",
+                json={
+                    "status": "running",
+                    "publicationsFound": publications_found,
+                    "publicationsNew": publications_new,
+                    "publicationsDuplicated": publications_found - publications_new
+                }
+            )
+            return True
+
+        except Exception as e:
+            # Progresso é informativo - não deve interromper o scraping
+            logger.warning(
+                "Failed to report execution progress",
+                execution_id=execution_id,
+                error=str(e)
+            )
+            return False
+
     async def create_publication(self, publication: PublicationData) -> bool:
         """📄 Criar nova publicação"""
         
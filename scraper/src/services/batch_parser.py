@@ -0,0 +1,184 @@
+"""🐼 Parse em lote de seções do DJE com pandas (dia inteiro ou intervalo de backfill)
+
+Usa os mesmos padrões do parser por seção (`utils.section_patterns`), com as
+mesmas âncoras decidindo quais seções passam por cada padrão. Os padrões em
+minúsculas rodam com re.IGNORECASE sobre o texto original, então os grupos
+já saem na caixa original.
+"""
+
+import re
+from decimal import Decimal
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import structlog
+
+from ..models.publication import PublicationData
+from ..utils.keyword_anchors import AnchorHits, scan_anchors
+from ..utils.regex_budget import ParseBudget
+from ..utils.section_patterns import (
+    AUTHOR_ANCHORS, AUTHOR_FALLBACK_PATTERNS, AUTHOR_PATTERN, FEES_PATTERNS, INTEREST_PATTERNS,
+    LAWYER_ANCHORS, LAWYER_PATTERNS, MAIN_VALUE_PATTERNS, NO_INTEREST_MARKER, PROCESS_NUMBER_PATTERN
+)
+
+logger = structlog.get_logger(__name__)
+
+def _has_anchor(anchors: pd.Series, *names: str) -> pd.Series:
+    """⚓ Máscara das seções em que alguma das âncoras aparece"""
+    return anchors.map(lambda hits: hits.has(*names)).astype(bool)
+
+def _first_match(
+    texts: pd.Series,
+    anchors: pd.Series,
+    patterns: Sequence[Tuple['re.Pattern', str]],
+    budget: ParseBudget
+) -> pd.Series:
+    """🔍 Grupo do primeiro padrão (em ordem) que casa em cada texto
+
+    Cada padrão só roda nas seções ainda sem valor que têm a sua âncora.
+    """
+    result = pd.Series(None, index=texts.index, dtype=object)
+    for pattern, anchor in patterns:
+        if budget.expired():
+            break
+        pending = result.isna() & _has_anchor(anchors, anchor)
+        if pending.any():
+            result[pending] = texts[pending].str.extract(pattern.pattern, flags=re.IGNORECASE, expand=False)
+    return result
+
+def parse_brazilian_numbers(values: pd.Series) -> pd.Series:
+    """💰 '1.234,56' → Decimal('1234.56') para uma coluna inteira
+
+    Mesma regra de DJEScraper._parse_monetary_value: com vírgula, pontos são
+    separadores de milhar; sem vírgula o texto é mantido. Valores que não
+    formam um número válido viram None.
+    """
+    values = values.astype(object).where(values.notna(), None)
+    text = values.dropna().astype(str).str.strip()
+
+    has_comma = text.str.contains(',', regex=False)
+    text = text.where(~has_comma, text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False))
+
+    valid = text.str.contains(r'\d') & (text.str.count(r'\.') <= 1)
+    converted = pd.Series(None, index=values.index, dtype=object)
+    converted[valid[valid].index] = text[valid].map(Decimal)
+    return converted
+
+def _valid_names(candidates: pd.Series) -> pd.Series:
+    """✅ Candidatos a autor (explodidos por seção) com tamanho e nº de palavras mínimos
+
+    Nomes saem brutos: PublicationData limpa, formata e deduplica.
+    """
+    names = candidates.dropna().str.strip()
+    return names[(names.str.len() >= 5) & (names.str.split().str.len() >= 2)]
+
+def _group_lists(values: pd.Series, index: pd.Index) -> pd.Series:
+    """📚 Valores explodidos (índice repetido) de volta para uma lista por seção"""
+    grouped = values.groupby(level=0, sort=False).agg(list) if len(values) else pd.Series(dtype=object)
+    return grouped.reindex(index).map(lambda value: value if isinstance(value, list) else [])
+
+def extract_authors(texts: pd.Series, anchors: pd.Series, budget: ParseBudget) -> pd.Series:
+    """👤 Autores por seção: padrão principal (todos) ou o primeiro válido do fallback"""
+    has_vistos = _has_anchor(anchors, *AUTHOR_ANCHORS)
+    main = _valid_names(texts[has_vistos].str.findall(AUTHOR_PATTERN.pattern, flags=re.IGNORECASE).explode())
+    authors = _group_lists(main, texts.index).map(lambda names: list(dict.fromkeys(names)))
+
+    for pattern in AUTHOR_FALLBACK_PATTERNS:
+        if budget.expired():
+            break
+        missing = (authors.map(len) == 0) & has_vistos
+        if not missing.any():
+            break
+        names = _valid_names(texts[missing].str.findall(pattern.pattern, flags=re.IGNORECASE).explode())
+        first = names.groupby(level=0, sort=False).first()
+        authors[first.index] = first.map(lambda name: [name])
+
+    return authors
+
+def extract_lawyers(texts: pd.Series, anchors: pd.Series) -> pd.Series:
+    """⚖️ Advogados por seção ('NOME (OAB 123/SP)'), na ordem dos padrões (caixa original)"""
+    texts = texts[_has_anchor(anchors, *LAWYER_ANCHORS)]
+    parts = []
+    for pattern in LAWYER_PATTERNS:
+        matches = texts.str.extractall(pattern.pattern)
+        if matches.empty:
+            continue
+        parts.append((matches[0].str.strip() + ' (OAB ' + matches[1] + ')').droplevel('match'))
+
+    if not parts:
+        return pd.Series([[] for _ in anchors.index], index=anchors.index, dtype=object)
+
+    # Ordem estável: primeiro todos os do 1º padrão de cada seção, depois os do 2º
+    return _group_lists(pd.concat(parts).sort_index(kind='stable'), anchors.index)
+
+def _optional(value):
+    """∅ NaN/NA do pandas → None (PublicationData recalcula valores ausentes)"""
+    return None if value is None or pd.isna(value) else value
+
+def parse_sections_batch(
+    sections: Sequence[str],
+    source_urls: Sequence[Optional[str]],
+    publication_dates: Sequence,
+    execution_id: Optional[int] = None,
+    anchors: Optional[Sequence[AnchorHits]] = None,
+    budget: Optional[ParseBudget] = None
+) -> List[Optional[PublicationData]]:
+    """🐼 Extrair publicações de várias seções de uma vez (None onde não há processo)
+
+    Cada campo é extraído por uma chamada `str.extract`/`str.findall` sobre a
+    coluna inteira; só a criação dos PublicationData é feita linha a linha.
+    `anchors` reaproveita a varredura já feita de cada seção. `budget` vale
+    para o lote inteiro: uma chamada vetorizada não pode ser interrompida,
+    então o prazo é verificado entre um padrão e outro (seções muito longas
+    devem ir para o parser por seção, que varre em blocos).
+    """
+    if not sections:
+        return []
+
+    budget = budget or ParseBudget(0)
+    frame = pd.DataFrame({
+        'text': list(sections),
+        'source_url': list(source_urls),
+        'publication_date': list(publication_dates),
+        'anchors': list(anchors) if anchors is not None else [scan_anchors(section) for section in sections]
+    })
+    texts = frame['text']
+
+    frame['process_number'] = texts.str.extract(PROCESS_NUMBER_PATTERN.pattern, expand=False)
+    parsed = frame[frame['process_number'].notna()].copy()
+    texts, hits = parsed['text'], parsed['anchors']
+
+    parsed['authors'] = extract_authors(texts, hits, budget)
+    parsed['lawyers'] = extract_lawyers(texts, hits)
+    parsed['main_value'] = parse_brazilian_numbers(_first_match(texts, hits, MAIN_VALUE_PATTERNS, budget))
+    parsed['legal_fees'] = parse_brazilian_numbers(_first_match(texts, hits, FEES_PATTERNS, budget))
+
+    no_interest = _has_anchor(hits, 'juros') & hits.map(lambda anchor_hits: NO_INTEREST_MARKER in anchor_hits.folded)
+    interest = parse_brazilian_numbers(_first_match(texts[~no_interest], hits[~no_interest], INTEREST_PATTERNS, budget))
+    interest = interest.reindex(texts.index)
+    interest[no_interest] = Decimal('0.00')
+    parsed['interest_value'] = interest
+
+    publications: List[Optional[PublicationData]] = [None] * len(frame)
+    for row in parsed.itertuples():
+        try:
+            publications[row.Index] = PublicationData(
+                process_number=row.process_number,
+                authors=row.authors,
+                lawyers=row.lawyers,
+                full_content=row.text,
+                source_url=_optional(row.source_url),
+                publication_date=_optional(row.publication_date),
+                availability_date=_optional(row.publication_date),
+                main_value=_optional(row.main_value),
+                interest_value=_optional(row.interest_value),
+                legal_fees=_optional(row.legal_fees),
+                scraper_execution_id=execution_id,
+                anchors=row.anchors,
+                budget=budget
+            )
+        except Exception as e:
+            logger.error(f"Erro ao extrair dados da publicação: {e}")
+
+    logger.debug("Batch parsed sections", sections=len(frame), publications=len(parsed))
+    return publications
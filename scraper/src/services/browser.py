@@ -0,0 +1,101 @@
+"""🌐 Adaptador assíncrono para o Selenium WebDriver"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+import structlog
+
+from ..config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+class AsyncBrowser:
+    """🌐 Executa comandos do WebDriver numa thread dedicada
+
+    Toda chamada ao Chrome (navegação, esperas, leitura do DOM) roda num
+    executor de uma única thread - o WebDriver não é thread-safe - enquanto o
+    event loop continua livre para downloads, extração e uploads.
+    """
+
+    def __init__(self):
+        self.driver: Optional[webdriver.Chrome] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webdriver")
+        
+        # Tempo de cada navegação (carga de página / troca de página de resultados)
+        self.navigation_times: List[float] = []
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """▶️ Executar chamada bloqueante na thread do navegador"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def start(self):
+        """🚗 Iniciar Chrome (Selenium Manager baixa o ChromeDriver automaticamente)"""
+        self.driver = await self.run(self._create_driver)
+
+    @staticmethod
+    def _create_driver() -> webdriver.Chrome:
+        options = settings.get_browser_options()
+
+        driver = webdriver.Chrome(options=options)
+        driver.implicitly_wait(settings.implicit_wait)
+        driver.set_page_load_timeout(settings.browser_timeout)
+
+        if settings.browser_performance_profile:
+            # Bloquear imagens, CSS, fontes e trackers antes de qualquer request
+            blocked = settings.get_blocked_url_patterns()
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+            logger.info("Browser performance profile enabled", blocked_patterns=len(blocked))
+
+        return driver
+
+    def record_navigation(self, label: str, started_at: float) -> float:
+        """⏱️ Registrar duração de uma navegação"""
+        elapsed = time.perf_counter() - started_at
+        self.navigation_times.append(elapsed)
+        logger.debug("Navigation timing", navigation=label, seconds=round(elapsed, 3))
+        return elapsed
+
+    async def get(self, url: str):
+        """🌐 Navegar para URL"""
+        await self.run(self.driver.get, url)
+
+    async def wait_until(self, condition: Callable, timeout: Optional[float] = None) -> Any:
+        """⏳ WebDriverWait.until sem bloquear o event loop"""
+        wait = WebDriverWait(self.driver, timeout or settings.browser_timeout)
+        return await self.run(wait.until, condition)
+
+    async def find_element(self, by: str, value: str) -> WebElement:
+        """🔍 Buscar elemento"""
+        return await self.run(self.driver.find_element, by, value)
+
+    async def find_elements(self, by: str, value: str) -> List[WebElement]:
+        """🔍 Buscar elementos"""
+        return await self.run(self.driver.find_elements, by, value)
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """📜 Executar JavaScript na página"""
+        return await self.run(self.driver.execute_script, script, *args)
+
+    async def page_source(self) -> str:
+        """📄 HTML atual da página"""
+        return await self.run(lambda: self.driver.page_source)
+
+    async def quit(self):
+        """🔒 Fechar navegador e liberar a thread"""
+        try:
+            if self.driver:
+                await self.run(self.driver.quit)
+        finally:
+            self.driver = None
+            self._executor.shutdown(wait=False)
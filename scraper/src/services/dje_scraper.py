@@ -1,11 +1,14 @@
 """🕷️ Scraper DJE São Paulo"""
 
 import asyncio
+import contextvars
 import time
 import re
 import io
+import hashlib
+from collections import OrderedDict
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Awaitable, Set, Tuple, AsyncIterator
 from urllib.parse import urljoin, parse_qs, urlparse
 
 from selenium import webdriver
@@ -24,8 +27,8 @@ from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import structlog
 import httpx
+from asyncio_throttle import Throttler
 import pdfplumber
-import pytesseract
 from PIL import Image
 from decimal import Decimal
 
@@ -33,22 +36,127 @@ import html
 from urllib.parse import urlparse, urlunparse
 
 from ..config.settings import settings
-from ..models.publication import PublicationData, ScrapingResult
+from ..models.publication import PublicationData, ScrapingResult, ExecutionCheckpoint, ValidationReason
+from ..models.diary_page import DiaryPageRef, DiaryPageText
+from ..models.search_query import SearchQuery
 from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.page_ledger import PageLedger
+from ..utils.name_cache import get_name_cache
+from ..utils.async_iter import iterate_in_thread
+from ..utils.shm_pool import SharedBuffer, SharedBufferPool
+from ..utils.keyword_anchors import AnchorHits, scan_anchors
+from ..utils.memory_governor import MemoryGovernor, publications_size, text_size
+from ..utils.regex_budget import ParseBudget, SCAN_CHUNK_CHARS
+from ..utils.section_patterns import (
+    AUTHOR_ANCHORS, AUTHOR_FALLBACK_PATTERNS, AUTHOR_PATTERN, FEES_PATTERNS, INTEREST_PATTERNS,
+    LAWYER_ANCHORS, LAWYER_PATTERNS, MAIN_VALUE_PATTERNS, NO_INTEREST_MARKER, PROCESS_NUMBER_PATTERN
+)
+from .pdf_text import (
+    FastTextLayer, PdfSource, as_buffer, count_pages, iter_page_texts, iter_pages_parallel,
+    fast_text_layer, may_contain_keywords, shutdown_extraction_pool
+)
+from .browser import AsyncBrowser
+from .query_planner import plan_search_queries, scrape_mode
+from .batch_parser import parse_sections_batch
 
 
 logger = structlog.get_logger(__name__)
 
+# Callback chamado ao concluir cada página de resultados: (número da página, publicações válidas)
+PageCompleteCallback = Callable[[int, List[PublicationData]], Awaitable[None]]
+
+# Navegador da sessão de busca em andamento (cada sub-consulta paralela usa o seu)
+_session_browser: contextvars.ContextVar[Optional[AsyncBrowser]] = contextvars.ContextVar(
+   "dje_session_browser", default=None
+)
+
+# Início de uma publicação no texto do diário
+PROCESS_START_PATTERN = re.compile(r'Processo \d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}')
+
+# Assinatura dos resultados exibidos (primeiro link de PDF), usada para detectar troca de página
+RESULTS_SIGNATURE_SCRIPT = """
+var container = document.getElementById('divResultadosInferior');
+if (!container) { return null; }
+var link = container.querySelector('a[onclick*="popup"]');
+return link ? link.getAttribute('onclick') : container.innerText.slice(0, 500);
+"""
+
+# Linhas de cabeçalho repetidas no topo de cada página do DJE
+PAGE_HEADER_PATTERN = re.compile(
+   r'^\s*(?:Publicação Oficial do Tribunal de Justiça|Disponibilização:|'
+   r'Diário da Justiça Eletrônico|São Paulo, Ano [IVXLCDM]+).*$\n?',
+   re.MULTILINE
+)
+
 class DJEScraperError(Exception):
    """🚨 Erro do scraper DJE"""
    pass
 
+class SectionStream:
+   """🧵 Separador incremental de seções sobre páginas consecutivas
+   
+   Recebe páginas em ordem e devolve as seções já fechadas (o início da
+   publicação seguinte foi visto) que tocam alguma página de resultado. Entre
+   chamadas só a seção ainda aberta fica em memória.
+   """
+   
+   def __init__(self):
+      self._segments: List[Tuple[str, DiaryPageText]] = []
+      self._last_ref: Optional[DiaryPageRef] = None
+   
+   def _join(self) -> Tuple[str, List[Tuple[int, int, DiaryPageText]]]:
+      spans = []
+      offset = 0
+      for body, page in self._segments:
+         spans.append((offset, offset + len(body), page))
+         offset += len(body)
+      return "".join(body for body, _ in self._segments), spans
+   
+   def feed(self, page: DiaryPageText) -> List[Tuple[str, DiaryPageText]]:
+      """➕ Adicionar a próxima página; retorna (seção, página de início) das seções fechadas"""
+      sections = []
+      if self._last_ref is not None and not page.ref.follows(self._last_ref):
+         sections.extend(self.flush())
+      
+      self._last_ref = page.ref
+      self._segments.append((PAGE_HEADER_PATTERN.sub('', page.text) + "\n", page))
+      
+      stream, spans = self._join()
+      starts = [m.start() for m in PROCESS_START_PATTERN.finditer(stream)]
+      if not starts:
+         # Texto antes da primeira publicação do trecho não pertence a nenhuma seção
+         self._segments = []
+         return sections
+      
+      for start, end in zip(starts, starts[1:]):
+         touched = [page for (s, e, page) in spans if s < end and start < e]
+         if any(page.is_hit for page in touched):
+            sections.append((stream[start:end], touched[0]))
+      
+      # Seção aberta: da última publicação até o fim do texto recebido
+      last = starts[-1]
+      self._segments = [
+         (stream[max(s, last):e], page)
+         for (s, e, page) in spans
+         if e > last
+      ]
+      return sections
+   
+   def flush(self) -> List[Tuple[str, DiaryPageText]]:
+      """🔚 Fechar a seção aberta (fim do documento ou quebra de sequência)"""
+      stream, spans = self._join()
+      self._segments = []
+      self._last_ref = None
+      
+      if spans and any(page.is_hit for (_, _, page) in spans):
+         return [(stream, spans[0][2])]
+      return []
+
 class DJEScraper:
    """🕷️ Scraper do Diário da Justiça Eletrônico - COM DEBUG MELHORADO"""
    
    def __init__(self):
-       self.driver: Optional[webdriver.Chrome] = None
-       self.wait: Optional[WebDriverWait] = None
+       self._browser: Optional[AsyncBrowser] = None
        self.current_execution_id: Optional[int] = None
        self.base_url = settings.dje_base_url
        self.search_url = settings.dje_search_url
@@ -61,6 +169,24 @@ class DJEScraper:
            }
        )
        
+       # Segmentos de memória compartilhada reciclados entre downloads de PDF
+       self.pdf_buffer_pool: Optional[SharedBufferPool] = None
+       if settings.pdf_shared_buffers:
+           self.pdf_buffer_pool = SharedBufferPool(
+               segment_size=settings.pdf_max_size_mb * 1024 * 1024,
+               max_idle=settings.pdf_shared_buffer_pool_size
+           )
+       
+       # Orçamento de bytes em trânsito (downloads, texto, cache de páginas, publicações aguardando upload)
+       self.memory = MemoryGovernor(settings.memory_budget_mb * 1024 * 1024)
+       self.memory.add_reclaimer("page_cache", self._evict_page_texts)
+       
+       # Limite de downloads compartilhado por todas as sessões/perfis
+       self.download_throttler = Throttler(
+           rate_limit=settings.dje_rate_limit,
+           period=settings.dje_rate_period
+       )
+       
        # Circuit breaker para proteção
        self.circuit_breaker = CircuitBreaker(
            failure_threshold=3,
@@ -68,20 +194,42 @@ class DJEScraper:
            expected_exception=WebDriverException
        )
        
+       # Estado por execução: cada página física do diário é baixada/parseada uma única vez
+       self._reset_run_state()
+       
        logger.info("DJE Scraper initialized (PDF STRATEGY - DEBUG MODE)")
    
+   def _reset_run_state(self):
+       """🔄 Zerar deduplicação global de páginas/seções (início de cada execução)"""
+       self._seen_pages: Set[DiaryPageRef] = set()
+       if hasattr(self, "_page_texts"):
+           self.memory.release("page_cache", self.memory.held_by("page_cache"))
+       self._page_texts: "OrderedDict[DiaryPageRef, DiaryPageText]" = OrderedDict()
+       self._emitted_sections: Set[bytes] = set()
+       self._duplicate_sections_skipped = 0
+       self._unique_sections = 0
+       self._duplicate_hits_skipped = 0
+       self._result_pages_completed = 0
+       self._prefilter_skipped = 0
+       self._sections_over_budget = 0
+   
+   @property
+   def browser(self) -> Optional[AsyncBrowser]:
+       """🌐 Navegador da sessão atual (sub-consultas paralelas usam o seu próprio)"""
+       return _session_browser.get() or self._browser
+   
+   @browser.setter
+   def browser(self, value: Optional[AsyncBrowser]):
+       self._browser = value
+   
    async def setup_driver(self):
        """🚗 Configurar driver do Selenium usando Selenium Manager nativo"""
        try:
-           options = settings.get_browser_options()
-       
            logger.info("Starting Chrome browser with Selenium Manager", headless=settings.headless_browser)
        
-           # Selenium Manager automaticamente baixa e configura o ChromeDriver
-           self.driver = webdriver.Chrome(options=options)
-           self.driver.implicitly_wait(settings.implicit_wait)
-           self.driver.set_page_load_timeout(settings.browser_timeout)
-           self.wait = WebDriverWait(self.driver, settings.browser_timeout)
+           # Comandos do WebDriver rodam numa thread dedicada (não bloqueiam o event loop)
+           self.browser = AsyncBrowser()
+           await self.browser.start()
        
            logger.info("Chrome driver setup completed successfully")
        
@@ -95,12 +243,14 @@ class DJEScraper:
            with self.circuit_breaker:
                logger.info("Navigating to DJE advanced search", url=self.search_url)
                
-               self.driver.get(self.search_url)
+               started_at = time.perf_counter()
+               await self.browser.get(self.search_url)
                
                # Wait for form to load
-               self.wait.until(
+               await self.browser.wait_until(
                    EC.presence_of_element_located((By.NAME, "consultaAvancadaForm"))
                )
+               self.browser.record_navigation("search page", started_at)
                
                logger.info("Successfully navigated to DJE search page")
                return True
@@ -109,53 +259,55 @@ class DJEScraper:
            logger.error("Failed to navigate to search page", error=str(e))
            return False
    
-   async def configure_search_parameters(self, target_date: date) -> bool:
-       """⚙️ Configurar parâmetros de busca CORRIGIDOS"""
+   async def configure_search_parameters(
+       self,
+       target_date: date,
+       caderno: Optional[str] = None,
+       search_terms: Optional[str] = None
+   ) -> bool:
+       """⚙️ Configurar parâmetros de busca CORRIGIDOS (caderno/termos default das settings)"""
+       caderno = caderno or settings.target_caderno
+       search_terms = search_terms or settings.search_terms
+       
        try:
            logger.info(
                "Configuring search parameters",
                target_date=target_date.isoformat(),
-               search_terms=settings.search_terms,
-               target_caderno=settings.target_caderno
+               search_terms=search_terms,
+               target_caderno=caderno
            )
            
            # 1. Configurar datas
            date_str = target_date.strftime("%d/%m/%Y")
            
            # Data início
-           dt_inicio = self.wait.until(
+           dt_inicio = await self.browser.wait_until(
                EC.presence_of_element_located((By.NAME, "dadosConsulta.dtInicio"))
            )
-           self.driver.execute_script("arguments[0].removeAttribute('readonly')", dt_inicio)
-           dt_inicio.clear()
-           dt_inicio.send_keys(date_str)
+           await self.browser.run(self._fill_input, dt_inicio, date_str)
            
            # Data fim (mesmo dia)
-           dt_fim = self.driver.find_element(By.NAME, "dadosConsulta.dtFim")
-           self.driver.execute_script("arguments[0].removeAttribute('readonly')", dt_fim)
-           dt_fim.clear()
-           dt_fim.send_keys(date_str)
+           dt_fim = await self.browser.find_element(By.NAME, "dadosConsulta.dtFim")
+           await self.browser.run(self._fill_input, dt_fim, date_str)
            
            await asyncio.sleep(1)
            
            # 2. Selecionar Caderno CORRETO (value="12" = Caderno 3 - Parte I)
-           caderno_select = Select(
-               self.driver.find_element(By.NAME, "dadosConsulta.cdCaderno")
-           )
-           caderno_select.select_by_value(settings.target_caderno)  # "12"
+           caderno_element = await self.browser.find_element(By.NAME, "dadosConsulta.cdCaderno")
+           # Select() já consulta o elemento (tag_name/atributos): construir na thread do navegador
+           await self.browser.run(lambda: Select(caderno_element).select_by_value(caderno))  # "12"
            
            await asyncio.sleep(1)
            
            # 3. Configurar palavras-chave ESPECÍFICAS
-           palavras_input = self.driver.find_element(By.NAME, "dadosConsulta.pesquisaLivre")
-           palavras_input.clear()
-           palavras_input.send_keys(settings.search_terms)  # "RPV" E "pagamento pelo INSS"
+           palavras_input = await self.browser.find_element(By.NAME, "dadosConsulta.pesquisaLivre")
+           await self.browser.run(self._fill_input, palavras_input, search_terms)  # "RPV" E "pagamento pelo INSS"
            
            logger.info(
                "Search parameters configured successfully",
                date=date_str,
-               caderno=settings.target_caderno,
-               search_query=settings.search_terms
+               caderno=caderno,
+               search_query=search_terms
            )
            
            return True
@@ -164,28 +316,36 @@ class DJEScraper:
            logger.error("Failed to configure search parameters", error=str(e))
            return False
    
+   def _fill_input(self, element, value: str):
+       """⌨️ Preencher campo (remove readonly dos campos de data) - roda na thread do navegador"""
+       element.parent.execute_script("arguments[0].removeAttribute('readonly')", element)
+       element.clear()
+       element.send_keys(value)
+   
    async def execute_search(self) -> bool:
        """🔍 Executar busca"""
        try:
            logger.info("Executing search")
            
            # Encontrar e clicar no botão "Pesquisar"
-           search_button = self.wait.until(
+           search_button = await self.browser.wait_until(
                EC.element_to_be_clickable((By.XPATH, "//input[@type='submit'][@value='Pesquisar']"))
            )
            
-           search_button.click()
+           started_at = time.perf_counter()
+           await self.browser.run(search_button.click)
            
            # Aguardar resultados carregarem
            try:
                # Wait for results container or error message
-               self.wait.until(
+               await self.browser.wait_until(
                    EC.any_of(
                        EC.presence_of_element_located((By.ID, "divResultadosInferior")),
                        EC.presence_of_element_located((By.CLASS_NAME, "erro")),
                        EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "Nenhum resultado")
                    )
                )
+               self.browser.record_navigation("search", started_at)
                
                logger.info("Search executed successfully")
                return True
@@ -198,54 +358,121 @@ class DJEScraper:
            logger.error("Failed to execute search", error=str(e))
            return False
    
-   async def extract_publications_from_results(self) -> List[PublicationData]:
-       """📄 Extrair publicações dos PDFs individuais - COM DEBUG MELHORADO"""
+   async def _process_pdf_links(
+       self,
+       pdf_links: List[str],
+       checkpoint: Optional[ExecutionCheckpoint] = None,
+       page_ledger: Optional[PageLedger] = None,
+       processed: Optional[Dict[str, Optional[str]]] = None
+   ) -> List[PublicationData]:
+       """📥 Baixar, extrair e parsear os PDFs de uma página de resultados
+       
+       Os PDFs processados são devolvidos em `processed` (chave → hash) para
+       entrarem no checkpoint/ledger apenas quando a página for concluída.
+       """
        publications = []
+       text_bytes = 0
        
        try:
-           # 1. Obter links dos PDFs da página de resultados
-           pdf_links = await self._extract_pdf_links_from_search_results()
-           
            logger.info(f"Found {len(pdf_links)} PDF links to process")
            
-           # 2. Processar cada PDF individualmente
+           # 2. Baixar e extrair texto de cada PDF
+           pages: List[DiaryPageText] = []
            for i, pdf_url in enumerate(pdf_links, 1):
+               pdf_content = None
                try:
-                   logger.info(f"Processing PDF {i}/{len(pdf_links)}: {pdf_url}")
+                   ref = DiaryPageRef.from_url(pdf_url)
+                   if ref and ref in self._seen_pages:
+                       self._duplicate_hits_skipped += 1
+                       logger.debug(f"PDF {i} já processado nesta execução, pulando: {ref.key}")
+                       continue
                    
-                   # Baixar PDF
-                   pdf_content = await self._download_pdf(pdf_url)
-                   if not pdf_content:
+                   pdf_key = self._pdf_page_key(pdf_url)
+                   if checkpoint and pdf_key in checkpoint.processed_pdf_keys:
+                       logger.debug(f"PDF {i} já processado em execução anterior, pulando: {pdf_key}")
                        continue
                    
-                   # Extrair texto do PDF
-                   pdf_text = await self._extract_text_from_pdf(pdf_content)
-                   if not pdf_text:
+                   if page_ledger and page_ledger.should_skip(pdf_key):
+                       logger.debug(f"PDF {i} já processado hoje (incremental), pulando: {pdf_key}")
                        continue
                    
-                                    
-                   # REMOVER validação no nível do PDF - processar sempre
-                   logger.info(f"PDF {i}: Processando seções independente da validação geral")
+                   logger.info(f"Processing PDF {i}/{len(pdf_links)}: {pdf_url}")
                    
-                   # Extrair publicações do texto (pode ter múltiplas)
-                   page_publications = await self._extract_publications_from_text(pdf_text, pdf_url)
+                   # Reservar a página: outra sessão paralela não baixa o mesmo PDF
+                   if ref:
+                       self._seen_pages.add(ref)
                    
-                   for pub in page_publications:
-                       if pub:
-                           publications.append(pub)
-                           logger.info(f"Publicação extraída: {pub.process_number}")
+                   # Página já baixada como vizinha para costura: reaproveitar texto
+                   cached_page = self._page_texts.get(ref) if ref else None
+                   downloaded = cached_page is None
+                   
+                   if cached_page:
+                       pdf_text, content_hash = cached_page.text, cached_page.content_hash
+                   else:
+                       # Baixar PDF
+                       pdf_content = await self._download_pdf(pdf_url)
+                       if not pdf_content:
+                           self._seen_pages.discard(ref)
+                           continue
+                       content_hash = PageLedger.content_hash(as_buffer(pdf_content))
+                   
+                   if page_ledger and page_ledger.is_unchanged(pdf_key, content_hash):
+                       logger.debug(f"PDF {i} sem alterações desde a última execução: {pdf_key}")
+                       continue
+                   
+                   is_hit = True
+                   if not cached_page:
+                       layer = await asyncio.to_thread(fast_text_layer, pdf_content) if settings.keyword_prefilter else None
+                       raw_text = layer.raw_text if layer else None
+                       
+                       if raw_text and not may_contain_keywords(raw_text):
+                           # Nenhuma palavra-chave no texto nativo: sem layout/OCR/parse, só contexto de costura
+                           logger.debug(f"PDF {i} sem palavras-chave (prefiltro): {pdf_key}")
+                           self._prefilter_skipped += 1
+                           pdf_text, is_hit = raw_text, False
+                       else:
+                           # Extrair texto do PDF (reaproveitando o texto nativo do prefiltro)
+                           pdf_text = await self._extract_text_from_pdf(pdf_content, layer)
+                           if not pdf_text:
+                               self._seen_pages.discard(ref)
+                               continue
+                   
+                   page = DiaryPageText(ref=ref, url=pdf_url, text=pdf_text, is_hit=is_hit, content_hash=content_hash)
+                   if is_hit or ref:
+                       pages.append(page)
+                   if ref:
+                       # Contabilizado uma única vez, no cache de páginas
+                       self._cache_page_text(page)
+                   elif is_hit:
+                       # Texto sem referência de página: só aguarda o parse desta página de resultados
+                       text_bytes += text_size(pdf_text)
+                       self.memory.track("text", text_size(pdf_text))
+                   
+                   # Só é persistido quando a página for concluída (ver _complete_result_page)
+                   if processed is not None:
+                       processed[pdf_key] = content_hash
                    
                    # Rate limiting
-                   await asyncio.sleep(settings.dje_delay_between_requests)
+                   if downloaded:
+                       await asyncio.sleep(settings.dje_delay_between_requests)
                    
                except Exception as e:
+                   if ref and ref not in self._page_texts:
+                       self._seen_pages.discard(ref)
                    logger.warning(f"Erro ao processar PDF {i}: {e}")
                    continue
+               finally:
+                   self._release_pdf(pdf_content)
+           
+           # 3. Extrair publicações (seções que atravessam páginas são costuradas antes)
+           publications = await self._extract_publications_from_pages(pages)
            
            logger.info(f"Total de publicações válidas extraídas: {len(publications)}")
            
        except Exception as e:
            logger.error(f"Erro na extração geral: {e}")
+       finally:
+           self.memory.release("text", text_bytes)
        
        return publications
    
@@ -259,8 +486,8 @@ class DJEScraper:
                f"🔍 DEBUG PDF {pdf_index} - Texto extraído",
                text_length=text_length,
                text_preview=text_preview,
-               has_rpv_term=bool(re.search(r'\bRPV\b', text, re.IGNORECASE)) if text else False,
-               has_inss_payment=bool(re.search(r'pagamento pelo INSS', text, re.IGNORECASE)) if text else False,
+               has_rpv_term=scan_anchors(text).has('rpv'),
+               has_inss_payment=scan_anchors(text).has('inss_payment'),
                encoding_info=type(text).__name__
            )
            
@@ -282,13 +509,11 @@ class DJEScraper:
 
        try:
            # Verificar se há resultados
-           try:
-               self.driver.find_element(By.ID, "divResultadosInferior")
-           except NoSuchElementException:
+           if not await self.browser.find_elements(By.ID, "divResultadosInferior"):
                logger.info("Nenhum container de resultados encontrado")
                return []
 
-           page_source = self.driver.page_source
+           page_source = await self.browser.page_source()
            soup = BeautifulSoup(page_source, 'html.parser')
 
            # Procurar links com popup() - padrão do DJE
@@ -306,51 +531,63 @@ class DJEScraper:
                    full_url = urljoin(self.base_url, normalized_url)
                    links.append(full_url)
 
-           # Remover duplicatas mantendo ordem
+           # Agrupar hits por página física (vários hits apontam para o mesmo nuSeqpagina)
            unique_links = []
+           seen_pages = set()
            for link in links:
-               if link not in unique_links:
+               page_id = DiaryPageRef.from_url(link) or link
+               if page_id not in seen_pages:
+                   seen_pages.add(page_id)
                    unique_links.append(link)
 
-           logger.info(f"Extracted {len(unique_links)} unique PDF links")
+           logger.info(f"Extracted {len(unique_links)} unique PDF pages from {len(links)} hits")
            return unique_links
 
        except Exception as e:
            logger.error(f"Erro ao extrair links dos PDFs: {e}")
            return []
   
-   async def _download_pdf(self, pdf_url: str) -> Optional[bytes]:
-       """📥 Baixar PDF individual"""
+   @staticmethod
+   def _pdf_page_key(pdf_url: str) -> str:
+       """🔑 Chave estável da página do diário (cdVolume:nuDiario:cdCaderno:nuSeqpagina)"""
+       ref = DiaryPageRef.from_url(pdf_url)
+       return ref.key if ref else pdf_url
+  
+   async def _download_pdf(self, pdf_url: str) -> Optional[PdfSource]:
+       """📥 Baixar PDF individual
+       
+       O corpo é gravado direto num segmento do pool de memória compartilhada
+       (workers de extração o abrem pelo nome, sem cópia). Devolva o segmento
+       com `_release_pdf` após o uso.
+       """
        try:
            # Construir URL direta do PDF baseada na URL de consulta
            if "consultaSimples.do" in pdf_url:
-               # Extrair parâmetros da URL de consulta
-               from urllib.parse import urlparse, parse_qs
-               parsed = urlparse(pdf_url)
-               params = parse_qs(parsed.query)
-               
-               # Construir URL direta do PDF
-               pdf_direct_url = f"https://dje.tjsp.jus.br/cdje/getPaginaDoDiario.do?cdVolume={params['cdVolume'][0]}&nuDiario={params['nuDiario'][0]}&cdCaderno={params['cdCaderno'][0]}&nuSeqpagina={params['nuSeqpagina'][0]}&uuidCaptcha="
+               # Construir URL direta do PDF a partir dos parâmetros da consulta
+               pdf_direct_url = DiaryPageRef.from_url(pdf_url).pdf_url(self.base_url)
                
                logger.debug(f"Converted to direct PDF URL: {pdf_direct_url}")
                pdf_url = pdf_direct_url
            
-           response = await self.http_client.get(pdf_url)
-           response.raise_for_status()
-           
-           # Verificar tamanho do arquivo
-           content_length = len(response.content)
+           # Backpressure: com o orçamento de memória esgotado, esperar downloads em andamento
+           await self.memory.wait_for_capacity()
+           await self.download_throttler.acquire()
            max_size = settings.pdf_max_size_mb * 1024 * 1024
            
-           if content_length > max_size:
-               logger.warning(f"PDF muito grande ({content_length / 1024 / 1024:.1f}MB), pulando")
+           async with self.http_client.stream("GET", pdf_url) as response:
+               response.raise_for_status()
+               content_type = response.headers.get('content-type', '').lower()
+               content = await self._read_pdf_body(response, max_size)
+           
+           if content is None:
                return None
            
            # Verificar se é PDF
-           content_type = response.headers.get('content-type', '').lower()
-           if 'pdf' in content_type or content_length > 1000:  # PDFs são geralmente maiores que 1KB
-               return response.content
+           content_length = len(content)
+           if content_length and ('pdf' in content_type or content_length > 1000):  # PDFs são geralmente maiores que 1KB
+               return content
            
+           self._release_pdf(content)
            logger.warning(f"Response não é PDF: content-type={content_type}, size={content_length}")
            return None
            
@@ -358,79 +595,366 @@ class DJEScraper:
            logger.error(f"Erro ao baixar PDF {pdf_url}: {e}")
            return None
   
-   async def _extract_text_from_pdf(self, pdf_content: bytes) -> Optional[str]:
-       """📄 Extrair texto do PDF com fallback OCR - COM DEBUG"""
+   async def _read_pdf_body(self, response: httpx.Response, max_size: int) -> Optional[PdfSource]:
+       """📥 Gravar o corpo da resposta num segmento compartilhado (bytes se não houver segmento)"""
+       shared = self.pdf_buffer_pool.acquire() if self.pdf_buffer_pool else None
+       fallback = bytearray()
+       received = 0
+       
        try:
-           # Tentar extrair como PDF texto primeiro
-           try:
-               with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                   text = ""
-                   for page_num, page in enumerate(pdf.pages):
-                       page_text = page.extract_text()
-                       if page_text:
-                           text += page_text + "\n"
-                   
-                   if text and len(text.strip()) > 100:
-                       return text
-                       
-           except Exception as e:
-               logger.debug(f"PDF text extraction failed: {e}, trying OCR")
+           async for chunk in response.aiter_bytes():
+               received += len(chunk)
+               self.memory.track("downloads", len(chunk))
+               
+               if shared is not None:
+                   try:
+                       shared.write(chunk)
+                       continue
+                   except BufferError as e:
+                       # Segmento cheio ou /dev/shm sem espaço: continuar na memória do processo
+                       logger.debug(f"Shared PDF buffer unavailable, using process memory: {e}")
+                       fallback.extend(shared.view())
+                       shared.release()
+                       shared = None
+               
+               fallback.extend(chunk)
+               if len(fallback) > max_size:
+                   logger.warning(f"PDF muito grande (> {settings.pdf_max_size_mb}MB), pulando")
+                   self.memory.release("downloads", received)
+                   return None
+       except BaseException:
+           self.memory.release("downloads", received - (len(shared) if shared is not None else 0))
+           self._release_pdf(shared)
+           raise
+       
+       return shared if shared is not None else bytes(fallback)
+   
+   def _release_pdf(self, pdf_content: Optional[PdfSource]):
+       """↩️ Liberar um PDF baixado: bytes no orçamento de memória e segmento do pool"""
+       if pdf_content is None:
+           return
+       
+       self.memory.release("downloads", len(pdf_content))
+       if isinstance(pdf_content, SharedBuffer):
+           pdf_content.release()
+   
+   async def _iter_pdf_pages(
+       self,
+       pdf_content: PdfSource,
+       layer: Optional[FastTextLayer] = None
+   ) -> AsyncIterator[str]:
+       """🌊 Páginas do PDF em ordem, extraídas fora do event loop
+       
+       Backend rápido → pdfplumber → OCR rodam numa thread (ou nos processos
+       de extração, para documentos com várias páginas pendentes) e cada
+       página é entregue assim que fica pronta. Com `layer` (texto nativo do
+       prefiltro), só as páginas que ele não resolveu passam pelos fallbacks.
+       """
+       workers = settings.pdf_extraction_workers
+       
+       def pages():
+           pending = len(layer.missing) if layer else count_pages(pdf_content)
+           if workers > 1 and pending >= settings.pdf_parallel_min_pages:
+               return iter_pages_parallel(pdf_content, workers, prefilter=False, layer=layer)
+           return iter_page_texts(pdf_content, layer=layer)
+       
+       async for page_number, page_text, _ in iterate_in_thread(pages):
+           logger.debug(f"Page {page_number}: {len(page_text)} chars")
+           yield page_text
+   
+   async def _extract_text_from_pdf(
+       self,
+       pdf_content: PdfSource,
+       layer: Optional[FastTextLayer] = None
+   ) -> Optional[str]:
+       """📄 Texto de uma página do diário (PDF de resultado ou vizinha para costura)
+       
+       A página do diário é a unidade que o SectionStream costura: as páginas
+       do PDF chegam de `_iter_pdf_pages` e são unidas uma única vez, sem
+       concatenação repetida de strings. Cadernos inteiros não passam por
+       aqui - suas páginas alimentam o SectionStream uma a uma.
+       """
+       try:
+           page_texts = [page_text async for page_text in self._iter_pdf_pages(pdf_content, layer)]
            
-           # Fallback: OCR se o texto for insuficiente
-           try:
-               logger.debug("Attempting OCR extraction...")
-               with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                   text = ""
-                   for page_num, page in enumerate(pdf.pages):
-                       try:
-                           # Converter página em imagem
-                           img = page.to_image(resolution=300)
-                           
-                           # Aplicar OCR
-                           page_text = pytesseract.image_to_string(
-                               img.original, 
-                               lang=settings.ocr_language,
-                               config=settings.ocr_config
-                           )
-                           text += page_text + "\n"
-                           logger.debug(f"OCR page {page_num}: {len(page_text)} chars")
-                           
-                       except Exception as e:
-                           logger.warning(f"OCR failed for page {page_num}: {e}")
-                           continue
-                   
-                   logger.debug(f"🔍 OCR extraction: {len(text)} total chars extracted")
-                   
-                   if text and len(text.strip()) > 50:
-                       logger.debug("OCR text extracted successfully")
-                       return text
-                   else:
-                       logger.warning(f"OCR text too short: {len(text.strip())} chars")
-                       
-           except Exception as e:
-               logger.warning(f"OCR extraction failed: {e}")
+           text = "\n".join(page_texts)
+           if len(text.strip()) > 50:
+               return text
            
+           logger.warning(f"Extracted text too short: {len(text.strip())} chars")
            return None
            
        except Exception as e:
            logger.error(f"Erro na extração de texto do PDF: {e}")
            return None
   
-   def _validate_required_keywords(self, text: str) -> bool:
+   def _validate_required_keywords(self, text: str, anchors: Optional[AnchorHits] = None) -> bool:
        """✅ Validar palavras-chave obrigatórias: RPV + pagamento pelo INSS - COM DEBUG"""
        try:
            if not text:
                return False
-               
-           has_rpv = bool(re.search(r'\bRPV\b', text, re.IGNORECASE))
-           has_inss_payment = bool(re.search(r'pagamento pelo INSS', text, re.IGNORECASE))
            
-           return has_rpv and has_inss_payment
+           anchors = anchors or scan_anchors(text)
+           return anchors.has('rpv') and anchors.has('inss_payment')
            
        except Exception as e:
            logger.error(f"Erro na validação de palavras-chave: {e}")
            return False
   
+   async def _extract_publications_from_pages(
+       self,
+       pages: List[DiaryPageText],
+       fetch_neighbours: bool = True
+   ) -> List[PublicationData]:
+       """🧵 Extrair publicações de um lote de páginas, costurando seções entre páginas"""
+       publications = []
+       
+       stitchable = [page for page in pages if page.ref is not None]
+       standalone = [page for page in pages if page.ref is None]
+       
+       if not settings.stitch_cross_page_sections:
+           standalone, stitchable = pages, []
+       
+       for page in standalone:
+           publications.extend(await self._extract_publications_from_text(page.text, page.url))
+       
+       if stitchable:
+           neighbours = await self._fetch_stitching_neighbours(stitchable) if fetch_neighbours else []
+           header_dates: Dict[DiaryPageRef, Optional[date]] = {}
+           
+           sections = self._stitch_page_sections(stitchable + neighbours)
+           publications.extend(await self._publications_from_sections(sections, header_dates))
+       
+       for pub in publications:
+           logger.info(f"Publicação extraída: {pub.process_number}")
+       
+       return publications
+   
+   async def _extract_publications_from_page_stream(
+       self,
+       pages: AsyncIterator[DiaryPageText]
+   ) -> List[PublicationData]:
+       """🌊 Extrair publicações à medida que as páginas chegam, sem esperar o documento inteiro
+       
+       Com BATCH_PARSING as seções do documento são acumuladas e parseadas
+       numa única passada vetorizada ao final.
+       """
+       publications = []
+       stream = SectionStream()
+       header_dates: Dict[DiaryPageRef, Optional[date]] = {}
+       pending: List[Tuple[str, DiaryPageText]] = []
+       
+       async for page in pages:
+           pending.extend(stream.feed(page))
+           if not settings.batch_parsing:
+               publications.extend(await self._publications_from_sections(pending, header_dates))
+               pending = []
+       
+       pending.extend(stream.flush())
+       publications.extend(await self._publications_from_sections(pending, header_dates))
+       
+       for pub in publications:
+           logger.info(f"Publicação extraída: {pub.process_number}")
+       
+       return publications
+   
+   async def _publications_from_sections(
+       self,
+       sections: List[Tuple[str, DiaryPageText]],
+       header_dates: Dict[DiaryPageRef, Optional[date]]
+   ) -> List[PublicationData]:
+       """📋 Publicações das seções costuradas (ignora repetidas e sem palavras-chave)"""
+       accepted = []
+       for section, origin in sections:
+           if not self._is_new_section(section):
+               continue
+           
+           # Uma varredura por seção serve à validação e aos extratores de campos
+           anchors = scan_anchors(section)
+           if self._validate_required_keywords(section, anchors):
+               accepted.append((section, origin, anchors))
+       
+       # Data do cabeçalho lida uma vez por página de origem
+       dates = []
+       for _, origin, _ in accepted:
+           if origin.ref not in header_dates:
+               header_dates[origin.ref] = self._extract_publication_date_from_header(origin.text)
+           dates.append(header_dates[origin.ref])
+       
+       # Chamadas vetorizadas não podem ser interrompidas: seções longas ficam com o
+       # parser por seção, que varre em blocos e respeita o prazo no meio da busca
+       batched = [
+           index for index, (section, _, _) in enumerate(accepted)
+           if len(section) <= SCAN_CHUNK_CHARS
+       ] if settings.batch_parsing and len(accepted) > 1 else []
+       
+       parsed: List[Optional[PublicationData]] = [None] * len(accepted)
+       if batched:
+           budget = ParseBudget.from_ms(settings.parse_time_budget_ms * len(batched))
+           publications = parse_sections_batch(
+               [accepted[index][0] for index in batched],
+               [accepted[index][1].url for index in batched],
+               [dates[index] for index in batched],
+               self.current_execution_id,
+               [accepted[index][2] for index in batched],
+               budget
+           )
+           for index, publication in zip(batched, publications):
+               parsed[index] = publication
+           
+           if budget.exhausted:
+               self._sections_over_budget += len(batched)
+               logger.warning(
+                   "Batch parse budget exhausted - remaining patterns skipped",
+                   sections=len(batched),
+                   elapsed_ms=round(budget.elapsed * 1000, 1)
+               )
+       
+       single = set(range(len(accepted))) - set(batched)
+       for index, ((section, origin, anchors), publication_date) in enumerate(zip(accepted, dates)):
+           if index in single:
+               parsed[index] = await self._extract_single_publication_from_text(
+                   section, origin.url, publication_date, anchors
+               )
+       
+       return [publication for publication in parsed if publication]
+   
+   def _is_new_section(self, section: str) -> bool:
+       """🆕 Seção ainda não processada nesta execução
+
+       Única camada de reaproveitamento: a mesma seção (páginas costuradas,
+       reimpressões, sub-consultas sobrepostas) é parseada uma vez por
+       execução e as repetições só são contadas.
+       """
+       key = self._section_key(section)
+       if key in self._emitted_sections:
+           self._duplicate_sections_skipped += 1
+           return False
+       self._emitted_sections.add(key)
+       self._unique_sections += 1
+       return True
+   
+   @staticmethod
+   def _strip_page_header(text: str) -> str:
+       """✂️ Remover cabeçalho repetido no topo da página"""
+       return PAGE_HEADER_PATTERN.sub('', text)
+   
+   @staticmethod
+   def _is_section_complete(section: str) -> bool:
+       """🔚 Publicações do DJE terminam na lista de advogados: '... - ADV: NOME (OAB 123/SP)'"""
+       tail = section.rstrip()[-600:]
+       return 'ADV:' in tail and tail.endswith(')')
+   
+   def _needs_next_page(self, page: DiaryPageText) -> bool:
+       """➡️ Última seção da página está aberta e ainda pode virar uma publicação relevante
+
+       Quase toda página termina com uma seção aberta: só vale baixar a
+       seguinte quando o trecho aberto já tem uma das palavras-chave
+       obrigatórias (a outra pode estar na continuação).
+       """
+       body = self._strip_page_header(page.text)
+       starts = [m.start() for m in PROCESS_START_PATTERN.finditer(body)]
+       if not starts:
+           return False
+       tail = body[starts[-1]:]
+       if self._is_section_complete(tail):
+           return False
+       return scan_anchors(tail).has('rpv', 'inss_payment')
+   
+   def _needs_previous_page(self, page: DiaryPageText) -> bool:
+       """⬅️ Página começa com a continuação de uma seção relevante da página anterior"""
+       body = self._strip_page_header(page.text)
+       first = PROCESS_START_PATTERN.search(body)
+       preamble = body[:first.start()] if first else body
+       if not preamble.strip():
+           return False
+       return scan_anchors(preamble).has('rpv', 'inss_payment')
+   
+   def _cache_page_text(self, page: DiaryPageText):
+       """🗃️ Guardar o texto da página para costura/reuso (contabilizado e despejável)"""
+       previous = self._page_texts.pop(page.ref, None)
+       if previous is not None:
+           self.memory.release("page_cache", text_size(previous.text))
+       self._page_texts[page.ref] = page
+       self.memory.track("page_cache", text_size(page.text))
+   
+   def _evict_page_texts(self, nbytes: int) -> int:
+       """♻️ Despejar as páginas guardadas há mais tempo até soltar `nbytes` (chamado pelo MemoryGovernor)
+       
+       Uma página despejada só volta a ser baixada se for pedida de novo como
+       vizinha; hits já processados continuam marcados em `_seen_pages`.
+       """
+       freed = 0
+       while self._page_texts and freed < nbytes:
+           _, page = self._page_texts.popitem(last=False)
+           freed += text_size(page.text)
+       return freed
+   
+   async def _fetch_stitching_neighbours(self, pages: List[DiaryPageText]) -> List[DiaryPageText]:
+       """📥 Baixar em paralelo as páginas vizinhas necessárias para completar seções"""
+       known = {page.ref for page in pages}
+       wanted: Set[DiaryPageRef] = set()
+       
+       for page in pages:
+           if self._needs_next_page(page):
+               wanted.add(page.ref.adjacent(1))
+           if page.ref.nu_seqpagina > 1 and self._needs_previous_page(page):
+               wanted.add(page.ref.adjacent(-1))
+       
+       wanted -= known
+       
+       # Páginas já baixadas nesta execução (hits anteriores ou vizinhas) entram só como contexto
+       reused = [
+           DiaryPageText(ref=ref, url=cached.url, text=cached.text, is_hit=False, content_hash=cached.content_hash)
+           for ref, cached in ((ref, self._page_texts.get(ref)) for ref in sorted(wanted))
+           if cached
+       ]
+       wanted -= {page.ref for page in reused}
+       if not wanted:
+           return reused
+       
+       logger.info(f"🧵 Baixando {len(wanted)} páginas vizinhas para costura de seções")
+       semaphore = asyncio.Semaphore(settings.concurrent_requests)
+       
+       async def fetch(ref: DiaryPageRef) -> Optional[DiaryPageText]:
+           async with semaphore:
+               url = ref.pdf_url(self.base_url)
+               content = await self._download_pdf(url)
+               if not content:
+                   return None
+               try:
+                   text = await self._extract_text_from_pdf(content)
+                   content_hash = PageLedger.content_hash(as_buffer(content))
+               finally:
+                   self._release_pdf(content)
+               if not text:
+                   return None
+               page = DiaryPageText(
+                   ref=ref, url=url, text=text, is_hit=False,
+                   content_hash=content_hash
+               )
+               self._cache_page_text(page)
+               return page
+       
+       fetched = await asyncio.gather(*(fetch(ref) for ref in sorted(wanted)), return_exceptions=True)
+       return reused + [page for page in fetched if isinstance(page, DiaryPageText)]
+   
+   def _stitch_page_sections(self, pages: List[DiaryPageText]) -> List[Tuple[str, DiaryPageText]]:
+       """🧵 Juntar páginas consecutivas e separar seções sobre o texto contínuo
+       
+       Retorna (texto da seção, página onde a seção começa) apenas para seções
+       que tocam alguma página de resultado da busca; páginas vizinhas servem só
+       de contexto. Cada seção aparece uma única vez, mesmo que atravesse páginas.
+       """
+       sections: List[Tuple[str, DiaryPageText]] = []
+       stream = SectionStream()
+       
+       for page in sorted({page.ref: page for page in pages}.values(), key=lambda p: p.ref):
+           sections.extend(stream.feed(page))
+       sections.extend(stream.flush())
+       
+       return sections
+   
    async def _extract_publications_from_text(self, text: str, source_url: str) -> List[PublicationData]:
         """📋 Extrair múltiplas publicações do texto"""
         publications = []
@@ -446,11 +970,15 @@ class DJEScraper:
                 if not section.strip():
                     continue
                 
-                if not self._validate_required_keywords(section):
+                if not self._is_new_section(section):
+                    continue
+                
+                anchors = scan_anchors(section)
+                if not self._validate_required_keywords(section, anchors):
                     continue
             
                 publication = await self._extract_single_publication_from_text(
-                    section, source_url, publication_date
+                    section, source_url, publication_date, anchors
                 )
                 if publication:
                     publications.append(publication)
@@ -584,11 +1112,34 @@ class DJEScraper:
 
 
     
-   async def _extract_single_publication_from_text(self, text: str, source_url: str, publication_date: Optional[date] = None) -> Optional[PublicationData]:
-        """📋 Extrair dados de uma única publicação do texto - VERSÃO CORRIGIDA AUTORES"""
+   @staticmethod
+   def _section_key(text: str) -> bytes:
+        """#️⃣ Chave de deduplicação de seções (hash rápido do texto da seção)"""
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+   async def _extract_single_publication_from_text(
+        self,
+        text: str,
+        source_url: str,
+        publication_date: Optional[date] = None,
+        anchors: Optional[AnchorHits] = None
+   ) -> Optional[PublicationData]:
+        """📋 Extrair dados de uma única publicação do texto - VERSÃO CORRIGIDA AUTORES
+        
+        Cada padrão só roda se a sua âncora ('Vistos', 'ADV:', 'principal', ...)
+        foi vista na varredura única da seção, e a partir da linha onde ela
+        aparece pela primeira vez. Padrões com termos distantes usam janelas
+        limitadas (GAP) e todas as buscas passam pelo orçamento de tempo da
+        seção: esgotado o prazo, a busca em andamento para e os padrões
+        restantes são pulados.
+        """
         try:
+            # Varredura linear única; o prazo cobre só os padrões com retrocesso
+            anchors = anchors or scan_anchors(text)
+            budget = ParseBudget.from_ms(settings.parse_time_budget_ms)
+            
             # Extrair número do processo
-            process_match = re.search(r'Processo (\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4})', text)
+            process_match = budget.search(PROCESS_NUMBER_PATTERN, text)
             if not process_match:
                 logger.debug("❌ Número do processo não encontrado")
                 return None
@@ -601,50 +1152,42 @@ class DJEScraper:
             
             # PADRÃO PRINCIPAL: - [NOME] - Vistos
             # Baseado nos exemplos reais: "- Josuel Anderson de Oliveira - Vistos"
-            author_pattern = r'-\s*([A-ZÁÊÇÕÃÀÉÍÓÚÂÎÔÛ][a-záêçõãàéíóúâîôûç]+(?:\s+[A-ZÁÊÇÕÃÀÉÍÓÚÂÎÔÛ][a-záêçõãàéíóúâîôûç]+)+)\s*-\s*Vistos\.?'
-            
-            matches = re.findall(author_pattern, text, re.IGNORECASE | re.MULTILINE)
-            logger.debug(f"🔍 Testando padrão principal de autores: {author_pattern}")
+            # Padrões em minúsculas sobre a cópia case-folded; nomes voltam do texto original
+            # Todos os padrões de autor terminam em 'Vistos': nada depois da última ocorrência casa
+            has_vistos = anchors.has(*AUTHOR_ANCHORS)
+            authors_end = anchors.last(*AUTHOR_ANCHORS) + len('vistos.') if has_vistos else 0
+            matches = [
+                anchors.group(match)
+                for match in budget.finditer(AUTHOR_PATTERN, anchors.folded, endpos=authors_end)
+            ] if has_vistos else []
+            logger.debug(f"🔍 Testando padrão principal de autores: {AUTHOR_PATTERN.pattern}")
             logger.debug(f"🔍 Matches encontrados: {matches}")
             
             for match in matches:
                 author_name = match.strip()
                 # Validação básica do nome
                 if len(author_name) >= 5 and len(author_name.split()) >= 2:
-                    # Limpar e formatar nome
-                    author_name = re.sub(r'\s+', ' ', author_name.strip())
-                    author_name = ' '.join(word.capitalize() for word in author_name.split())
-                    
+                    # Nome bruto: PublicationData limpa, formata e deduplica (memoizado)
                     if author_name not in authors:
                         authors.append(author_name)
                         logger.debug(f"✅ Autor extraído: {author_name}")
             
             # FALLBACK: Se não encontrou com o padrão principal, tentar outros padrões
-            if not authors:
+            if not authors and has_vistos and not budget.expired():
                 logger.debug("❌ Nenhum autor encontrado com padrão principal, tentando fallback...")
                 
-                # Padrão fallback mais amplo
-                fallback_patterns = [
-                    # 1. Casos como "DIREITO PREVIDENCIÁRIO - Nome - Vistos"
-                    r'DIREITO PREVIDENCIÁRIO\s*-\s*([A-ZÁÂÃÉÊÍÓÔÕÚÇ][a-záâãéêíóôõúç]+(?:\s+[A-ZÁÂÃÉÊÍÓÔÕÚÇ][a-záâãéêíóôõúç]+)+)\s*-\s*Vistos[.:]?',
-                    
-                    # 2. Casos com tipo de benefício antes do nome
-                    r'(?:Auxílio-Acidente|Auxílio-Doença|Aposentadoria|Benefícios em Espécie|Incapacidade Laborativa)[^-]*-\s*([A-ZÁÂÃÉÊÍÓÔÕÚÇ][a-záâãéêíóôõúç]+(?:\s+[A-ZÁÂÃÉÊÍÓÔÕÚÇ][a-záâãéêíóôõúç]+)+)\s*-\s*Vistos[.:]?',
-                    
-                    # 3. Padrão genérico: nome composto antes de "- Vistos"
-                    r'-\s*([A-ZÁÂÃÉÊÍÓÔÕÚÇ][a-záâãéêíóôõúç]+(?:\s+[A-ZÁÂÃÉÊÍÓÔÕÚÇ][a-záâãéêíóôõúç]+)+)\s*-\s*Vistos[.:]?'
-                ]
-                                
-                for i, pattern in enumerate(fallback_patterns):
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                for i, pattern in enumerate(AUTHOR_FALLBACK_PATTERNS):
+                    if budget.expired():
+                        break
+                    matches = [
+                        anchors.group(match)
+                        for match in budget.finditer(pattern, anchors.folded, endpos=authors_end)
+                    ]
                     logger.debug(f"🔍 Fallback pattern {i+1}: {len(matches)} matches")
                     
                     for match in matches:
                         author_name = match.strip()
                         if len(author_name) >= 5 and len(author_name.split()) >= 2:
-                            author_name = re.sub(r'\s+', ' ', author_name.strip())
-                            author_name = ' '.join(word.capitalize() for word in author_name.split())
-                            
                             if author_name not in authors:
                                 authors.append(author_name)
                                 logger.debug(f"✅ Autor extraído com fallback {i+1}: {author_name}")
@@ -658,16 +1201,10 @@ class DJEScraper:
             
             # Extrair advogado (mantendo o código existente)
             lawyers = []
-            lawyer_patterns = [
-                r'ADV: ([A-ZÁÊÇÕ\s]+?) \(OAB (\d+\/SP)\)',
-                r'Int\. - ADV: ([A-ZÁÊÇÕ\s]+?) \(OAB (\d+\/SP)\)'
-            ]
-            
-            for pattern in lawyer_patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    lawyer_name = match[0].strip()
-                    oab_number = match[1]
+            for pattern in LAWYER_PATTERNS if anchors.has(*LAWYER_ANCHORS) else []:
+                for match in budget.finditer(pattern, text):
+                    lawyer_name = match.group(1).strip()
+                    oab_number = match.group(2)
                     lawyers.append(f"{lawyer_name} (OAB {oab_number})")
                     logger.debug(f"✅ Advogado encontrado: {lawyer_name} (OAB {oab_number})")
             
@@ -677,49 +1214,36 @@ class DJEScraper:
             legal_fees = None
             
             # Valor principal
-            main_patterns = [
-                r'R\$ ([\d.,]+) - principal\s*bruto\/?\s*líquido?',
-                r'R\$ ([\d.,]+) - principal',
-                r'valor.*?principal.*?R\$ ([\d.,]+)',
-                r'importe total de R\$ ([\d.,]+)'
-            ]
-            
-            for pattern in main_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern, anchor in MAIN_VALUE_PATTERNS:
+                if budget.expired():
+                    break
+                match = anchors.search(pattern, anchor, budget=budget)
                 if match:
-                    main_value = self._parse_monetary_value(match.group(1))
+                    main_value = self._parse_monetary_value(anchors.group(match))
                     logger.debug(f"✅ Valor principal: {main_value}")
                     break
             
             # Juros moratórios
-            if re.search(r'sem juros moratórios', text, re.IGNORECASE):
+            if anchors.has('juros') and NO_INTEREST_MARKER in anchors.folded:
                 interest_value = Decimal('0.00')
                 logger.debug("✅ Sem juros moratórios")
             else:
-                interest_patterns = [
-                    r'R\$ ([\d.,]+) - juros moratórios',
-                    r'juros.*?R\$ ([\d.,]+)',
-                    r'correção.*?R\$ ([\d.,]+)'
-                ]
-                
-                for pattern in interest_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                for pattern, anchor in INTEREST_PATTERNS:
+                    if budget.expired():
+                        break
+                    match = anchors.search(pattern, anchor, budget=budget)
                     if match:
-                        interest_value = self._parse_monetary_value(match.group(1))
+                        interest_value = self._parse_monetary_value(anchors.group(match))
                         logger.debug(f"✅ Juros moratórios: {interest_value}")
                         break
             
             # Honorários advocatícios
-            fees_patterns = [
-                r'R\$ ([\d.,]+) - honorários advocatícios',
-                r'honorários.*?R\$ ([\d.,]+)',
-                r'verba.*?honorária.*?R\$ ([\d.,]+)'
-            ]
-            
-            for pattern in fees_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern, anchor in FEES_PATTERNS:
+                if budget.expired():
+                    break
+                match = anchors.search(pattern, anchor, budget=budget)
                 if match:
-                    legal_fees = self._parse_monetary_value(match.group(1))
+                    legal_fees = self._parse_monetary_value(anchors.group(match))
                     logger.debug(f"✅ Honorários: {legal_fees}")
                     break
             
@@ -734,10 +1258,21 @@ class DJEScraper:
                 main_value=main_value,
                 interest_value=interest_value,
                 legal_fees=legal_fees,
-                scraper_execution_id=self.current_execution_id
+                scraper_execution_id=self.current_execution_id,
+                anchors=anchors,
+                budget=budget
             )
             
-            logger.debug(f"📊 Publicação criada: {process_number}, autores: {len(authors)} ({authors}), válida: {publication.is_valid()}")
+            if budget.expired():
+                self._sections_over_budget += 1
+                logger.warning(
+                    "Section parse budget exhausted - remaining patterns skipped",
+                    process_number=process_number,
+                    section_chars=len(text),
+                    elapsed_ms=round(budget.elapsed * 1000, 1)
+                )
+            
+            logger.debug(f"📊 Publicação criada: {process_number}, autores: {len(authors)} ({authors}), validação: {publication.validation_reason.value}")
             return publication
             
         except Exception as e:
@@ -780,37 +1315,19 @@ class DJEScraper:
       """➡️ Navegar para próxima página usando JavaScript"""
       try:
           # Procurar link "Próximo>"
-          next_links = self.driver.find_elements(
+          next_links = await self.browser.find_elements(
               By.XPATH, 
               "//a[contains(text(), 'Próximo>') or contains(text(), 'Próximo')]"
           )
           
           for link in next_links:
-              if link.is_enabled() and link.is_displayed():
-                  onclick = link.get_attribute('onclick')
+              if await self.browser.run(lambda: link.is_enabled() and link.is_displayed()):
+                  onclick = await self.browser.run(link.get_attribute, 'onclick')
                   if onclick and 'trocaDePg' in onclick:
                       # Extrair número da página
                       page_match = re.search(r'trocaDePg\((\d+)\)', onclick)
                       if page_match:
-                          next_page = page_match.group(1)
-                          logger.debug(f"Navigating to page {next_page}")
-                          
-                          # Executar JavaScript diretamente
-                          self.driver.execute_script(f"trocaDePg({next_page});")
-                          
-                          # Aguardar nova página carregar
-                          await asyncio.sleep(3)
-                          
-                          # Verificar se mudou de página
-                          try:
-                              self.wait.until(
-                                  EC.presence_of_element_located((By.ID, "divResultadosInferior"))
-                              )
-                              logger.info(f"Successfully navigated to page {next_page}")
-                              return True
-                          except TimeoutException:
-                              logger.warning("Next page did not load properly")
-                              return False
+                          return await self.navigate_to_page(int(page_match.group(1)))
           
           logger.info("No next page link found or enabled")
           return False
@@ -819,16 +1336,78 @@ class DJEScraper:
           logger.warning("Failed to navigate to next page", error=str(e))
           return False
   
+   async def navigate_to_page(self, page_number: int) -> bool:
+      """🔢 Ir diretamente para uma página de resultados (usado também na retomada)"""
+      try:
+          logger.debug(f"Navigating to page {page_number}")
+          
+          # Guardar referência/assinatura dos resultados atuais para detectar a troca
+          old_containers = await self.browser.find_elements(By.ID, "divResultadosInferior")
+          old_container = old_containers[0] if old_containers else None
+          old_signature = await self.browser.execute_script(RESULTS_SIGNATURE_SCRIPT)
+          
+          # Executar JavaScript diretamente
+          started_at = time.perf_counter()
+          await self.browser.execute_script(f"trocaDePg({page_number});")
+          
+          # Aguardar a troca efetiva (sem sleep fixo): retorna assim que o DJE renderizar
+          try:
+              await self.browser.wait_until(
+                  self._results_replaced(old_container, old_signature),
+                  timeout=settings.pagination_timeout
+              )
+              self.browser.record_navigation(f"page {page_number}", started_at)
+              logger.info(f"Successfully navigated to page {page_number}")
+              return True
+          except TimeoutException:
+              logger.warning("Page did not load properly", page=page_number)
+              return False
+          
+      except Exception as e:
+          logger.warning("Failed to navigate to page", page=page_number, error=str(e))
+          return False
+  
+   @staticmethod
+   def _results_replaced(old_container, old_signature: Optional[str]) -> Callable:
+      """⏳ Condição de espera: container antigo ficou stale ou os resultados mudaram"""
+      def condition(driver) -> bool:
+          # Via JS para não cair no implicit wait enquanto a página nova não existe
+          signature = driver.execute_script(RESULTS_SIGNATURE_SCRIPT)
+          if signature is None:
+              return False
+          if old_container is None:
+              return True
+          if EC.staleness_of(old_container)(driver):
+              return True
+          return signature != old_signature
+      
+      return condition
+  
    async def scrape_publications(
       self, 
       target_date: date,
-      execution_id: int
+      execution_id: int,
+      checkpoint: Optional[ExecutionCheckpoint] = None,
+      on_page_complete: Optional[PageCompleteCallback] = None,
+      page_ledger: Optional[PageLedger] = None
   ) -> ScrapingResult:
-      """🕷️ Método principal de scraping com DEBUG MELHORADO"""
+      """🕷️ Método principal de scraping com DEBUG MELHORADO
+      
+      Com `checkpoint`, a paginação retoma após `last_completed_page` e PDFs já
+      processados são ignorados. `on_page_complete` é chamado ao fim de cada página
+      (upload + persistência do checkpoint ficam a cargo do orquestrador).
+      Com `page_ledger` as páginas processadas são registradas e, no modo
+      incremental, páginas já vistas em execuções anteriores do dia são puladas.
+      """
       
       self.current_execution_id = execution_id
       result = ScrapingResult()
       start_time = time.time()
+      get_name_cache().reset_stats()
+      self.memory.reset_stats()
+      self._reset_run_state()
+      if self.browser:
+          self.browser.navigation_times.clear()
       
       try:
           logger.info(
@@ -837,67 +1416,41 @@ class DJEScraper:
               execution_id=execution_id
           )
           
-          # Setup driver se necessário
-          if not self.driver:
-              await self.setup_driver()
+          # Perfis configurados sempre rodam pelo planejador (todos no mesmo processo)
+          multi_profile = bool(settings.get_scrape_profiles())
           
-          # 1. Navegar para página de busca
-          if not await self.navigate_to_search_page():
-              raise DJEScraperError("Failed to navigate to search page")
+          handled = False
+          if settings.caderno_bulk_mode and not multi_profile:
+              handled = await self._scrape_whole_caderno(
+                  target_date, result, checkpoint, on_page_complete, page_ledger
+              )
           
-          # 2. Configurar parâmetros de busca
-          if not await self.configure_search_parameters(target_date):
-              raise DJEScraperError("Failed to configure search parameters")
+          if not handled and scrape_mode() == "partitioned":
+              await self._scrape_partitioned(
+                  target_date, result, checkpoint, on_page_complete, page_ledger
+              )
+              handled = True
           
-          # 3. Executar busca
-          if not await self.execute_search():
-              raise DJEScraperError("Failed to execute search")
+          if not handled:
+              await self._scrape_search_results(
+                  target_date, result, checkpoint, on_page_complete, page_ledger
+              )
           
-          # 4. Processar resultados página por página
-          current_page = 1
-          max_pages = settings.max_pages_per_execution
+          if page_ledger:
+              result.incremental_pages_skipped = page_ledger.skipped_pages
           
-          while current_page <= max_pages:
-              logger.info(f"Processing page {current_page}")
-              
-              # Extrair publicações da página atual (estratégia PDF com DEBUG)
-              page_publications = await self.extract_publications_from_results()
-              
-              result.total_found += len(page_publications)
-              result.pages_scraped = current_page
-              
-              # Adicionar publicações válidas ao resultado
-              valid_count = 0
-              for publication in page_publications:
-                  if publication and publication.is_valid():
-                      result.add_publication(publication)
-                      valid_count += 1
-                      logger.info(f"✅ Publicação válida adicionada: {publication.process_number}")
-                  else:
-                      if publication:
-                          result.add_error(f"Publicação inválida: {publication.process_number}")
-                          logger.warning(f"❌ Publicação inválida: {publication.process_number}")
-                      else:
-                          result.add_error("Falha na extração de publicação")
-              
-              logger.info(
-                  f"📊 Page {current_page} processed",
-                  publications_found=len(page_publications),
-                  valid_publications=valid_count
-              )
-              
-              # Tentar ir para próxima página
-              if current_page < max_pages:
-                  if await self.navigate_to_next_page():
-                      current_page += 1
-                      # Delay entre páginas
-                      await asyncio.sleep(settings.dje_delay_between_requests)
-                  else:
-                      logger.info("No more pages available")
-                      break
-              else:
-                  logger.info(f"Reached maximum pages limit ({max_pages})")
-                  break
+          result.duplicate_pages_skipped = self._duplicate_hits_skipped
+          result.prefilter_pages_skipped = self._prefilter_skipped
+          result.sections_over_parse_budget = self._sections_over_budget
+          result.memory_high_water_bytes = self.memory.high_water
+          result.backpressure_waits = self.memory.waits
+          result.page_cache_evicted_bytes = self.memory.reclaimed
+          if self.browser:
+              result.navigation_times.extend(self.browser.navigation_times)
+          result.duplicate_sections_skipped = self._duplicate_sections_skipped
+          result.unique_sections = self._unique_sections
+          result.name_cache_hits = get_name_cache().hits
+          result.name_cache_misses = get_name_cache().misses
           
           result.execution_time = time.time() - start_time
           
@@ -922,20 +1475,473 @@ class DJEScraper:
       
       return result
   
+   async def _scrape_search_results(
+      self,
+      target_date: date,
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger]
+  ):
+      """🔍 Buscar no DJE e processar os resultados página por página"""
+      
+      # Setup driver se necessário
+      if not self.browser:
+          await self.setup_driver()
+      
+      await self._open_search(target_date)
+      result.search_queries += 1
+      
+      # 4. Processar resultados página por página
+      current_page = 1
+      max_pages = settings.max_pages_per_execution
+      
+      # Retomada: pular direto para a primeira página não concluída
+      if checkpoint and checkpoint.last_completed_page > 0:
+          resume_page = checkpoint.last_completed_page + 1
+          if resume_page > max_pages:
+              logger.info("Checkpoint already covers all pages", last_completed_page=checkpoint.last_completed_page)
+              return
+          
+          logger.info(f"Resuming from page {resume_page}", execution_id=self.current_execution_id)
+          if not await self.navigate_to_page(resume_page):
+              logger.info("Resume page not available - nothing left to process")
+              return
+          current_page = resume_page
+      
+      await self._process_result_pages(
+          current_page, max_pages, result, checkpoint, on_page_complete, page_ledger
+      )
+  
+   async def _open_search(self, target_date: date, query: Optional[SearchQuery] = None):
+      """🔎 Abrir busca avançada, preencher parâmetros e executar a consulta"""
+      # 1. Navegar para página de busca
+      if not await self.navigate_to_search_page():
+          raise DJEScraperError("Failed to navigate to search page")
+      
+      # 2. Configurar parâmetros de busca
+      configured = await self.configure_search_parameters(
+          target_date,
+          caderno=query.caderno if query else None,
+          search_terms=query.search_terms if query else None
+      )
+      if not configured:
+          raise DJEScraperError("Failed to configure search parameters")
+      
+      # 3. Executar busca
+      if not await self.execute_search():
+          raise DJEScraperError("Failed to execute search")
+  
+   async def _process_result_pages(
+      self,
+      first_page: int,
+      last_page: int,
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger],
+      search_key: Optional[str] = None,
+      profile: Optional[str] = None
+  ):
+      """📑 Processar páginas de resultado [first_page, last_page] da busca aberta
+      
+      Com `search_key` (buscas particionadas) cada página concluída é registrada
+      no checkpoint sob a sua busca; sem ela, como `last_completed_page`.
+      """
+      current_page = first_page
+      
+      while current_page <= last_page:
+          logger.info(f"Processing page {current_page}")
+          
+          # Links são lidos antes; o navegador já avança para a próxima página
+          # enquanto os PDFs desta são baixados, parseados e enviados
+          pdf_links = await self._extract_pdf_links_from_search_results()
+          
+          next_page_task = None
+          if current_page < last_page:
+              next_page_task = asyncio.create_task(self.navigate_to_next_page())
+          
+          try:
+              processed: Dict[str, Optional[str]] = {}
+              page_publications = await self._process_pdf_links(
+                  pdf_links, checkpoint, page_ledger, processed
+              )
+              
+              await self._complete_result_page(
+                  current_page, page_publications, result, checkpoint, on_page_complete,
+                  page_ledger, processed, profile, search_key
+              )
+          except BaseException:
+              if next_page_task:
+                  next_page_task.cancel()
+              raise
+          
+          # Tentar ir para próxima página
+          if next_page_task:
+              if await next_page_task:
+                  current_page += 1
+                  # Delay entre páginas
+                  await asyncio.sleep(settings.dje_delay_between_requests)
+              else:
+                  logger.info("No more pages available")
+                  break
+          else:
+              if search_key is None and await self._has_next_page():
+                  result.truncated_searches += 1
+                  logger.warning(
+                      f"Reached maximum pages limit ({last_page}) with results remaining - "
+                      "enable QUERY_PARTITIONING to cover the whole day"
+                  )
+              else:
+                  logger.info(f"Reached maximum pages limit ({last_page})")
+              break
+  
+   async def _has_next_page(self) -> bool:
+      """🔍 Verificar se a busca aberta ainda tem link 'Próximo'"""
+      try:
+          return bool(await self.browser.execute_script(
+              "return Array.prototype.some.call(document.querySelectorAll('a[onclick*=\"trocaDePg\"]'),"
+              " function (a) { return a.textContent.indexOf('Próximo') !== -1; });"
+          ))
+      except Exception:
+          return False
+  
+   async def _scrape_partitioned(
+      self,
+      target_date: date,
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger]
+  ):
+      """🗺️ Executar as sub-consultas do dia em sessões de navegador paralelas
+      
+      Cada sessão tem o seu próprio Chrome; downloads, cache de páginas/seções
+      e deduplicação são compartilhados, então uma página do diário que aparece
+      em várias sub-consultas é baixada e contabilizada uma única vez. A
+      retomada pula as páginas concluídas de cada busca (`completed_pages`).
+      Perfis de SCRAPE_PROFILES dividem o mesmo pool de sessões; uma página
+      encontrada por dois perfis é creditada ao que a processou primeiro.
+      """
+      queue: asyncio.Queue = asyncio.Queue()
+      for query in plan_search_queries():
+          queue.put_nowait(query)
+      
+      failures: List[str] = []
+      
+      async def session_worker(session_number: int):
+          browser = AsyncBrowser()
+          _session_browser.set(browser)
+          try:
+              await browser.start()
+              while True:
+                  query = await queue.get()
+                  try:
+                      await self._run_search_query(
+                          query, target_date, result, checkpoint, on_page_complete, page_ledger, queue
+                      )
+                  except Exception as e:
+                      failures.append(f"{query.label}: {e}")
+                      logger.error("Search query failed", session=session_number, query=query.label, error=str(e))
+                  finally:
+                      queue.task_done()
+          finally:
+              result.navigation_times.extend(browser.navigation_times)
+              await browser.quit()
+      
+      sessions = max(1, settings.query_parallel_sessions)
+      workers = [asyncio.create_task(session_worker(n)) for n in range(1, sessions + 1)]
+      
+      try:
+          # Termina quando todas as sub-consultas (incluindo blocos gerados) forem concluídas
+          join_task = asyncio.create_task(queue.join())
+          done, _ = await asyncio.wait([join_task, *workers], return_when=asyncio.FIRST_COMPLETED)
+          if join_task not in done:
+              # Uma sessão caiu antes de terminar a fila (ex.: Chrome não iniciou)
+              join_task.cancel()
+              for worker in done:
+                  worker.result()
+      finally:
+          for worker in workers:
+              worker.cancel()
+          await asyncio.gather(*workers, return_exceptions=True)
+      
+      if failures:
+          for failure in failures:
+              result.add_error(f"Search query failed: {failure}")
+          raise DJEScraperError(f"{len(failures)} search queries failed")
+  
+   async def _run_search_query(
+      self,
+      query: SearchQuery,
+      target_date: date,
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger],
+      queue: asyncio.Queue
+  ):
+      """🔎 Executar uma sub-consulta na sessão atual e agendar o próximo bloco de páginas"""
+      logger.info("Running search query", query=query.label)
+      
+      max_total = settings.query_max_total_pages
+      last_page = min(query.end_page or max_total, max_total)
+      next_block = query.next_block()
+      if next_block and next_block.start_page > max_total:
+          next_block = None
+      
+      # Retomada: as páginas de um bloco são concluídas em ordem, então basta pular o prefixo concluído
+      completed = checkpoint.completed_pages.get(query.search_key, set()) if checkpoint else set()
+      first_page = query.start_page
+      while first_page <= last_page and first_page in completed:
+          first_page += 1
+      
+      if first_page > last_page:
+          logger.debug("Search query block already completed", query=query.label)
+          if next_block:
+              queue.put_nowait(next_block)
+          return
+      
+      await self._open_search(target_date, query)
+      result.search_queries += 1
+      
+      if first_page > 1 and not await self.navigate_to_page(first_page):
+          logger.debug("Search query block beyond last result page", query=query.label)
+          return
+      
+      # Página inicial existe: o bloco seguinte pode ser buscado em paralelo por outra sessão
+      if next_block:
+          queue.put_nowait(next_block)
+      
+      await self._process_result_pages(
+          first_page, last_page, result, checkpoint, on_page_complete, page_ledger,
+          search_key=query.search_key,
+          profile=query.profile
+      )
+      
+      if last_page == max_total and await self._has_next_page():
+          result.truncated_searches += 1
+          logger.warning(f"Search reached QUERY_MAX_TOTAL_PAGES ({max_total}) with results remaining", query=query.label)
+  
+   async def _complete_result_page(
+      self,
+      page_number: int,
+      page_publications: List[PublicationData],
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger] = None,
+      processed: Optional[Dict[str, Optional[str]]] = None,
+      profile: Optional[str] = None,
+      search_key: Optional[str] = None
+  ):
+      """✅ Contabilizar publicações de uma página de resultados e notificar o orquestrador
+      
+      Os PDFs processados (`processed`: chave → hash) e a própria página
+      (`page_number` dentro da busca `search_key`) só entram no checkpoint e no
+      ledger aqui, junto com as publicações da página - com sessões paralelas o
+      checkpoint gravado nunca contém PDFs de uma página ainda em andamento.
+      """
+      self._result_pages_completed += 1
+      
+      result.total_found += len(page_publications)
+      if search_key is None:
+          result.pages_scraped = max(result.pages_scraped, page_number)
+      else:
+          # Buscas particionadas: páginas concluídas nesta execução, não a maior posição
+          result.pages_scraped = self._result_pages_completed
+      
+      # Adicionar publicações válidas ao resultado
+      valid_count = 0
+      page_valid_publications = []
+      for publication in page_publications:
+          if publication and publication.is_valid():
+              result.add_publication(publication)
+              page_valid_publications.append(publication)
+              valid_count += 1
+              logger.info(f"✅ Publicação válida adicionada: {publication.process_number}")
+          else:
+              result.add_invalid(publication.validation_reason if publication else ValidationReason.EXTRACTION_FAILED)
+      
+      logger.info(
+          f"📊 Page {page_number} processed",
+          publications_found=len(page_publications),
+          valid_publications=valid_count,
+          profile=profile
+      )
+      
+      if profile:
+          result.add_profile_page(profile, len(page_publications), valid_count)
+      
+      for pdf_key, content_hash in (processed or {}).items():
+          if checkpoint:
+              checkpoint.processed_pdf_keys.add(pdf_key)
+          if page_ledger:
+              page_ledger.record(pdf_key, content_hash)
+      
+      if checkpoint:
+          checkpoint.complete_page(page_number, search_key)
+          checkpoint.publications_found += len(page_publications)
+      
+      if on_page_complete:
+          # Publicações retidas até o upload terminar
+          pending_bytes = publications_size(page_valid_publications)
+          self.memory.track("publications", pending_bytes)
+          try:
+              await on_page_complete(page_number, page_valid_publications)
+          finally:
+              self.memory.release("publications", pending_bytes)
+  
+   async def _scrape_whole_caderno(
+      self,
+      target_date: date,
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger]
+  ) -> bool:
+      """📚 Baixar o caderno inteiro do dia e filtrar as seções localmente
+      
+      Uma única requisição grande substitui centenas de downloads de páginas
+      individuais. Retorna False (para cair na busca página a página) se o
+      caderno não puder ser baixado ou lido.
+      """
+      caderno = settings.target_caderno
+      caderno_url = settings.dje_caderno_download_url.format(
+          date=target_date.strftime("%d/%m/%Y"),
+          caderno=caderno
+      )
+      caderno_key = f"caderno:{caderno}:{target_date.isoformat()}"
+      
+      if checkpoint and caderno_key in checkpoint.processed_pdf_keys:
+          logger.info("Caderno already processed for this execution", caderno=caderno)
+          return True
+      
+      if page_ledger and page_ledger.should_skip(caderno_key):
+          logger.info("Caderno already processed today (incremental)", caderno=caderno)
+          return True
+      
+      logger.info("📚 Downloading whole caderno", url=caderno_url)
+      pdf_content = await self._download_caderno(caderno_url)
+      if not pdf_content:
+          logger.warning("Caderno download failed - falling back to per-page search")
+          return False
+      
+      try:
+          return await self._parse_caderno(
+              pdf_content, caderno_url, caderno_key, result, checkpoint, on_page_complete, page_ledger
+          )
+      finally:
+          self.memory.release("downloads", len(pdf_content))
+  
+   async def _parse_caderno(
+      self,
+      pdf_content: bytes,
+      caderno_url: str,
+      caderno_key: str,
+      result: ScrapingResult,
+      checkpoint: Optional[ExecutionCheckpoint],
+      on_page_complete: Optional[PageCompleteCallback],
+      page_ledger: Optional[PageLedger]
+  ) -> bool:
+      """📚 Extrair e parsear o caderno baixado (páginas em streaming)"""
+      caderno = settings.target_caderno
+      content_hash = None
+      if page_ledger:
+          content_hash = page_ledger.content_hash(pdf_content)
+          if page_ledger.is_unchanged(caderno_key, content_hash):
+              logger.info("Caderno unchanged since last run (incremental)", caderno=caderno)
+              return True
+      
+      extracted_pages = 0
+      
+      async def caderno_pages() -> AsyncIterator[DiaryPageText]:
+          # Páginas chegam em ordem enquanto as seguintes ainda estão sendo extraídas
+          nonlocal extracted_pages
+          async for page_number, text, prefiltered in iterate_in_thread(
+              lambda: iter_pages_parallel(pdf_content, settings.pdf_extraction_workers)
+          ):
+              self._prefilter_skipped += prefiltered
+              if not text:
+                  continue
+              extracted_pages += 1
+              yield DiaryPageText(
+                  ref=DiaryPageRef(0, 0, int(caderno), page_number + 1),
+                  url=f"{caderno_url}#page={page_number + 1}",
+                  text=text
+              )
+      
+      publications = await self._extract_publications_from_page_stream(caderno_pages())
+      
+      if not extracted_pages:
+          logger.warning("No text extracted from caderno - falling back to per-page search")
+          return False
+      
+      logger.info(f"📚 Caderno extracted: {extracted_pages} pages")
+      
+      await self._complete_result_page(
+          1, publications, result, checkpoint, on_page_complete,
+          page_ledger, {caderno_key: content_hash}, search_key=caderno_key
+      )
+      return True
+  
+   async def _download_caderno(self, caderno_url: str) -> Optional[bytes]:
+      """📥 Baixar PDF completo do caderno (streaming, com limite de tamanho)"""
+      max_size = settings.caderno_max_size_mb * 1024 * 1024
+      
+      received = 0
+      
+      try:
+          await self.memory.wait_for_capacity()
+          
+          # Conta como uma requisição no limite compartilhado
+          await self.download_throttler.acquire()
+          
+          async with self.http_client.stream(
+              "GET", caderno_url, timeout=settings.caderno_download_timeout
+          ) as response:
+              response.raise_for_status()
+              
+              content_type = response.headers.get('content-type', '').lower()
+              if 'pdf' not in content_type and 'octet-stream' not in content_type:
+                  logger.warning(f"Caderno response não é PDF: content-type={content_type}")
+                  return None
+              
+              buffer = bytearray()
+              async for chunk in response.aiter_bytes():
+                  buffer.extend(chunk)
+                  received += len(chunk)
+                  self.memory.track("downloads", len(chunk))
+                  if len(buffer) > max_size:
+                      logger.warning(f"Caderno muito grande (> {settings.caderno_max_size_mb}MB), abortando")
+                      self.memory.release("downloads", received)
+                      return None
+              
+              return bytes(buffer)
+          
+      except Exception as e:
+          self.memory.release("downloads", received)
+          logger.error(f"Erro ao baixar caderno {caderno_url}: {e}")
+          return None
+  
    async def close(self):
       """🔒 Fechar driver e recursos"""
       if self.http_client:
           await self.http_client.aclose()
       
-      if self.driver:
+      if self.pdf_buffer_pool:
+          self.pdf_buffer_pool.close()
+      
+      shutdown_extraction_pool()
+      
+      if self.browser:
           try:
-              self.driver.quit()
+              await self.browser.quit()
               logger.info("Chrome driver closed successfully")
           except Exception as e:
               logger.warning("Error closing driver", error=str(e))
           finally:
-              self.driver = None
-              self.wait = None
+              self.browser = None
 
    def normalize_link(url: str) -> str:
       """🔗 Normalizar URL removendo entidades HTML"""
@@ -0,0 +1,116 @@
+"""🔠 Motores de OCR (Tesseract em processo ou via subprocesso)"""
+
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import pytesseract
+from PIL import Image
+import structlog
+
+from ..config.settings import settings
+
+try:
+    import tesserocr
+except ImportError:  # Opcional: requer libtesseract instalada
+    tesserocr = None
+
+logger = structlog.get_logger(__name__)
+
+def _default_psm() -> int:
+    """📐 Modo de segmentação configurado em OCR_CONFIG (--psm N)"""
+    match = re.search(r'--psm\s+(\d+)', settings.ocr_config)
+    return int(match.group(1)) if match else 6
+
+class OCREngine(ABC):
+    """🔠 Interface comum dos motores de OCR"""
+
+    name = "base"
+
+    @abstractmethod
+    def image_to_string(self, image: Image.Image, psm: Optional[int] = None) -> str:
+        """📝 Reconhecer texto de uma imagem já em memória"""
+
+    def close(self):
+        """🔒 Liberar recursos do motor"""
+        pass
+
+class PytesseractEngine(OCREngine):
+    """🐢 pytesseract: um processo `tesseract` (e carga do modelo) por chamada"""
+
+    name = "pytesseract"
+
+    def image_to_string(self, image: Image.Image, psm: Optional[int] = None) -> str:
+        config = settings.ocr_config
+        if psm is not None:
+            config = re.sub(r'--psm\s+\d+', '', config).strip()
+            config = f"{config} --psm {psm}".strip()
+
+        return pytesseract.image_to_string(image, lang=settings.ocr_language, config=config)
+
+class TesserocrEngine(OCREngine):
+    """⚡ tesserocr: API do Tesseract carregada uma vez e reutilizada
+
+    O modelo de idioma fica em memória enquanto o motor existir e a imagem é
+    entregue diretamente (sem arquivo temporário nem subprocesso). A API não é
+    thread-safe: use uma instância por thread/processo (ver get_ocr_engine).
+    """
+
+    name = "tesserocr"
+
+    def __init__(self):
+        if tesserocr is None:
+            raise RuntimeError("tesserocr is not installed")
+
+        self._default_psm = _default_psm()
+        self._api = tesserocr.PyTessBaseAPI(
+            lang=settings.ocr_language,
+            psm=tesserocr.PSM(self._default_psm)
+        )
+
+    def image_to_string(self, image: Image.Image, psm: Optional[int] = None) -> str:
+        self._api.SetPageSegMode(tesserocr.PSM(psm if psm is not None else self._default_psm))
+        self._api.SetImage(image)
+        try:
+            return self._api.GetUTF8Text()
+        finally:
+            self._api.Clear()
+
+    def close(self):
+        self._api.End()
+
+def create_ocr_engine(name: Optional[str] = None) -> OCREngine:
+    """🏭 Criar motor de OCR ('auto' usa tesserocr quando disponível)"""
+    name = (name or settings.ocr_engine).lower()
+
+    if name == "pytesseract":
+        return PytesseractEngine()
+
+    if name == "tesserocr":
+        return TesserocrEngine()
+
+    if name != "auto":
+        raise ValueError(f"Unknown OCR engine: {name}")
+
+    if tesserocr is not None:
+        try:
+            return TesserocrEngine()
+        except RuntimeError as e:
+            logger.warning("tesserocr unavailable, falling back to pytesseract", error=str(e))
+
+    return PytesseractEngine()
+
+# Um motor por thread (cada processo de extração tem o seu, com o modelo carregado)
+_local = threading.local()
+
+def get_ocr_engine() -> OCREngine:
+    """🔠 Motor de OCR da thread atual (criado na primeira chamada)"""
+    engine = getattr(_local, "engine", None)
+
+    if engine is None:
+        engine = create_ocr_engine()
+        _local.engine = engine
+        logger.debug("OCR engine loaded", engine=engine.name, thread=threading.current_thread().name)
+
+    return engine
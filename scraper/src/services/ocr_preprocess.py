@@ -0,0 +1,126 @@
+"""🖼️ Pré-processamento de páginas para OCR (recorte, binarização, colunas)"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+import structlog
+
+from ..config.settings import settings
+from .ocr_engine import get_ocr_engine
+
+logger = structlog.get_logger(__name__)
+
+# Executor das colunas (cada thread usa o seu próprio motor de OCR)
+_column_executor: Optional[ThreadPoolExecutor] = None
+_column_executor_lock = threading.Lock()
+
+def _ink_mask(image: Image.Image) -> np.ndarray:
+    """⬛ Máscara de pixels escuros (True = tinta)"""
+    gray = np.asarray(image.convert('L'))
+    return gray < settings.ocr_binarize_threshold
+
+def crop_to_text_area(image: Image.Image, padding: int = 20) -> Image.Image:
+    """✂️ Recortar margens em branco ao redor do texto"""
+    mask = _ink_mask(image)
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if not len(rows):
+        return image
+
+    return image.crop((
+        max(0, int(cols[0]) - padding),
+        max(0, int(rows[0]) - padding),
+        min(image.width, int(cols[-1]) + 1 + padding),
+        min(image.height, int(rows[-1]) + 1 + padding)
+    ))
+
+def binarize(image: Image.Image) -> Image.Image:
+    """⚫ Converter para 1 bit (menos dados para o Tesseract analisar)"""
+    threshold = settings.ocr_binarize_threshold
+    return image.convert('L').point(lambda p: 255 if p >= threshold else 0, mode='1')
+
+def find_column_gutter(mask: np.ndarray, min_gutter_ratio: float = 0.01) -> Optional[int]:
+    """🔍 Posição x do espaço entre as duas colunas do DJE (None = coluna única)
+
+    Procura, na faixa central da página e abaixo do cabeçalho, a maior
+    sequência de colunas de pixels sem tinta.
+    """
+    height, width = mask.shape
+    body = mask[int(height * 0.15):int(height * 0.95)]
+    ink_per_column = body.sum(axis=0)
+    start, end = int(width * 0.35), int(width * 0.65)
+
+    # Tolerância para ruído/linhas finas atravessando a calha
+    empty = ink_per_column[start:end] <= max(1, body.shape[0] * 0.002)
+
+    best_start, best_length, run_start = None, 0, None
+    for offset, is_empty in enumerate(np.append(empty, False)):
+        if is_empty and run_start is None:
+            run_start = offset
+        elif not is_empty and run_start is not None:
+            if offset - run_start > best_length:
+                best_start, best_length = run_start, offset - run_start
+            run_start = None
+
+    if best_start is None or best_length < width * min_gutter_ratio:
+        return None
+
+    return start + best_start + best_length // 2
+
+def _header_bottom(mask: np.ndarray, gutter: int) -> int:
+    """📰 Fim do cabeçalho que atravessa a calha no topo da página (0 = sem cabeçalho)"""
+    height = mask.shape[0]
+    strip = mask[:int(height * 0.15), max(0, gutter - 5):gutter + 5].any(axis=1)
+    rows = np.flatnonzero(strip)
+    return int(rows[-1]) + 1 if len(rows) else 0
+
+def prepare_regions(image: Image.Image) -> List[Tuple[Image.Image, Optional[int]]]:
+    """🧩 Recortar, binarizar e separar cabeçalho/colunas (ordem de leitura, psm)"""
+    cropped = crop_to_text_area(image)
+    regions: List[Tuple[Image.Image, Optional[int]]] = [(cropped, None)]
+
+    if settings.ocr_column_split:
+        mask = _ink_mask(cropped)
+        gutter = find_column_gutter(mask)
+        if gutter is not None:
+            header_bottom = _header_bottom(mask, gutter)
+            regions = [
+                (cropped.crop((0, header_bottom, gutter, cropped.height)), settings.ocr_column_psm),
+                (cropped.crop((gutter, header_bottom, cropped.width, cropped.height)), settings.ocr_column_psm)
+            ]
+            if header_bottom:
+                # Cabeçalho de largura total: bloco uniforme
+                regions.insert(0, (cropped.crop((0, 0, cropped.width, header_bottom)), 6))
+
+    return [(binarize(region), psm) for region, psm in regions]
+
+def _recognize_region(region: Tuple[Image.Image, Optional[int]]) -> str:
+    image, psm = region
+    return get_ocr_engine().image_to_string(image, psm=psm)
+
+def _get_column_executor() -> ThreadPoolExecutor:
+    """🧵 Executor único das colunas (threads produtoras de PDF chamam OCR em paralelo)"""
+    global _column_executor
+    with _column_executor_lock:
+        if _column_executor is None:
+            _column_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ocr-column")
+        return _column_executor
+
+def recognize_page(image: Image.Image) -> str:
+    """🔠 OCR de uma página renderizada (pré-processada quando habilitado)
+
+    Colunas são reconhecidas em paralelo e concatenadas esquerda → direita,
+    evitando linhas das duas colunas intercaladas no texto.
+    """
+    if not settings.ocr_preprocessing:
+        return get_ocr_engine().image_to_string(image)
+
+    regions = prepare_regions(image)
+    if len(regions) == 1:
+        return _recognize_region(regions[0])
+
+    texts = list(_get_column_executor().map(_recognize_region, regions))
+    return "\n".join(texts)
@@ -0,0 +1,568 @@
+"""📄 Extração de texto de PDFs (backends plugáveis, paralela por página)"""
+
+import io
+import multiprocessing
+import re
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing import resource_tracker, shared_memory
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pdfplumber
+import PyPDF2
+import structlog
+
+from ..config.settings import settings
+from ..utils.shm_pool import SharedBuffer
+from ..utils.text_normalize import normalize_page_text
+from .ocr_preprocess import recognize_page
+
+try:
+    import pypdfium2
+except ImportError:  # Opcional: backend mais rápido (binding do PDFium)
+    pypdfium2 = None
+
+logger = structlog.get_logger(__name__)
+
+# PDF em memória: bytes comuns, visão de um segmento ou segmento do pool de downloads
+PdfSource = Union[bytes, memoryview, SharedBuffer]
+
+def as_buffer(pdf_content: PdfSource) -> Union[bytes, memoryview]:
+    """🧾 Conteúdo do PDF como buffer (segmentos compartilhados viram memoryview, sem cópia)"""
+    if isinstance(pdf_content, SharedBuffer):
+        return pdf_content.view()
+    return pdf_content
+
+class MemoryViewReader(io.RawIOBase):
+    """📖 Arquivo somente leitura sobre uma memoryview (sem copiar o PDF)"""
+
+    def __init__(self, view: memoryview):
+        self._view = view.cast('B')
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = max(0, min(len(buffer), len(self._view) - self._position))
+        buffer[:size] = self._view[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._view)}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+def open_pdf_stream(pdf_content: PdfSource) -> BinaryIO:
+    """📖 Arquivo em memória para as bibliotecas de PDF (memoryview não é copiada)"""
+    pdf_content = as_buffer(pdf_content)
+    if isinstance(pdf_content, memoryview):
+        return MemoryViewReader(pdf_content)
+    return io.BytesIO(pdf_content)
+
+def _pdfium_input(pdf_content: PdfSource):
+    # PDFium lê bytes diretamente; memoryview precisa da interface de arquivo
+    pdf_content = as_buffer(pdf_content)
+    return open_pdf_stream(pdf_content) if isinstance(pdf_content, memoryview) else pdf_content
+
+class PdfTextBackend(ABC):
+    """📄 Interface comum de extração de texto (sem OCR)"""
+
+    name = "base"
+
+    @abstractmethod
+    def extract_pages(self, pdf_content: PdfSource, page_numbers: Optional[Sequence[int]] = None) -> List[str]:
+        """📝 Texto de cada página pedida (todas quando `page_numbers` é None)"""
+
+class PdfplumberBackend(PdfTextBackend):
+    """🐢 pdfplumber: análise de layout completa (baseline, mais lento)"""
+
+    name = "pdfplumber"
+
+    def extract_pages(self, pdf_content: PdfSource, page_numbers: Optional[Sequence[int]] = None) -> List[str]:
+        texts = []
+        with pdfplumber.open(open_pdf_stream(pdf_content)) as pdf:
+            numbers = range(len(pdf.pages)) if page_numbers is None else page_numbers
+            for page_number in numbers:
+                page = pdf.pages[page_number]
+                try:
+                    texts.append(page.extract_text() or "")
+                finally:
+                    page.flush_cache()
+        return texts
+
+class PyPDF2Backend(PdfTextBackend):
+    """⚡ PyPDF2: leitura direta do content stream"""
+
+    name = "pypdf2"
+
+    def extract_pages(self, pdf_content: PdfSource, page_numbers: Optional[Sequence[int]] = None) -> List[str]:
+        reader = PyPDF2.PdfReader(open_pdf_stream(pdf_content))
+        numbers = range(len(reader.pages)) if page_numbers is None else page_numbers
+        return [reader.pages[page_number].extract_text() or "" for page_number in numbers]
+
+class PdfiumBackend(PdfTextBackend):
+    """🚀 pypdfium2: extração nativa do PDFium"""
+
+    name = "pypdfium2"
+
+    def __init__(self):
+        if pypdfium2 is None:
+            raise RuntimeError("pypdfium2 is not installed")
+
+    def extract_pages(self, pdf_content: PdfSource, page_numbers: Optional[Sequence[int]] = None) -> List[str]:
+        texts = []
+        document = pypdfium2.PdfDocument(_pdfium_input(pdf_content))
+        try:
+            numbers = range(len(document)) if page_numbers is None else page_numbers
+            for page_number in numbers:
+                page = document[page_number]
+                textpage = page.get_textpage()
+                try:
+                    texts.append(textpage.get_text_range().replace('\r\n', '\n'))
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            document.close()
+        return texts
+
+PDF_TEXT_BACKENDS = {
+    backend.name: backend
+    for backend in (PdfiumBackend, PyPDF2Backend, PdfplumberBackend)
+}
+
+def get_text_backends(names: Optional[Sequence[str]] = None) -> List[PdfTextBackend]:
+    """🔌 Backends na ordem configurada (pdfplumber sempre fica como último recurso)"""
+    names = names or settings.get_pdf_text_backends()
+    backends = []
+
+    for name in names:
+        backend_class = PDF_TEXT_BACKENDS.get(name)
+        if backend_class is None:
+            logger.warning("Unknown PDF text backend, ignoring", backend=name)
+            continue
+        try:
+            backends.append(backend_class())
+        except RuntimeError as e:
+            logger.debug("PDF text backend unavailable", backend=name, error=str(e))
+
+    if not any(backend.name == PdfplumberBackend.name for backend in backends):
+        backends.append(PdfplumberBackend())
+
+    return backends
+
+def text_quality_ok(text: Optional[str], min_length: int = 100) -> bool:
+    """✅ Texto de backend rápido é aproveitável (senão cai para pdfplumber/OCR)
+
+    Rejeita texto curto, glifos sem mapeamento ((cid:N), U+FFFD) e palavras
+    coladas - falhas típicas da extração direta do content stream.
+    """
+    if not text:
+        return False
+
+    stripped = text.strip()
+    if len(stripped) < min_length:
+        return False
+
+    if stripped.count('(cid:') > 5 or stripped.count('\ufffd') > len(stripped) * 0.01:
+        return False
+
+    if stripped.count(' ') < len(stripped) * 0.05:
+        return False
+
+    visible = re.sub(r'\s+', '', stripped)
+    alphanumeric = sum(char.isalnum() for char in visible)
+    return alphanumeric >= len(visible) * 0.5
+
+def _normalized(text: str) -> str:
+    """🧽 Texto de página pronto para o parser (normalizado uma única vez, na extração)"""
+    return normalize_page_text(text) if settings.text_normalization else text
+
+def _keyword_pattern(keyword: str) -> str:
+    """🔤 Palavra-chave normalizada (sem espaços, casefold) para comparação tolerante"""
+    return re.sub(r'\s+', '', keyword).casefold()
+
+def may_contain_keywords(text: str) -> bool:
+    """🔎 Prefiltro: o texto contém alguma palavra-chave obrigatória?
+
+    Ignora espaços e caixa (texto nativo costuma vir com palavras coladas);
+    basta uma palavra-chave porque a seção pode continuar em outra página.
+    """
+    normalized = re.sub(r'\s+', '', text).casefold()
+    return any(_keyword_pattern(keyword) in normalized for keyword in settings.get_prefilter_keywords())
+
+@dataclass
+class FastTextLayer:
+    """⚡ Texto nativo de um PDF inteiro pelos backends rápidos (reaproveitado na extração)"""
+
+    page_count: int
+    texts: Dict[int, str]  # Páginas aprovadas por text_quality_ok
+    raw_texts: Dict[int, str]  # Texto bruto do primeiro backend que rodou (prefiltro)
+    backends: Tuple[str, ...] = ()  # Backends rápidos já executados (não rodam de novo)
+
+    @property
+    def raw_text(self) -> Optional[str]:
+        """📜 Texto bruto do documento (None = sem camada de texto/escaneado)"""
+        text = "\n".join(self.raw_texts.get(page_number, "") for page_number in range(self.page_count))
+        return _normalized(text) if len(text.strip()) >= 50 else None
+
+    @property
+    def missing(self) -> List[int]:
+        """📄 Páginas que ainda precisam de outro backend, pdfplumber ou OCR"""
+        return [page_number for page_number in range(self.page_count) if page_number not in self.texts]
+
+    def subset(self, page_numbers: Sequence[int]) -> "FastTextLayer":
+        """✂️ Só as páginas pedidas (enviado aos workers junto com o intervalo)"""
+        return FastTextLayer(
+            self.page_count,
+            {n: self.texts[n] for n in page_numbers if n in self.texts},
+            {n: self.raw_texts[n] for n in page_numbers if n in self.raw_texts},
+            self.backends
+        )
+
+def fast_text_layer(pdf_content: PdfSource) -> Optional[FastTextLayer]:
+    """⚡ Primeiro backend rápido que funcionar, sobre todas as páginas (None = nenhum disponível)"""
+    tried = []
+    for backend in get_text_backends():
+        if backend.name == PdfplumberBackend.name:
+            break
+
+        tried.append(backend.name)
+        try:
+            extracted = backend.extract_pages(pdf_content)
+        except Exception as e:
+            logger.debug("PDF text backend failed", backend=backend.name, error=str(e))
+            continue
+
+        return FastTextLayer(
+            page_count=len(extracted),
+            texts={n: text for n, text in enumerate(extracted) if text_quality_ok(text, min_length=50)},
+            raw_texts=dict(enumerate(extracted)),
+            backends=tuple(tried)
+        )
+
+    return None
+
+def _fast_page_texts(
+    pdf_content: PdfSource,
+    page_numbers: List[int],
+    layer: Optional[FastTextLayer] = None
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """⚡ Páginas resolvidas pelos backends rápidos (as demais vão para pdfplumber/OCR)
+
+    Retorna (texto aceito pelo filtro de qualidade, texto bruto do primeiro
+    backend que rodou - usado pelo prefiltro de palavras-chave). Com `layer`
+    (prefiltro já rodou), o que ele resolveu é reaproveitado e os backends
+    já executados não rodam de novo.
+    """
+    texts: Dict[int, str] = {}
+    raw_texts: Dict[int, str] = {}
+    done_backends = set()
+
+    if layer is not None:
+        texts = {n: layer.texts[n] for n in page_numbers if n in layer.texts}
+        raw_texts = {n: layer.raw_texts[n] for n in page_numbers if n in layer.raw_texts}
+        done_backends = set(layer.backends)
+
+    for backend in get_text_backends():
+        if backend.name == PdfplumberBackend.name:
+            break
+        if backend.name in done_backends:
+            continue
+
+        missing = [page_number for page_number in page_numbers if page_number not in texts]
+        if not missing:
+            break
+
+        try:
+            extracted = backend.extract_pages(pdf_content, missing)
+        except Exception as e:
+            logger.debug("PDF text backend failed", backend=backend.name, error=str(e))
+            continue
+
+        for page_number, text in zip(missing, extracted):
+            raw_texts.setdefault(page_number, text)
+            if text_quality_ok(text, min_length=50):
+                texts[page_number] = text
+
+    return texts, raw_texts
+
+def count_pages(pdf_content: PdfSource) -> int:
+    """🔢 Número de páginas (sem análise de layout)"""
+    if pypdfium2 is not None:
+        document = pypdfium2.PdfDocument(_pdfium_input(pdf_content))
+        try:
+            return len(document)
+        finally:
+            document.close()
+
+    return len(PyPDF2.PdfReader(open_pdf_stream(pdf_content)).pages)
+
+def iter_page_texts(
+    pdf_content: PdfSource,
+    page_numbers: Optional[Sequence[int]] = None,
+    prefilter: bool = False,
+    layer: Optional[FastTextLayer] = None
+) -> Iterator[Tuple[int, str, bool]]:
+    """📄 Gerar (página, texto, prefiltrada) em ordem, uma página por vez
+
+    Backends rápidos resolvem o intervalo de uma vez; páginas sem texto
+    aproveitável passam por pdfplumber (aberto só se necessário) e, se ainda
+    vazias, por OCR. Com `prefilter`, páginas cujo texto nativo não tem
+    nenhuma palavra-chave ficam com o texto bruto (sem pdfplumber/OCR).
+    `layer` reaproveita o texto nativo já extraído pelo prefiltro.
+    Todo texto sai normalizado (NFC, espaços, hifenização).
+    """
+    if page_numbers is None:
+        page_numbers = range(layer.page_count if layer else count_pages(pdf_content))
+    page_numbers = list(page_numbers)
+
+    fast_texts, raw_texts = _fast_page_texts(pdf_content, page_numbers, layer)
+
+    with ExitStack() as stack:
+        pdf = None
+
+        for page_number in page_numbers:
+            raw_text = raw_texts.get(page_number) or ""
+
+            if prefilter and len(raw_text.strip()) >= 50 and not may_contain_keywords(raw_text):
+                yield page_number, _normalized(fast_texts.get(page_number, raw_text)), True
+                continue
+
+            if page_number in fast_texts:
+                yield page_number, _normalized(fast_texts.pop(page_number)), False
+                continue
+
+            if pdf is None:
+                pdf = stack.enter_context(pdfplumber.open(open_pdf_stream(pdf_content)))
+
+            page = pdf.pages[page_number]
+            try:
+                page_text = page.extract_text() or ""
+
+                # Página escaneada: OCR apenas nela
+                if len(page_text.strip()) < 50:
+                    img = page.to_image(resolution=300)
+                    page_text = recognize_page(img.original)
+            except Exception as e:
+                logger.warning(f"Extraction failed for page {page_number}: {e}")
+                page_text = ""
+            finally:
+                page.flush_cache()
+
+            yield page_number, _normalized(page_text), False
+
+# Pool de extração reaproveitado entre documentos: os processos sobem uma única vez
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+
+def _pool_context():
+    """🧬 forkserver (ou spawn): o processo principal tem threads vivas e não deve ser forkado"""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def get_extraction_pool(max_workers: int) -> ProcessPoolExecutor:
+    """🏊 Pool de processos compartilhado (criado no primeiro PDF grande, com `max_workers` processos)"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(max_workers=max(1, max_workers), mp_context=_pool_context())
+        return _extraction_pool
+
+def shutdown_extraction_pool(pool: Optional[ProcessPoolExecutor] = None):
+    """🔒 Encerrar o pool compartilhado (ou só descartá-lo, se `pool` já foi substituído)"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if pool is not None and pool is not _extraction_pool:
+            return
+        pool, _extraction_pool = _extraction_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _attach_segment(segment_name: str) -> shared_memory.SharedMemory:
+    """🔗 Anexar ao segmento do processo principal sem registrá-lo no resource_tracker
+
+    O dono (processo principal) registra e remove o segmento. Até o 3.12 o
+    attach também chamava `register`, e um worker não deve mexer nesse
+    registro: o tracker é o mesmo do processo principal, e um `unregister`
+    aqui apagaria o registro do dono antes do `unlink` dele.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=segment_name, track=False)
+
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None  # worker do pool: uma tarefa por vez
+    try:
+        return shared_memory.SharedMemory(name=segment_name)
+    finally:
+        resource_tracker.register = register
+
+def _extract_pages_worker(
+    segment_name: str,
+    size: int,
+    page_numbers: List[int],
+    prefilter: bool,
+    layer: Optional[FastTextLayer] = None
+) -> List[Tuple[int, str, bool]]:
+    """👷 Extrair texto de um intervalo de páginas (executa em processo separado)
+
+    O PDF é lido do segmento compartilhado, anexado só durante a tarefa: os
+    processos do pool atendem vários documentos.
+    """
+    segment = _attach_segment(segment_name)
+    try:
+        pdf_content = segment.buf[:size]
+        try:
+            return list(iter_page_texts(pdf_content, page_numbers, prefilter=prefilter, layer=layer))
+        finally:
+            pdf_content.release()
+    finally:
+        segment.close()
+
+@contextmanager
+def _shared_pdf(pdf_content: PdfSource) -> Iterator[Tuple[str, int]]:
+    """🔗 Segmento com o PDF (nome, tamanho) durante o bloco
+
+    PDFs baixados direto para o pool já estão num segmento e são usados sem
+    cópia; bytes comuns são copiados uma única vez para um segmento temporário.
+    """
+    if isinstance(pdf_content, SharedBuffer):
+        yield pdf_content.name, len(pdf_content)
+        return
+
+    size = len(pdf_content)
+    segment = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        segment.buf[:size] = pdf_content
+        yield segment.name, size
+    finally:
+        segment.close()
+        segment.unlink()
+
+def _split_pages(page_numbers: Sequence[int], chunk_size: int) -> List[List[int]]:
+    """✂️ Dividir páginas (em ordem) em blocos de até `chunk_size` páginas"""
+    chunk_size = max(1, chunk_size)
+    page_numbers = list(page_numbers)
+    return [page_numbers[start:start + chunk_size] for start in range(0, len(page_numbers), chunk_size)]
+
+def iter_pages_parallel(
+    pdf_content: PdfSource,
+    max_workers: int,
+    chunk_size: Optional[int] = None,
+    prefilter: Optional[bool] = None,
+    layer: Optional[FastTextLayer] = None
+) -> Iterator[Tuple[int, str, bool]]:
+    """📚 Extrair páginas em paralelo, gerando (página, texto, prefiltrada) em ordem
+
+    Os workers (pool de processos único, reaproveitado entre documentos) leem
+    o PDF de um segmento de memória compartilhada (sem cópia por processo via
+    pickle) e processam blocos pequenos, então as primeiras
+    páginas já podem ser parseadas enquanto as seguintes ainda estão sendo
+    extraídas. Documentos curtos são divididos entre todos os workers. Com
+    `layer`, páginas já resolvidas pelo backend rápido não vão para os workers.
+    """
+    if prefilter is None:
+        prefilter = settings.keyword_prefilter
+
+    page_count = layer.page_count if layer else count_pages(pdf_content)
+    if page_count == 0:
+        return
+
+    if layer is not None:
+        # Páginas prontas são intercaladas, em ordem, com os blocos dos workers
+        ready = iter(sorted(layer.texts))
+        pending = layer.missing
+        next_ready = next(ready, None)
+
+        def ready_before(limit: int) -> Iterator[Tuple[int, str, bool]]:
+            nonlocal next_ready
+            while next_ready is not None and next_ready < limit:
+                yield next_ready, _normalized(layer.texts[next_ready]), False
+                next_ready = next(ready, None)
+
+        for page_number, text, prefiltered in _iter_pending_pages(
+            pdf_content, pending, max_workers, chunk_size, prefilter, layer
+        ):
+            yield from ready_before(page_number)
+            yield page_number, text, prefiltered
+        yield from ready_before(page_count)
+        return
+
+    yield from _iter_pending_pages(pdf_content, range(page_count), max_workers, chunk_size, prefilter, None)
+
+def _iter_pending_pages(
+    pdf_content: PdfSource,
+    page_numbers: Sequence[int],
+    max_workers: int,
+    chunk_size: Optional[int],
+    prefilter: bool,
+    layer: Optional[FastTextLayer]
+) -> Iterator[Tuple[int, str, bool]]:
+    """👷 Páginas pedidas divididas em blocos entre os workers, em ordem"""
+    page_numbers = list(page_numbers)
+    if not page_numbers:
+        return
+
+    chunk_size = chunk_size or settings.pdf_stream_chunk_pages
+    chunk_size = min(chunk_size, -(-len(page_numbers) // max(1, max_workers)))
+    chunks = _split_pages(page_numbers, chunk_size)
+    workers = max(1, min(max_workers, len(chunks)))
+
+    def chunk_layer(chunk: List[int]) -> Optional[FastTextLayer]:
+        return layer.subset(chunk) if layer else None
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from iter_page_texts(pdf_content, chunk, prefilter=prefilter, layer=chunk_layer(chunk))
+        return
+
+    executor = get_extraction_pool(max_workers)
+
+    with _shared_pdf(pdf_content) as (segment_name, size):
+        def submit(chunk: List[int]):
+            return executor.submit(_extract_pages_worker, segment_name, size, chunk, prefilter, chunk_layer(chunk))
+
+        # Poucos blocos adiantados: resultados não se acumulam se o consumidor for mais lento
+        remaining = iter(chunks)
+        in_flight = deque(submit(chunk) for chunk in islice(remaining, workers * 2))
+
+        try:
+            while in_flight:
+                chunk_result = in_flight.popleft().result()
+
+                next_chunk = next(remaining, None)
+                if next_chunk is not None:
+                    in_flight.append(submit(next_chunk))
+
+                yield from chunk_result
+        except BrokenProcessPool:
+            # Um worker morreu: o próximo documento sobe um pool novo
+            shutdown_extraction_pool(executor)
+            raise
+        finally:
+            # Consumidor parou no meio (ou erro): o segmento só some depois que os workers o soltarem
+            for future in in_flight:
+                future.cancel()
+            for future in in_flight:
+                if not future.cancelled():
+                    try:
+                        future.result()
+                    except Exception:
+                        pass
+
+    logger.debug("Parallel PDF extraction finished", pages=len(page_numbers), workers=workers)
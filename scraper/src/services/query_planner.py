@@ -0,0 +1,108 @@
+"""🗺️ Planejador de consultas: divide a busca do dia em sub-consultas paralelizáveis"""
+
+from typing import List
+
+import structlog
+
+from ..config.settings import settings
+from ..models.search_query import ScrapeProfile, SearchQuery
+
+logger = structlog.get_logger(__name__)
+
+def split_search_terms(search_terms: str) -> List[str]:
+    """✂️ Separar os ramos 'OU' de nível superior da expressão de busca do DJE
+
+    '"RPV" OU "precatório"' vira duas buscas independentes; 'OU' dentro de
+    aspas ou parênteses não é dividido. Expressões só com 'E' ficam inteiras.
+    """
+    branches = []
+    current = []
+    depth = 0
+    in_quotes = False
+    tokens = search_terms.split(' ')
+
+    for token in tokens:
+        if depth == 0 and not in_quotes and token == 'OU':
+            branches.append(' '.join(current))
+            current = []
+            continue
+
+        current.append(token)
+        for char in token:
+            if char == '"':
+                in_quotes = not in_quotes
+            elif not in_quotes and char == '(':
+                depth += 1
+            elif not in_quotes and char == ')':
+                depth = max(0, depth - 1)
+
+    branches.append(' '.join(current))
+    return [branch.strip() for branch in branches if branch.strip()]
+
+def load_scrape_profiles() -> List[ScrapeProfile]:
+    """🧭 Perfis configurados em SCRAPE_PROFILES
+
+    Sem perfis explícitos, cada caderno particionado vira um perfil com os
+    termos de SEARCH_TERMS (comportamento de perfil único).
+    """
+    configured = [ScrapeProfile.from_dict(data) for data in settings.get_scrape_profiles()]
+    if configured:
+        return configured
+
+    cadernos = settings.get_partition_cadernos()
+    return [
+        ScrapeProfile(
+            name="default" if len(cadernos) == 1 else f"caderno-{caderno}",
+            caderno=caderno,
+            search_terms=settings.search_terms
+        )
+        for caderno in cadernos
+    ]
+
+def scrape_mode() -> str:
+    """🧭 Modo de paginação da busca do dia: "partitioned" (sub-consultas) ou "search" (busca única)
+
+    Gravado no checkpoint: as páginas concluídas de um modo não valem no outro.
+    """
+    if settings.query_partitioning or settings.get_scrape_profiles():
+        return "partitioned"
+    return "search"
+
+def plan_search_queries() -> List[SearchQuery]:
+    """🗺️ Sub-consultas iniciais: perfil (caderno) × variante de termos × primeiro bloco de páginas
+
+    Os blocos seguintes de cada busca são gerados sob demanda pelo scraper,
+    assim que o bloco anterior confirma que a página inicial existe.
+    """
+    profiles = load_scrape_profiles()
+    explicit_variants = settings.get_search_term_variants()
+
+    block_size = settings.query_page_block_size
+    end_page = block_size if block_size > 0 else None
+
+    queries = []
+    for profile in profiles:
+        # SEARCH_TERM_VARIANTS substitui a divisão automática de SEARCH_TERMS
+        if explicit_variants and profile.search_terms == settings.search_terms:
+            variants = explicit_variants
+        else:
+            variants = split_search_terms(profile.search_terms)
+
+        queries.extend(
+            SearchQuery(
+                caderno=profile.caderno,
+                search_terms=terms,
+                start_page=1,
+                end_page=end_page,
+                profile=profile.name
+            )
+            for terms in variants
+        )
+
+    logger.info(
+        "Search queries planned",
+        profiles=[profile.name for profile in profiles],
+        page_block_size=block_size,
+        queries=len(queries)
+    )
+    return queries
@@ -0,0 +1,62 @@
+"""🔄 Consumir geradores bloqueantes a partir do event loop"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+async def iterate_in_thread(
+    factory: Callable[[], Iterator[T]],
+    max_buffer: int = 32
+) -> AsyncIterator[T]:
+    """🔄 Rodar `factory()` numa thread e entregar os itens de forma assíncrona
+
+    A fila é limitada: se o consumidor atrasar, o produtor espera (o gerador
+    não é adiantado além de `max_buffer` itens). Exceções do gerador são
+    relançadas no consumidor; ao encerrar cedo, o gerador é fechado.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+    stop = threading.Event()
+
+    def put(item, error=None):
+        asyncio.run_coroutine_threadsafe(queue.put((item, error)), loop).result()
+
+    def produce():
+        iterator = factory()
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    break
+                put(item)
+        except BaseException as e:
+            put(_DONE, e)
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+        put(_DONE)
+
+    producer = loop.run_in_executor(None, produce)
+
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        stop.set()
+        # Liberar o produtor caso esteja bloqueado numa fila cheia
+        while not producer.done():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                await asyncio.sleep(0.01)
+        await producer
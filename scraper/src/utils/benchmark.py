@@ -0,0 +1,291 @@
+"""⏱️ Benchmarks dos estágios de extração (rodados via CLI: `benchmark ...`)"""
+
+import difflib
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pdfplumber
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+def _render_pages(pdf_path: Path, max_pages: Optional[int], resolution: int) -> List[Any]:
+    """🖼️ Renderizar páginas uma única vez (fora da medição)"""
+    images = []
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = pdf.pages[:max_pages] if max_pages else pdf.pages
+        for page in pages:
+            images.append(page.to_image(resolution=resolution).original)
+            page.flush_cache()
+    return images
+
+def collect_pdfs(paths: Sequence[Path]) -> List[Path]:
+    """📂 PDFs gravados (arquivos ou diretórios com *.pdf)"""
+    pdfs = []
+    for path in paths:
+        pdfs.extend(sorted(path.glob("*.pdf")) if path.is_dir() else [path])
+    return pdfs
+
+def _normalize_whitespace(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+def benchmark_ocr(
+    pdf_path: Path,
+    engines: Sequence[str] = ("pytesseract", "tesserocr"),
+    max_pages: Optional[int] = 5,
+    resolution: int = 300
+) -> List[Dict[str, Any]]:
+    """🔠 Páginas/s de cada motor de OCR sobre as mesmas imagens
+
+    A criação do motor (carga do modelo) é medida à parte: no tesserocr ela
+    acontece uma vez por processo, no pytesseract a cada página.
+    """
+    from ..services.ocr_engine import create_ocr_engine
+
+    images = _render_pages(pdf_path, max_pages, resolution)
+    results = []
+
+    for name in engines:
+        try:
+            started_at = time.perf_counter()
+            engine = create_ocr_engine(name)
+            setup_time = time.perf_counter() - started_at
+        except Exception as e:
+            logger.warning("OCR engine unavailable for benchmark", engine=name, error=str(e))
+            results.append({"engine": name, "error": str(e)})
+            continue
+
+        try:
+            chars = 0
+            started_at = time.perf_counter()
+            for image in images:
+                chars += len(engine.image_to_string(image))
+            elapsed = time.perf_counter() - started_at
+        except Exception as e:
+            logger.warning("OCR benchmark failed", engine=name, error=str(e))
+            results.append({"engine": name, "error": str(e)})
+            continue
+        finally:
+            engine.close()
+
+        results.append({
+            "engine": name,
+            "pages": len(images),
+            "setup_time": setup_time,
+            "seconds": elapsed,
+            "pages_per_sec": len(images) / elapsed if elapsed else 0.0,
+            "chars": chars
+        })
+
+    return results
+
+def benchmark_ocr_preprocessing(pdf_path: Path, max_pages: Optional[int] = 5, resolution: int = 300) -> List[Dict[str, Any]]:
+    """🖼️ OCR da página inteira vs. recorte + 1 bit + colunas paralelas (motor configurado)"""
+    from ..services.ocr_engine import get_ocr_engine
+    from ..services.ocr_preprocess import prepare_regions, recognize_page
+
+    images = _render_pages(pdf_path, max_pages, resolution)
+    engine = get_ocr_engine()
+    results = []
+
+    modes = (
+        ("full page", lambda image: engine.image_to_string(image), lambda image: image.width * image.height),
+        ("preprocessed", recognize_page, lambda image: sum(r.width * r.height for r, _ in prepare_regions(image)))
+    )
+
+    for mode, recognize, count_pixels in modes:
+        pixels = sum(count_pixels(image) for image in images)
+        try:
+            chars = 0
+            started_at = time.perf_counter()
+            for image in images:
+                chars += len(recognize(image))
+            elapsed = time.perf_counter() - started_at
+        except Exception as e:
+            logger.warning("OCR preprocessing benchmark failed", mode=mode, error=str(e))
+            results.append({"mode": mode, "pixels": pixels, "error": str(e)})
+            continue
+
+        results.append({
+            "mode": mode,
+            "engine": engine.name,
+            "pages": len(images),
+            "pixels": pixels,
+            "seconds": elapsed,
+            "pages_per_sec": len(images) / elapsed if elapsed else 0.0,
+            "chars": chars
+        })
+
+    return results
+
+def benchmark_pdf_text(pdf_paths: Sequence[Path], backends: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """📄 Throughput de cada backend de texto e igualdade com o baseline pdfplumber
+
+    `equal_pages` compara o texto com espaços normalizados; `similarity` é a
+    média do SequenceMatcher por página; `quality_ok` conta páginas aceitas
+    pelo filtro de qualidade usado na seleção fast-first.
+    """
+    from ..services.pdf_text import PDF_TEXT_BACKENDS, PdfplumberBackend, text_quality_ok
+
+    documents = [path.read_bytes() for path in collect_pdfs(pdf_paths)]
+    names = list(backends or PDF_TEXT_BACKENDS)
+
+    baseline = [PdfplumberBackend().extract_pages(content) for content in documents]
+    results = []
+
+    for name in names:
+        try:
+            backend = PDF_TEXT_BACKENDS[name]()
+        except (KeyError, RuntimeError) as e:
+            results.append({"backend": name, "error": str(e) or "unknown backend"})
+            continue
+
+        try:
+            started_at = time.perf_counter()
+            extracted = [backend.extract_pages(content) for content in documents]
+            elapsed = time.perf_counter() - started_at
+        except Exception as e:
+            logger.warning("PDF text benchmark failed", backend=name, error=str(e))
+            results.append({"backend": name, "error": str(e)})
+            continue
+
+        pages = equal_pages = quality_ok = 0
+        similarity = 0.0
+        for document_pages, baseline_pages in zip(extracted, baseline):
+            for text, expected in zip(document_pages, baseline_pages):
+                text, expected = _normalize_whitespace(text), _normalize_whitespace(expected)
+                pages += 1
+                equal_pages += text == expected
+                quality_ok += text_quality_ok(text, min_length=50)
+                similarity += difflib.SequenceMatcher(None, text, expected).ratio()
+
+        results.append({
+            "backend": name,
+            "pages": pages,
+            "seconds": elapsed,
+            "pages_per_sec": pages / elapsed if elapsed else 0.0,
+            "equal_pages": equal_pages,
+            "similarity": similarity / pages if pages else 0.0,
+            "quality_ok": quality_ok
+        })
+
+    return results
+
+def _publication_fields(publication) -> Optional[tuple]:
+    if publication is None:
+        return None
+    return (
+        publication.process_number, publication.authors, publication.lawyers,
+        publication.main_value, publication.interest_value, publication.legal_fees
+    )
+
+def benchmark_section_parsing(pdf_paths: Sequence[Path], repeat: int = 1) -> List[Dict[str, Any]]:
+    """🐼 Seções/s do parser por seção vs. parse vetorizado com pandas
+
+    As seções dos PDFs gravados são repetidas `repeat` vezes para simular um
+    dia (ou intervalo de backfill) maior; `matching` conta seções com campos
+    idênticos aos do parser por seção.
+    """
+    import asyncio
+
+    from ..services.batch_parser import parse_sections_batch
+    from ..services.dje_scraper import DJEScraper, PROCESS_START_PATTERN
+    from ..services.pdf_text import iter_page_texts
+
+    sections = []
+    for path in collect_pdfs(pdf_paths):
+        text = "\n".join(page_text for _, page_text, _ in iter_page_texts(path.read_bytes()))
+        starts = [match.start() for match in PROCESS_START_PATTERN.finditer(text)]
+        sections.extend(text[start:end] for start, end in zip(starts, starts[1:] + [len(text)]))
+    sections *= max(1, repeat)
+
+    async def per_section():
+        scraper = DJEScraper()
+        try:
+            return [await scraper._extract_single_publication_from_text(section, None) for section in sections]
+        finally:
+            await scraper.close()
+
+    started_at = time.perf_counter()
+    baseline = asyncio.run(per_section())
+    per_section_time = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    batch = parse_sections_batch(sections, [None] * len(sections), [None] * len(sections))
+    batch_time = time.perf_counter() - started_at
+
+    expected = [_publication_fields(publication) for publication in baseline]
+    matching = sum(_publication_fields(publication) == fields for publication, fields in zip(batch, expected))
+
+    return [
+        {
+            "mode": mode,
+            "sections": len(sections),
+            "seconds": elapsed,
+            "sections_per_sec": len(sections) / elapsed if elapsed else 0.0,
+            "matching": matching if mode == "pandas batch" else len(sections)
+        }
+        for mode, elapsed in (("per-section", per_section_time), ("pandas batch", batch_time))
+    ]
+
+# Início comum das seções de estresse: número do processo e palavras-chave obrigatórias
+_STRESS_HEADER = "Processo 0001234-56.2024.8.26.0053 - RPV - pagamento pelo INSS - Vistos.\n"
+
+def _stress_sections(chars: int, seed: int) -> Dict[str, str]:
+    """🧨 Seções sintéticas de `chars` caracteres que exercitam os piores casos das regexes"""
+    import random
+
+    rng = random.Random(seed)
+    sample = (
+        "Cumprimento de Sentença contra a Fazenda Pública - Auxílio-Doença - José da Silva - "
+        "Vistos. Valor principal bruto de R$ 12.345,67 - juros moratórios e correção monetária "
+        "conforme cálculo - honorários advocatícios - ADV: FULANO DE TAL (OAB 123456/SP)\n"
+    )
+    noise = "abcdefghijklmnopqrstuvwxyzáçãõé -.,:$R0123456789"
+
+    def repeat(text: str) -> str:
+        return (text * (chars // len(text) + 1))[:chars]
+
+    return {
+        # Termos iniciais de padrões com lacuna e nenhum "R$" para fechar o match
+        "lazy gaps": repeat("valor principal juros correção honorários verba honorária "),
+        # Páginas coladas sem quebras de linha (OCR/extração sem layout)
+        "merged lines": repeat(sample.replace("\n", " ")),
+        # Cadeias de palavras entre hífens que quase formam "- Nome - Vistos"
+        "author run": repeat("- Maria Aparecida dos Santos Oliveira "),
+        "ocr noise": "".join(rng.choice(noise) for _ in range(chars)),
+    }
+
+def benchmark_parse_stress(sizes: Sequence[int], seed: int = 0) -> List[Dict[str, Any]]:
+    """🧨 Tempo do parser por seção em seções enormes e ruidosas
+
+    Mede o pior caso de cada seção e quantas esgotaram o orçamento de tempo
+    (`PARSE_TIME_BUDGET_MS`); `parsed` indica se a publicação saiu mesmo assim.
+    """
+    import asyncio
+
+    from ..services.dje_scraper import DJEScraper
+
+    async def run() -> List[Dict[str, Any]]:
+        scraper = DJEScraper()
+        rows = []
+        try:
+            for chars in sizes:
+                for case, body in _stress_sections(chars, seed).items():
+                    over_budget = scraper._sections_over_budget
+                    started_at = time.perf_counter()
+                    publication = await scraper._extract_single_publication_from_text(_STRESS_HEADER + body, None)
+                    rows.append({
+                        "case": case,
+                        "chars": chars,
+                        "seconds": time.perf_counter() - started_at,
+                        "over_budget": scraper._sections_over_budget > over_budget,
+                        "parsed": publication is not None
+                    })
+        finally:
+            await scraper.close()
+        return rows
+
+    return asyncio.run(run())
@@ -0,0 +1,89 @@
+"""💾 Persistência local de checkpoints de execução"""
+
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, List
+import structlog
+
+from ..config.settings import settings
+from ..models.publication import ExecutionCheckpoint
+
+logger = structlog.get_logger(__name__)
+
+class CheckpointStore:
+    """💾 Armazena checkpoints em arquivos JSON (um por execução)"""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or settings.checkpoint_dir)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path_for(self, execution_id: int) -> Path:
+        """📁 Caminho do arquivo de checkpoint da execução"""
+        return self.directory / f"execution_{execution_id}.json"
+
+    def save(self, checkpoint: ExecutionCheckpoint):
+        """💾 Gravar checkpoint de forma atômica (tmp + rename)"""
+        checkpoint.updated_at = datetime.now()
+        path = self._path_for(checkpoint.execution_id)
+        tmp_path = path.with_suffix(".json.tmp")
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        logger.debug(
+            "Checkpoint saved",
+            execution_id=checkpoint.execution_id,
+            last_completed_page=checkpoint.last_completed_page,
+            processed_pdfs=len(checkpoint.processed_pdf_keys)
+        )
+
+    def load(self, execution_id: int) -> Optional[ExecutionCheckpoint]:
+        """📂 Carregar checkpoint de uma execução"""
+        path = self._path_for(execution_id)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return ExecutionCheckpoint.from_dict(json.load(f))
+        except (ValueError, KeyError) as e:
+            logger.warning("Invalid checkpoint file", path=str(path), error=str(e))
+            return None
+
+    def list_checkpoints(self) -> List[ExecutionCheckpoint]:
+        """📋 Listar checkpoints existentes (mais recentes primeiro)"""
+        checkpoints = []
+        for path in self.directory.glob("execution_*.json"):
+            try:
+                execution_id = int(path.stem.split("_", 1)[1])
+            except ValueError:
+                continue
+            checkpoint = self.load(execution_id)
+            if checkpoint:
+                checkpoints.append(checkpoint)
+
+        return sorted(
+            checkpoints,
+            key=lambda c: c.updated_at or datetime.min,
+            reverse=True
+        )
+
+    def find_resumable(self, target_date: Optional[date] = None) -> Optional[ExecutionCheckpoint]:
+        """🔁 Buscar o checkpoint retomável mais recente (opcionalmente por data)"""
+        for checkpoint in self.list_checkpoints():
+            if not checkpoint.is_resumable():
+                continue
+            if target_date and checkpoint.target_date != target_date:
+                continue
+            return checkpoint
+        return None
+
+    def delete(self, execution_id: int):
+        """🗑️ Remover checkpoint de uma execução concluída"""
+        path = self._path_for(execution_id)
+        if path.exists():
+            path.unlink()
+            logger.debug("Checkpoint removed", execution_id=execution_id)
@@ -0,0 +1,94 @@
+"""⚓ Âncoras de palavras-chave encontradas numa única passada sobre o texto"""
+
+import re
+from typing import Dict, List, Optional
+
+from .regex_budget import ParseBudget
+from .text_normalize import FoldedText
+
+# Nome da âncora → padrão em minúsculas, casado contra a cópia case-folded do texto.
+# Cada padrão de extração exige pelo menos uma destas âncoras no trecho casado.
+ANCHOR_PATTERNS = {
+    'rpv': r'\brpv\b',
+    'inss_payment': r'pagamento pelo inss',
+    'principal': r'principal',
+    'importe': r'importe total de',
+    'juros': r'juros',
+    'correcao': r'correção',
+    'honorarios': r'honorári',
+    'currency': r'r\$',
+    'adv': r'adv:',
+    'vistos': r'vistos',
+}
+
+ANCHOR_REGEX = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in ANCHOR_PATTERNS.items())
+)
+
+class AnchorHits:
+    """⚓ Posições de cada âncora num texto (resultado de `scan_anchors`)
+
+    Posições e buscas se referem a `folded`; use `group()` para recuperar o
+    trecho original de um grupo casado.
+    """
+
+    __slots__ = ('source', 'offsets')
+
+    def __init__(self, source: FoldedText, offsets: Dict[str, List[int]]):
+        self.source = source
+        self.offsets = offsets
+
+    @property
+    def text(self) -> str:
+        return self.source.text
+
+    @property
+    def folded(self) -> str:
+        return self.source.folded
+
+    def has(self, *names: str) -> bool:
+        """✅ Alguma das âncoras aparece no texto"""
+        return any(name in self.offsets for name in names)
+
+    def first(self, *names: str) -> Optional[int]:
+        """📍 Primeira ocorrência de qualquer uma das âncoras"""
+        positions = [self.offsets[name][0] for name in names if name in self.offsets]
+        return min(positions) if positions else None
+
+    def last(self, *names: str) -> Optional[int]:
+        """📍 Última ocorrência de qualquer uma das âncoras"""
+        positions = [self.offsets[name][-1] for name in names if name in self.offsets]
+        return max(positions) if positions else None
+
+    def search(
+        self,
+        pattern: 're.Pattern',
+        *names: str,
+        budget: Optional[ParseBudget] = None
+    ) -> Optional['re.Match']:
+        """🔍 `pattern.search` em `folded` a partir da linha da primeira âncora (None sem âncora)
+
+        Vale para padrões cujo trecho antes da âncora não atravessa quebras de
+        linha: o match mais à esquerda começa na linha de alguma ocorrência da
+        âncora, portanto nunca antes da linha da primeira. Com `budget`, a
+        busca é interrompida quando o prazo da seção esgota.
+        """
+        offset = self.first(*names)
+        if offset is None:
+            return None
+        start = self.folded.rfind('\n', 0, offset) + 1
+        if budget is not None:
+            return budget.search(pattern, self.folded, start)
+        return pattern.search(self.folded, start)
+
+    def group(self, match: 're.Match', index: int = 1) -> str:
+        """🎯 Grupo de um match sobre `folded`, no texto original"""
+        return self.source.group(match, index)
+
+def scan_anchors(text: str) -> AnchorHits:
+    """⚓ Encontrar todas as âncoras com uma única varredura da cópia case-folded"""
+    source = FoldedText(text or "")
+    offsets: Dict[str, List[int]] = {}
+    for match in ANCHOR_REGEX.finditer(source.folded):
+        offsets.setdefault(match.lastgroup, []).append(match.start())
+    return AnchorHits(source, offsets)
@@ -0,0 +1,71 @@
+"""🗃️ Cache LRU limitado com contadores de acerto"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+class BoundedLRUCache:
+    """🗃️ Cache LRU com tamanho máximo e estatísticas de hit/miss"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """🔍 Buscar valor (move para o fim da fila LRU)"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """➕ Inserir valor, descartando o menos usado se necessário"""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """🧹 Limpar cache e estatísticas"""
+        with self._lock:
+            self._data.clear()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """🔄 Zerar contadores (por execução)"""
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """📈 Taxa de acerto em %"""
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> dict:
+        """📊 Estatísticas do cache"""
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate
+        }
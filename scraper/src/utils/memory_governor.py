@@ -0,0 +1,142 @@
+"""🧮 Orçamento de memória em trânsito no pipeline (download → texto → upload)"""
+
+import asyncio
+import sys
+from typing import Callable, Dict, Iterable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Estágios contabilizados, do mais a montante para o mais a jusante
+STAGES = ("downloads", "text", "page_cache", "publications")
+
+# Estágios que liberam memória sem depender de quem espera: downloads e uploads
+# em andamento em outras tarefas. Texto pode estar preso pela própria tarefa
+# que pede um novo download e o cache de páginas só sai por despejo.
+IN_FLIGHT_STAGES = ("downloads", "publications")
+
+def text_size(text: str) -> int:
+    """📏 Bytes ocupados por uma string"""
+    return sys.getsizeof(text)
+
+def publications_size(publications: Iterable) -> int:
+    """📏 Estimativa de bytes de publicações (campos de texto dominam)"""
+    total = 0
+    for publication in publications:
+        total += sys.getsizeof(publication.full_content or "")
+        total += sum(sys.getsizeof(name) for name in publication.authors + publication.lawyers)
+    return total
+
+class MemoryGovernor:
+    """🧮 Bytes retidos por estágio, com backpressure nos downloads
+
+    Cada estágio registra o que segura (`track`) e o que solta (`release`).
+    A admissão de novos downloads olha o total de todos os estágios: acima do
+    orçamento, caches registrados com `add_reclaimer` são despejados primeiro
+    e, se ainda faltar espaço, `wait_for_capacity` espera até que downloads ou
+    uploads em andamento liberem memória. Sem nada em andamento o próximo
+    download é liberado mesmo acima do orçamento: o texto retido pode ser da
+    própria tarefa que espera, e ela só o solta depois de avançar.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._held: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self._reclaimers: Dict[str, Callable[[int], int]] = {}
+        self._condition = asyncio.Condition()
+        self._waiting = 0
+        self._reclaiming = False
+
+        self.high_water = 0
+        self.waits = 0
+        self.reclaimed = 0
+
+    @property
+    def held(self) -> int:
+        """📦 Total retido por todos os estágios"""
+        return sum(self._held.values())
+
+    def held_by(self, stage: str) -> int:
+        return self._held[stage]
+
+    def _over_budget(self) -> bool:
+        return self.budget_bytes > 0 and self.held >= self.budget_bytes
+
+    def _in_flight(self) -> bool:
+        return any(self._held[stage] > 0 for stage in IN_FLIGHT_STAGES)
+
+    def add_reclaimer(self, stage: str, evict: Callable[[int], int]):
+        """♻️ Registrar um cache despejável: `evict(nbytes)` solta até nbytes e retorna o que soltou"""
+        self._reclaimers[stage] = evict
+
+    def _reclaim(self):
+        """♻️ Despejar caches até voltar ao orçamento (chamado sob pressão)"""
+        if self._reclaiming or not self._over_budget():
+            return
+
+        self._reclaiming = True
+        try:
+            for stage, evict in self._reclaimers.items():
+                excess = self.held - self.budget_bytes + 1
+                if excess <= 0:
+                    break
+                freed = min(evict(excess), self._held[stage])
+                self._held[stage] -= freed
+                self.reclaimed += freed
+        finally:
+            self._reclaiming = False
+
+    def track(self, stage: str, nbytes: int):
+        """➕ Registrar bytes retidos por um estágio (caches são despejados se estourar)"""
+        self._held[stage] += nbytes
+        self._reclaim()
+        self.high_water = max(self.high_water, self.held)
+
+    def release(self, stage: str, nbytes: int):
+        """➖ Liberar bytes de um estágio e acordar downloads em espera"""
+        self._held[stage] = max(0, self._held[stage] - nbytes)
+        if self._waiting:
+            asyncio.ensure_future(self._notify())
+
+    async def _notify(self):
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _must_wait(self) -> bool:
+        self._reclaim()
+        return self._over_budget() and self._in_flight()
+
+    async def wait_for_capacity(self):
+        """⏳ Aguardar orçamento (total de todos os estágios) antes de iniciar um novo download"""
+        if not self._must_wait():
+            return
+
+        self.waits += 1
+        logger.info(
+            "Memory budget reached - waiting before next download",
+            held_mb=round(self.held / 1024 / 1024, 1),
+            budget_mb=round(self.budget_bytes / 1024 / 1024, 1)
+        )
+        self._waiting += 1
+        try:
+            async with self._condition:
+                await self._condition.wait_for(lambda: not self._must_wait())
+        finally:
+            self._waiting -= 1
+
+    def reset_stats(self):
+        """🔄 Zerar pico, esperas e despejos (por execução; bytes retidos são mantidos)"""
+        self.high_water = self.held
+        self.waits = 0
+        self.reclaimed = 0
+
+    def get_stats(self) -> dict:
+        """📊 Estatísticas do orçamento"""
+        return {
+            "budget_bytes": self.budget_bytes,
+            "held": dict(self._held),
+            "high_water": self.high_water,
+            "waits": self.waits,
+            "reclaimed": self.reclaimed
+        }
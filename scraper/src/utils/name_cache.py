@@ -0,0 +1,36 @@
+"""🪪 Normalização de nomes (autores/advogados) memoizada e com strings internadas"""
+
+import sys
+from typing import Callable, Optional
+
+from ..config.settings import settings
+from .lru_cache import BoundedLRUCache
+
+_name_cache: Optional[BoundedLRUCache] = None
+
+def get_name_cache() -> BoundedLRUCache:
+    """🪪 Cache compartilhado (nome bruto → nome canônico)"""
+    global _name_cache
+
+    if _name_cache is None:
+        _name_cache = BoundedLRUCache(max_size=settings.name_cache_size)
+
+    return _name_cache
+
+def normalize_name(kind: str, raw: str, normalizer: Callable[[str], str]) -> str:
+    """🪪 `normalizer(raw)` uma vez por nome bruto; o resultado é internado
+
+    Os mesmos advogados (com OAB) e autores se repetem em centenas de seções
+    por dia: as repetições devolvem a mesma string canônica, sem refazer
+    regex/capitalização nem manter uma cópia por publicação. `kind` separa
+    normalizações diferentes aplicadas ao mesmo texto bruto.
+    """
+    cache = get_name_cache()
+    key = (kind, raw)
+
+    canonical = cache.get(key)
+    if canonical is None:
+        canonical = sys.intern(normalizer(raw))
+        cache.put(key, canonical)
+
+    return canonical
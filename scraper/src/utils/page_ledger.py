@@ -0,0 +1,88 @@
+"""📒 Registro de páginas do diário já processadas (scraping incremental)"""
+
+import hashlib
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+import structlog
+
+from ..config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+class PageLedger:
+    """📒 Páginas processadas para uma data, com hash do conteúdo do PDF
+
+    As chaves são as mesmas do checkpoint (cdVolume:nuDiario:cdCaderno:nuSeqpagina),
+    então edições extras do mesmo dia (outro nuDiario) entram como páginas novas.
+    Com `incremental=True` páginas já conhecidas não são baixadas novamente.
+    """
+
+    def __init__(
+        self,
+        target_date: date,
+        incremental: bool = False,
+        directory: Optional[str] = None
+    ):
+        self.target_date = target_date
+        self.incremental = incremental
+        self.directory = Path(directory or settings.checkpoint_dir)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"ledger_{target_date.isoformat()}.json"
+
+        self.pages: Dict[str, str] = self._load()
+        self.skipped_pages = 0
+
+    def _load(self) -> Dict[str, str]:
+        """📂 Carregar registro persistido"""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f).get("pages", {})
+        except ValueError as e:
+            logger.warning("Invalid page ledger, starting empty", path=str(self.path), error=str(e))
+            return {}
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """#️⃣ Hash do conteúdo do PDF"""
+        return hashlib.sha1(content).hexdigest()
+
+    def is_known(self, page_key: str) -> bool:
+        """🔍 Página já processada em alguma execução anterior"""
+        return page_key in self.pages
+
+    def should_skip(self, page_key: str) -> bool:
+        """⏭️ Pular página antes do download (modo incremental)"""
+        if self.incremental and self.is_known(page_key) and not settings.incremental_recheck_pages:
+            self.skipped_pages += 1
+            return True
+        return False
+
+    def is_unchanged(self, page_key: str, content_hash: str) -> bool:
+        """♻️ Página rebaixada com conteúdo idêntico ao já processado"""
+        if self.incremental and self.pages.get(page_key) == content_hash:
+            self.skipped_pages += 1
+            return True
+        return False
+
+    def record(self, page_key: str, content_hash: str):
+        """✍️ Registrar página processada"""
+        self.pages[page_key] = content_hash
+
+    def save(self):
+        """💾 Gravar registro de forma atômica"""
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"target_date": self.target_date.isoformat(), "pages": self.pages},
+                f,
+                ensure_ascii=False
+            )
+        os.replace(tmp_path, self.path)
+
+        logger.debug("Page ledger saved", target_date=self.target_date.isoformat(), pages=len(self.pages))
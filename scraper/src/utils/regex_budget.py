@@ -0,0 +1,90 @@
+"""⏱️ Janelas limitadas e orçamento de tempo para as regexes do parser de seções"""
+
+import re
+import time
+from typing import Iterator, Optional
+
+# Distância máxima entre dois termos de um padrão ("valor ... principal ... R$").
+# Em texto normal uma linha do DJE tem ~100 caracteres e `.` não cruza linhas;
+# em OCR ruidoso ou páginas coladas sem quebras, `.*?` sem limite vira busca
+# quadrática (ou pior) para cada ocorrência do primeiro termo.
+MATCH_WINDOW_CHARS = 200
+
+def gap(limit: int = MATCH_WINDOW_CHARS) -> str:
+    """↔️ Trecho não guloso de até `limit` caracteres (substitui `.*?`)"""
+    return r'.{0,%d}?' % limit
+
+GAP = gap()
+
+# `re` não pode ser interrompido no meio de uma varredura: com prazo, textos
+# longos são varridos em blocos e o prazo é verificado entre um bloco e outro.
+SCAN_CHUNK_CHARS = 16_384
+
+# Sobreposição entre blocos: cobre o match mais longo dos padrões do parser
+# (até três lacunas GAP + termos), então a varredura em blocos encontra os
+# mesmos matches que uma varredura inteira.
+SCAN_OVERLAP_CHARS = 5 * MATCH_WINDOW_CHARS
+
+class ParseBudget:
+    """⏱️ Prazo de parse de uma seção
+
+    O módulo `re` não pode ser interrompido no meio de um match: `search` e
+    `finditer` varrem o texto em blocos de `SCAN_CHUNK_CHARS` e verificam o
+    prazo antes de cada bloco, e as janelas limitadas (`GAP`) mantêm cada
+    bloco barato. Estourado o prazo, as buscas param sem resultado, as etapas
+    restantes são puladas e a seção é contada como `exhausted`.
+    """
+
+    __slots__ = ('seconds', 'started_at', 'exhausted')
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.started_at = time.perf_counter()
+        self.exhausted = False
+
+    @classmethod
+    def from_ms(cls, milliseconds: Optional[int]) -> "ParseBudget":
+        return cls((milliseconds or 0) / 1000)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def expired(self) -> bool:
+        """⌛ Prazo esgotado? (0 = sem limite; uma vez esgotado, continua esgotado)"""
+        if not self.exhausted and self.seconds > 0 and self.elapsed > self.seconds:
+            self.exhausted = True
+        return self.exhausted
+
+    def finditer(
+        self,
+        pattern: 're.Pattern',
+        text: str,
+        pos: int = 0,
+        endpos: Optional[int] = None
+    ) -> Iterator['re.Match']:
+        """🔁 `pattern.finditer(text, pos, endpos)` interrompível: para assim que o prazo esgota"""
+        length = len(text) if endpos is None else min(endpos, len(text))
+        if self.seconds <= 0:
+            yield from pattern.finditer(text, pos, length)
+            return
+
+        while pos < length and not self.expired():
+            limit = pos + SCAN_CHUNK_CHARS
+            next_pos = limit
+            for match in pattern.finditer(text, pos, min(limit + SCAN_OVERLAP_CHARS, length)):
+                if match.start() >= limit:
+                    break
+                yield match
+                next_pos = max(limit, match.end())
+            pos = next_pos
+
+    def search(
+        self,
+        pattern: 're.Pattern',
+        text: str,
+        pos: int = 0,
+        endpos: Optional[int] = None
+    ) -> Optional['re.Match']:
+        """🔍 `pattern.search(text, pos, endpos)` interrompível (None se o prazo esgotar antes do match)"""
+        return next(self.finditer(pattern, text, pos, endpos), None)
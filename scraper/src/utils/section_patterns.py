@@ -0,0 +1,71 @@
+"""🧩 Padrões de extração de campos das seções do DJE (parser por seção e em lote)
+
+Os padrões de autor e de valores estão em minúsculas: o parser por seção os
+casa contra a cópia case-folded (`FoldedText.folded`) e o parser em lote
+contra o texto original com re.IGNORECASE. Os de processo e de advogado
+dependem da caixa do texto original ("Processo", nomes em maiúsculas) e
+rodam sempre sobre ele. Cada grupo declara as âncoras (`keyword_anchors`)
+sem as quais nenhum de seus padrões pode casar.
+"""
+
+import re
+
+from .regex_budget import GAP, MATCH_WINDOW_CHARS
+
+# Número do processo (texto original)
+PROCESS_NUMBER_PATTERN = re.compile(r'Processo (\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4})')
+
+# Autores: todos os padrões terminam em 'Vistos'
+AUTHOR_ANCHORS = ('vistos',)
+
+# "- Josuel Anderson de Oliveira - Vistos" (todos os matches)
+AUTHOR_PATTERN = re.compile(
+    r'-\s*([a-záêçõãàéíóúâîôû][a-záêçõãàéíóúâîôûç]+(?:\s+[a-záêçõãàéíóúâîôû][a-záêçõãàéíóúâîôûç]+)+)\s*-\s*vistos\.?'
+)
+
+# Só sem autor pelo padrão principal: primeiro nome válido do primeiro padrão que casar
+AUTHOR_FALLBACK_PATTERNS = [
+    # "DIREITO PREVIDENCIÁRIO - Nome - Vistos"
+    re.compile(
+        r'direito previdenciário\s*-\s*([a-záâãéêíóôõúç][a-záâãéêíóôõúç]+(?:\s+[a-záâãéêíóôõúç][a-záâãéêíóôõúç]+)+)\s*-\s*vistos[.:]?'
+    ),
+    # Tipo de benefício antes do nome
+    re.compile(
+        rf'(?:auxílio-acidente|auxílio-doença|aposentadoria|benefícios em espécie|incapacidade laborativa)[^-]{{0,{MATCH_WINDOW_CHARS}}}-\s*([a-záâãéêíóôõúç][a-záâãéêíóôõúç]+(?:\s+[a-záâãéêíóôõúç][a-záâãéêíóôõúç]+)+)\s*-\s*vistos[.:]?'
+    ),
+    # Nome composto antes de "- Vistos"
+    re.compile(
+        r'-\s*([a-záâãéêíóôõúç][a-záâãéêíóôõúç]+(?:\s+[a-záâãéêíóôõúç][a-záâãéêíóôõúç]+)+)\s*-\s*vistos[.:]?'
+    ),
+]
+
+# Advogados: "ADV: NOME (OAB 123/SP)" (texto original, nome em maiúsculas)
+LAWYER_ANCHORS = ('adv',)
+
+LAWYER_PATTERNS = [
+    re.compile(r'ADV: ([A-ZÁÊÇÕ\s]+?) \(OAB (\d+\/SP)\)'),
+    re.compile(r'Int\. - ADV: ([A-ZÁÊÇÕ\s]+?) \(OAB (\d+\/SP)\)'),
+]
+
+# Valores: (padrão, âncora exigida), em ordem de preferência
+MAIN_VALUE_PATTERNS = [
+    (re.compile(r'r\$ ([\d.,]+) - principal\s*bruto\/?\s*líquido?'), 'principal'),
+    (re.compile(r'r\$ ([\d.,]+) - principal'), 'principal'),
+    (re.compile(rf'valor{GAP}principal{GAP}r\$ ([\d.,]+)'), 'principal'),
+    (re.compile(r'importe total de r\$ ([\d.,]+)'), 'importe'),
+]
+
+# "sem juros moratórios" zera os juros antes de qualquer padrão
+NO_INTEREST_MARKER = 'sem juros moratórios'
+
+INTEREST_PATTERNS = [
+    (re.compile(r'r\$ ([\d.,]+) - juros moratórios'), 'juros'),
+    (re.compile(rf'juros{GAP}r\$ ([\d.,]+)'), 'juros'),
+    (re.compile(rf'correção{GAP}r\$ ([\d.,]+)'), 'correcao'),
+]
+
+FEES_PATTERNS = [
+    (re.compile(r'r\$ ([\d.,]+) - honorários advocatícios'), 'honorarios'),
+    (re.compile(rf'honorários{GAP}r\$ ([\d.,]+)'), 'honorarios'),
+    (re.compile(rf'verba{GAP}honorária{GAP}r\$ ([\d.,]+)'), 'honorarios'),
+]
@@ -0,0 +1,136 @@
+"""🧠 Pool de segmentos de memória compartilhada para PDFs baixados"""
+
+import os
+import threading
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Sistema de arquivos dos segmentos POSIX (tmpfs; em containers costuma ser pequeno)
+SHM_DIR = "/dev/shm"
+
+def shm_free_bytes() -> Optional[int]:
+    """💾 Espaço livre para segmentos (None = desconhecido, ex.: Windows)"""
+    try:
+        stats = os.statvfs(SHM_DIR)
+    except (AttributeError, OSError):
+        return None
+    return stats.f_bavail * stats.f_frsize
+
+class SharedBuffer:
+    """🧠 Segmento reutilizável preenchido incrementalmente por um download
+
+    Workers abrem o segmento pelo nome (`name`) e leem `len(buffer)` bytes via
+    memoryview; o processo principal lê por `view()`. Devolva ao pool com
+    `release()` quando o conteúdo não for mais necessário.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, pool: "SharedBufferPool"):
+        self.segment = segment
+        self.size = 0
+        self._touched = 0  # Bytes já materializados no tmpfs (não precisam de nova checagem)
+        self._pool = pool
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    @property
+    def capacity(self) -> int:
+        return self.segment.size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def write(self, data: bytes):
+        """➕ Acrescentar um bloco (BufferError se não couber no segmento ou no tmpfs)"""
+        end = self.size + len(data)
+        if end > self.capacity:
+            raise BufferError(f"Shared buffer full ({self.capacity} bytes)")
+
+        # Escrever além do espaço livre do tmpfs mata o processo com SIGBUS
+        if end > self._touched:
+            free = shm_free_bytes()
+            if free is not None and free < end - self._touched:
+                raise BufferError("Not enough shared memory available")
+            self._touched = end
+
+        self.segment.buf[self.size:end] = data
+        self.size = end
+
+    def view(self) -> memoryview:
+        """👁️ Conteúdo escrito até agora (sem cópia)"""
+        return self.segment.buf[:self.size]
+
+    def release(self):
+        """↩️ Devolver o segmento ao pool"""
+        self._pool.release(self)
+
+class SharedBufferPool:
+    """♻️ Segmentos de tamanho fixo reciclados entre downloads
+
+    Criar e mapear um segmento novo a cada PDF custa syscalls e page faults;
+    segmentos devolvidos voltam zerados (size=0) para o próximo download.
+    """
+
+    def __init__(self, segment_size: int, max_idle: int = 4):
+        self.segment_size = segment_size
+        self.max_idle = max_idle
+        self._idle: List[SharedBuffer] = []
+        self._lock = threading.Lock()
+
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self) -> Optional[SharedBuffer]:
+        """📤 Segmento livre (None se memória compartilhada não estiver disponível)"""
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+
+        try:
+            segment = shared_memory.SharedMemory(create=True, size=self.segment_size)
+        except OSError as e:
+            logger.warning("Shared memory segment unavailable", error=str(e))
+            return None
+
+        self.created += 1
+        return SharedBuffer(segment, self)
+
+    def release(self, buffer: SharedBuffer):
+        """📥 Reciclar (ou destruir, se já houver segmentos ociosos suficientes)"""
+        buffer.size = 0
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(buffer)
+                return
+        self._destroy(buffer)
+
+    @staticmethod
+    def _destroy(buffer: SharedBuffer):
+        try:
+            buffer.segment.close()
+        except BufferError:
+            # Ainda há memoryviews vivas: o mapeamento some com elas
+            pass
+        buffer.segment.unlink()
+
+    def close(self):
+        """🔒 Remover segmentos ociosos"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for buffer in idle:
+            self._destroy(buffer)
+
+    def get_stats(self) -> dict:
+        """📊 Estatísticas do pool"""
+        return {
+            "segment_size": self.segment_size,
+            "idle": len(self._idle),
+            "created": self.created,
+            "reused": self.reused
+        }
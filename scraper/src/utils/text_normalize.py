@@ -0,0 +1,69 @@
+"""🧽 Normalização do texto extraído (uma vez por página) e sombra case-folded"""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+# Palavra quebrada no fim da linha: "honorá-\nrios" → "honorários" (só continuação minúscula)
+HYPHENATION_PATTERN = re.compile(r'(?<=[^\W\d_])-\n(?=[a-záàâãéêíóôõúüç])')
+
+# Espaços horizontais repetidos (inclui NBSP e tabs vindos do PDF/OCR)
+HORIZONTAL_SPACE_PATTERN = re.compile(r'[ \t \f\v]+')
+
+# Espaços ao redor de quebras de linha
+LINE_EDGE_SPACE_PATTERN = re.compile(r' ?\n ?')
+
+def normalize_page_text(text: str) -> str:
+    """🧽 NFC, junção de hifenização e espaços colapsados (quebras de linha preservadas)
+
+    As quebras de linha continuam no texto: cabeçalhos, seções e padrões que
+    não atravessam linhas dependem delas.
+    """
+    if not text:
+        return text
+
+    text = unicodedata.normalize('NFC', text)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = HORIZONTAL_SPACE_PATTERN.sub(' ', text)
+    text = LINE_EDGE_SPACE_PATTERN.sub('\n', text)
+    return HYPHENATION_PATTERN.sub('', text)
+
+class FoldedText:
+    """🔡 Texto original + cópia case-folded para regex sem re.IGNORECASE
+
+    Padrões em minúsculas rodam sobre `folded`; posições encontradas lá são
+    convertidas de volta para o texto original com `original()` (casefold pode
+    expandir caracteres, ex.: 'ß' → 'ss').
+    """
+
+    __slots__ = ('text', 'folded', '_origins')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.folded = text.casefold()
+        self._origins: Optional[List[int]] = None
+
+        # casefold só expande: mesmo tamanho significa posições idênticas
+        if len(self.folded) != len(text):
+            origins = []
+            for index, char in enumerate(text):
+                origins.extend([index] * len(char.casefold()))
+            self._origins = origins
+
+    def to_original(self, offset: int) -> int:
+        """📍 Posição no texto original de uma posição da cópia folded"""
+        if self._origins is None:
+            return offset
+        return self._origins[offset] if offset < len(self._origins) else len(self.text)
+
+    def original(self, start: int, end: int) -> str:
+        """✂️ Trecho original correspondente a [start, end) da cópia folded"""
+        if self._origins is None:
+            return self.text[start:end]
+        if end <= start:
+            return ""
+        return self.text[self.to_original(start):self.to_original(end - 1) + 1]
+
+    def group(self, match: 're.Match', index: int = 1) -> str:
+        """🎯 Grupo de um match sobre `folded`, no texto original"""
+        return self.original(*match.span(index))
@@ -0,0 +1,7 @@
+"""🧪 Configuração compartilhada dos testes do scraper"""
+
+import os
+
+# Settings exige API_TOKEN na importação; os testes não falam com a API
+os.environ.setdefault("API_TOKEN", "test-token")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
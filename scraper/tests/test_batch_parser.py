@@ -0,0 +1,59 @@
+"""🐼 Parser em lote: mesmos campos que o parser por seção"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.services.batch_parser import parse_sections_batch
+from src.services.dje_scraper import DJEScraper
+from src.utils.keyword_anchors import scan_anchors
+from src.utils.regex_budget import ParseBudget
+
+SECTIONS = [
+    "Processo 0012345-67.2024.8.26.0053 - Cumprimento de Sentença - Josuel Anderson de Oliveira - Vistos. "
+    "R$ 12.345,67 - principal bruto/ líquido; R$ 1.234,56 - juros moratórios; "
+    "R$ 2.000,00 - honorários advocatícios. RPV.\nInt. - ADV: FULANO DE TAL (OAB 123456/SP)\n",
+    "Processo 0000001-00.2024.8.26.0053 - DIREITO PREVIDENCIÁRIO - MARIA DA SILVA SANTOS - Vistos: "
+    "importe total de R$ 4.000,00, SEM JUROS MORATÓRIOS. Verba honorária de R$ 300,00. RPV\n",
+    "Processo 0000002-00.2024.8.26.0053 - Aposentadoria - ana paula costa - VISTOS. "
+    "Valor do principal: R$ 10,00 com correção de R$ 5.000 - ADV: JOSÉ X (OAB 1/SP)\n",
+    "Trecho sem número de processo - RPV pagamento pelo INSS",
+]
+
+def fields(publication):
+    if publication is None:
+        return None
+    return (
+        publication.process_number,
+        publication.authors,
+        publication.lawyers,
+        publication.main_value,
+        publication.interest_value,
+        publication.legal_fees,
+    )
+
+@pytest.fixture
+def per_section():
+    scraper = DJEScraper()
+    parsed = [
+        asyncio.run(scraper._extract_single_publication_from_text(section, "url")) for section in SECTIONS
+    ]
+    asyncio.run(scraper.close())
+    return parsed
+
+def test_batch_matches_per_section_parser(per_section):
+    batch = parse_sections_batch(SECTIONS, ["url"] * len(SECTIONS), [None] * len(SECTIONS))
+
+    assert [fields(p) for p in batch] == [fields(p) for p in per_section]
+    assert batch[1].interest_value == Decimal('0.00')
+    assert batch[3] is None
+
+def test_batch_reuses_anchors_and_skips_patterns_after_budget():
+    anchors = [scan_anchors(section) for section in SECTIONS]
+    budget = ParseBudget(1e-9)
+
+    batch = parse_sections_batch(SECTIONS, [None] * len(SECTIONS), [None] * len(SECTIONS), None, anchors, budget)
+
+    assert budget.exhausted
+    assert batch[0].process_number == "0012345-67.2024.8.26.0053"
@@ -0,0 +1,86 @@
+"""💾 Páginas concluídas no checkpoint: busca única x buscas particionadas"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from src.config.settings import settings
+from src.models.publication import ExecutionCheckpoint
+from src.models.search_query import SearchQuery
+from src.services.dje_scraper import DJEScraper
+
+TARGET_DATE = date(2024, 5, 6)
+
+def test_pages_are_recorded_per_search_and_survive_a_round_trip():
+    checkpoint = ExecutionCheckpoint(execution_id=7, target_date=TARGET_DATE, mode="partitioned")
+    checkpoint.complete_page(2, "default|12|RPV")
+    checkpoint.complete_page(1, "default|12|RPV")
+    checkpoint.complete_page(1, "default|12|INSS")
+
+    restored = ExecutionCheckpoint.from_dict(checkpoint.to_dict())
+
+    assert restored.mode == "partitioned"
+    assert restored.last_completed_page == 0
+    assert restored.completed_pages == {"default|12|RPV": {1, 2}, "default|12|INSS": {1}}
+    assert restored.progress_label == "3 completed result pages"
+
+def test_single_search_keeps_the_highest_completed_page():
+    checkpoint = ExecutionCheckpoint(execution_id=7, target_date=TARGET_DATE)
+    checkpoint.complete_page(3)
+    checkpoint.complete_page(2)
+
+    assert checkpoint.last_completed_page == 3
+    assert checkpoint.completed_pages == {}
+    assert ExecutionCheckpoint.from_dict({'execution_id': 7, 'target_date': '2024-05-06'}).mode == "search"
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(settings, "query_max_total_pages", 100)
+    scraper = DJEScraper()
+    calls = []
+
+    async def open_search(target_date, query=None):
+        calls.append(("open", query.start_page))
+
+    async def navigate_to_page(page):
+        calls.append(("navigate", page))
+        return True
+
+    async def process_result_pages(first_page, last_page, *args, search_key=None, profile=None):
+        calls.append(("process", first_page, last_page, search_key))
+
+    monkeypatch.setattr(scraper, "_open_search", open_search)
+    monkeypatch.setattr(scraper, "navigate_to_page", navigate_to_page)
+    monkeypatch.setattr(scraper, "_process_result_pages", process_result_pages)
+    scraper.calls = calls
+    yield scraper
+    asyncio.run(scraper.close())
+
+def run_query(scraper, query, checkpoint):
+    queue = asyncio.Queue()
+    result = type("Result", (), {"search_queries": 0})()
+    asyncio.run(scraper._run_search_query(query, TARGET_DATE, result, checkpoint, None, None, queue))
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+def test_resumed_block_starts_after_its_completed_pages(scraper):
+    query = SearchQuery(caderno="12", search_terms="RPV", start_page=6, end_page=10)
+    checkpoint = ExecutionCheckpoint(execution_id=7, target_date=TARGET_DATE, mode="partitioned")
+    for page in (6, 7, 1, 2):
+        checkpoint.complete_page(page, query.search_key)
+
+    queued = run_query(scraper, query, checkpoint)
+
+    assert scraper.calls == [("open", 6), ("navigate", 8), ("process", 8, 10, query.search_key)]
+    assert [block.start_page for block in queued] == [11]
+
+def test_completed_block_only_schedules_the_next_one(scraper):
+    query = SearchQuery(caderno="12", search_terms="RPV", start_page=1, end_page=5)
+    checkpoint = ExecutionCheckpoint(execution_id=7, target_date=TARGET_DATE, mode="partitioned")
+    for page in range(1, 6):
+        checkpoint.complete_page(page, query.search_key)
+
+    queued = run_query(scraper, query, checkpoint)
+
+    assert scraper.calls == []
+    assert [block.start_page for block in queued] == [6]
@@ -0,0 +1,42 @@
+"""⚓ Varredura única de âncoras"""
+
+import re
+
+from src.utils.keyword_anchors import scan_anchors
+
+TEXT = (
+    "Processo 0012345-67.2024.8.26.0053 - Josuel - VISTOS.\n"
+    "R$ 1.000,00 - Principal; juros e correção; Honorários\n"
+    "Expeça-se RPV para PAGAMENTO PELO INSS - ADV: FULANO (OAB 1/SP)\n"
+)
+
+def test_every_anchor_found_case_insensitively():
+    anchors = scan_anchors(TEXT)
+
+    for name in ('vistos', 'currency', 'principal', 'juros', 'correcao', 'honorarios', 'rpv', 'inss_payment', 'adv'):
+        assert anchors.has(name), name
+    assert not anchors.has('importe')
+
+def test_offsets_point_at_the_anchor():
+    anchors = scan_anchors(TEXT + "Vistos de novo")
+
+    assert anchors.folded[anchors.first('vistos'):].startswith('vistos.')
+    assert anchors.folded[anchors.last('vistos'):].startswith('vistos de novo')
+    assert anchors.first('rpv', 'adv') == anchors.offsets['rpv'][0]
+
+def test_rpv_needs_word_boundaries():
+    assert not scan_anchors("RPVS e arpv").has('rpv')
+    assert scan_anchors("(RPV)").has('rpv')
+
+def test_search_starts_at_the_line_of_the_first_anchor():
+    anchors = scan_anchors(TEXT)
+    match = anchors.search(re.compile(r'r\$ ([\d.,]+) - principal'), 'principal')
+
+    assert anchors.group(match) == '1.000,00'
+    assert anchors.search(re.compile(r'importe total de r\$ ([\d.,]+)'), 'importe') is None
+
+def test_empty_text_has_no_anchors():
+    anchors = scan_anchors("")
+
+    assert anchors.offsets == {}
+    assert anchors.first('rpv') is None and anchors.last('rpv') is None
@@ -0,0 +1,49 @@
+"""🧮 Contabilidade do texto das páginas no orçamento de memória"""
+
+import asyncio
+
+import pytest
+
+from src.config.settings import settings
+from src.services.dje_scraper import DJEScraper
+from src.utils.memory_governor import text_size
+
+PAGE_URL = (
+    "https://esaj.tjsp.jus.br/cdje/getPaginaDoDiario.do"
+    "?cdVolume=18&nuDiario=4001&cdCaderno=12&nuSeqpagina={page}&uuidCaptcha="
+)
+PAGE_TEXT = "Processo 0012345-67.2024.8.26.0053 - Expeça-se RPV para pagamento pelo INSS.\n" * 50
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(settings, "keyword_prefilter", False)
+    monkeypatch.setattr(settings, "dje_delay_between_requests", 0)
+    scraper = DJEScraper()
+    scraper.current_execution_id = 1
+    yield scraper
+    asyncio.run(scraper.close())
+
+def test_cached_page_text_is_counted_once(scraper, monkeypatch):
+    held_while_parsing = {}
+
+    async def download(url):
+        return b"%PDF"
+
+    async def extract(content, layer=None):
+        return PAGE_TEXT
+
+    async def parse(pages):
+        held_while_parsing.update(
+            text=scraper.memory.held_by("text"),
+            page_cache=scraper.memory.held_by("page_cache")
+        )
+        return []
+
+    monkeypatch.setattr(scraper, "_download_pdf", download)
+    monkeypatch.setattr(scraper, "_extract_text_from_pdf", extract)
+    monkeypatch.setattr(scraper, "_extract_publications_from_pages", parse)
+
+    asyncio.run(scraper._process_pdf_links([PAGE_URL.format(page=1), PAGE_URL.format(page=2)]))
+
+    assert held_while_parsing == {"text": 0, "page_cache": 2 * text_size(PAGE_TEXT)}
+    assert scraper.memory.held == 2 * text_size(PAGE_TEXT)
@@ -0,0 +1,62 @@
+"""🪪 Normalização memoizada de nomes de autores e advogados"""
+
+import asyncio
+
+import pytest
+
+from src.models.publication import PublicationData
+from src.services.dje_scraper import DJEScraper
+from src.utils.name_cache import get_name_cache, normalize_name
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    get_name_cache().clear()
+    yield
+    get_name_cache().clear()
+
+def test_normalizer_runs_once_per_raw_name():
+    calls = []
+
+    def normalizer(raw):
+        calls.append(raw)
+        return raw.title()
+
+    first = normalize_name('author', 'maria  silva', normalizer)
+    second = normalize_name('author', 'maria  silva', normalizer)
+
+    assert first == second == 'Maria  Silva'
+    assert calls == ['maria  silva']
+    assert first is second
+
+def test_kind_separates_normalizations_of_the_same_raw_text():
+    assert normalize_name('author', 'ana', str.upper) == 'ANA'
+    assert normalize_name('lawyer', 'ana', str.title) == 'Ana'
+
+def test_publication_normalizes_and_deduplicates_authors_once():
+    publication = PublicationData(
+        process_number='0012345-67.2024.8.26.0053',
+        authors=['JOSUEL ANDERSON DE OLIVEIRA', 'josuel  anderson de oliveira', 'Ana Paula'],
+        full_content='x' * 40
+    )
+
+    assert publication.authors == ['Josuel Anderson De Oliveira', 'Ana Paula']
+    assert get_name_cache().misses == 3
+    assert get_name_cache().hits == 0
+
+def test_parser_hands_raw_names_to_a_single_lookup():
+    scraper = DJEScraper()
+    section = (
+        "Processo 0012345-67.2024.8.26.0053 - Cumprimento - JOSUEL ANDERSON DE OLIVEIRA - Vistos. "
+        "RPV pagamento pelo INSS\n"
+    )
+    try:
+        first = asyncio.run(scraper._extract_single_publication_from_text(section, "url"))
+        cache = get_name_cache()
+        after_first = (cache.hits, cache.misses)
+        second = asyncio.run(scraper._extract_single_publication_from_text(section, "url"))
+    finally:
+        asyncio.run(scraper.close())
+
+    assert first.authors == second.authors == ['Josuel Anderson De Oliveira']
+    assert after_first == (0, 1)
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,68 @@
+"""🔎 Prefiltro de palavras-chave e camada de texto nativo"""
+
+from multiprocessing import resource_tracker, shared_memory
+
+import pytest
+
+from src.config.settings import settings
+from src.services.pdf_text import FastTextLayer, _attach_segment, may_contain_keywords
+
+@pytest.fixture(autouse=True)
+def keywords(monkeypatch):
+    monkeypatch.setattr(settings, "prefilter_keywords", "RPV,pagamento pelo INSS")
+
+@pytest.mark.parametrize("text", [
+    "Expeça-se RPV em favor do autor",
+    "expeça-se rpv",
+    "realizado o PAGAMENTO PELO INSS",
+    "realizadoopagamentopeloINSS",
+    "pagamento\npelo   inss",
+])
+def test_keyword_found_ignoring_case_and_spacing(text):
+    assert may_contain_keywords(text)
+
+@pytest.mark.parametrize("text", ["", "Vistos. Intime-se.", "pagamento pelo estado", "R P"])
+def test_text_without_keywords_is_filtered(text):
+    assert not may_contain_keywords(text)
+
+def test_keywords_come_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "prefilter_keywords", "precatório")
+
+    assert may_contain_keywords("Expedição de PRECATÓRIO")
+    assert not may_contain_keywords("Expeça-se RPV")
+
+def test_fast_layer_reports_pages_left_for_fallbacks():
+    good = "Processo 0012345-67.2024.8.26.0053 - texto nativo com espaços suficientes " * 2
+    layer = FastTextLayer(
+        page_count=3,
+        texts={0: good, 2: good},
+        raw_texts={0: good, 1: "", 2: good},
+        backends=("pypdfium2",)
+    )
+
+    assert layer.missing == [1]
+    assert layer.subset([1, 2]).texts == {2: good}
+    assert layer.subset([1, 2]).backends == ("pypdfium2",)
+    assert "Processo 0012345" in layer.raw_text
+
+def test_fast_layer_without_text_is_treated_as_scanned():
+    layer = FastTextLayer(page_count=2, texts={}, raw_texts={0: " ", 1: "x"})
+
+    assert layer.raw_text is None
+    assert layer.missing == [0, 1]
+
+def test_worker_attach_leaves_the_owner_registration_alone(monkeypatch):
+    segment = shared_memory.SharedMemory(create=True, size=16)
+    sent = []
+    monkeypatch.setattr(resource_tracker._resource_tracker, "_send", lambda cmd, name, rtype: sent.append(cmd))
+    try:
+        attached = _attach_segment(segment.name)
+        attached.buf[:2] = b"ok"
+        attached.close()
+
+        assert sent == []
+        assert bytes(segment.buf[:2]) == b"ok"
+    finally:
+        monkeypatch.undo()
+        segment.close()
+        segment.unlink()
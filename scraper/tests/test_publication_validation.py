@@ -0,0 +1,48 @@
+"""🏷️ Validação de publicações por motivo"""
+
+from src.models.publication import PublicationData, ScrapingResult, ValidationReason
+
+CONTENT = "Processo 0012345-67.2024.8.26.0053 - conteúdo da publicação"
+
+def publication(**overrides):
+    fields = dict(process_number='0012345-67.2024.8.26.0053', authors=['Ana Paula'], full_content=CONTENT)
+    fields.update(overrides)
+    return PublicationData(**fields)
+
+def test_valid_publication():
+    assert publication().validation_reason is ValidationReason.VALID
+    assert publication().is_valid()
+
+def test_reasons_in_order_of_precedence():
+    assert publication(authors=[]).validation_reason is ValidationReason.NO_AUTHORS
+    assert publication(full_content="curto").validation_reason is ValidationReason.SHORT_CONTENT
+    assert publication(authors=[], full_content="").validation_reason is ValidationReason.NO_AUTHORS
+
+def test_missing_process_number():
+    invalid = publication()
+    invalid.process_number = ""
+
+    assert invalid.validation_reason is ValidationReason.MISSING_PROCESS_NUMBER
+
+def test_reason_is_computed_once():
+    invalid = publication(authors=[])
+    assert invalid.validation_reason is ValidationReason.NO_AUTHORS
+
+    invalid.authors = ['Ana Paula']
+
+    assert invalid.validation_reason is ValidationReason.NO_AUTHORS
+    assert not invalid.is_valid()
+
+def test_result_counts_rejects_by_reason():
+    result = ScrapingResult()
+    result.add_publication(publication())
+    result.add_publication(publication(authors=[]))
+    result.add_publication(publication(authors=[], process_number='0000001-00.2024.8.26.0053'))
+    result.add_publication(publication(full_content="curto"))
+    result.add_invalid(ValidationReason.EXTRACTION_FAILED)
+
+    summary = result.get_summary()
+
+    assert len(result.publications) == 1
+    assert summary['invalid_publications'] == 4
+    assert summary['invalid_reasons'] == {'no_authors': 2, 'short_content': 1, 'extraction_failed': 1}
@@ -0,0 +1,91 @@
+"""⏱️ Orçamento de parse: buscas interrompíveis e seções adversariais"""
+
+import asyncio
+import re
+import time
+
+import pytest
+
+from src.config.settings import settings
+from src.services.dje_scraper import DJEScraper
+from src.utils.benchmark import _stress_sections
+from src.utils.keyword_anchors import scan_anchors
+from src.utils.regex_budget import GAP, SCAN_CHUNK_CHARS, ParseBudget
+
+SECTION = (
+    "Processo 0012345-67.2024.8.26.0053 - Cumprimento de Sentença contra a Fazenda Pública - "
+    "Auxílio-Doença - Josuel Anderson de Oliveira - Vistos. Homologo o cálculo: "
+    "R$ 12.345,67 - principal bruto/ líquido; R$ 1.234,56 - juros moratórios; "
+    "R$ 2.000,00 - honorários advocatícios. Expeça-se RPV para pagamento pelo INSS.\n"
+    "Int. - ADV: FULANO DE TAL (OAB 123456/SP)\n"
+)
+
+BUDGET_MS = 100
+
+def fields(publication):
+    return (
+        publication.process_number,
+        publication.authors,
+        publication.lawyers,
+        publication.main_value,
+        publication.interest_value,
+        publication.legal_fees,
+    )
+
+@pytest.fixture
+def scraper():
+    scraper = DJEScraper()
+    yield scraper
+    asyncio.run(scraper.close())
+
+def parse(scraper, text, anchors=None):
+    return asyncio.run(scraper._extract_single_publication_from_text(text, "url", None, anchors))
+
+def test_zero_budget_never_expires():
+    budget = ParseBudget.from_ms(0)
+    time.sleep(0.01)
+    assert not budget.expired()
+
+def test_expired_budget_stays_expired_and_stops_searches():
+    budget = ParseBudget(0.001)
+    time.sleep(0.01)
+    assert budget.expired()
+    assert budget.exhausted
+    assert budget.search(re.compile(r'processo'), "processo " * 10) is None
+    assert list(budget.finditer(re.compile(r'processo'), "processo " * 10)) == []
+
+def test_chunked_finditer_finds_the_same_matches():
+    pattern = re.compile(rf'valor{GAP}principal{GAP}r\$ ([\d.,]+)')
+    match = "valor do principal de r$ 1.234,56 "
+    filler = "x" * (SCAN_CHUNK_CHARS // 3 - 7)
+    # Matches atravessando as fronteiras entre blocos
+    text = (filler + match) * 12
+
+    budget = ParseBudget(60)
+    chunked = [m.span() for m in budget.finditer(pattern, text)]
+
+    assert chunked == [m.span() for m in pattern.finditer(text)]
+    assert budget.search(pattern, text, 5).span() == pattern.search(text, 5).span()
+
+@pytest.mark.parametrize("case", ["lazy gaps", "merged lines", "author run", "ocr noise"])
+def test_adversarial_section_parses_within_budget(scraper, monkeypatch, case):
+    monkeypatch.setattr(settings, "parse_time_budget_ms", BUDGET_MS)
+    text = SECTION + _stress_sections(1_000_000, seed=0)[case]
+    anchors = scan_anchors(text)
+
+    started_at = time.perf_counter()
+    publication = parse(scraper, text, anchors)
+    elapsed = time.perf_counter() - started_at
+
+    assert publication is not None
+    assert elapsed < BUDGET_MS / 1000 + 0.2
+
+@pytest.mark.parametrize("case", ["lazy gaps", "author run", "ocr noise"])
+def test_adversarial_noise_leaves_fields_unchanged(scraper, monkeypatch, case):
+    monkeypatch.setattr(settings, "parse_time_budget_ms", BUDGET_MS)
+    clean = parse(scraper, SECTION)
+
+    noisy = parse(scraper, SECTION + _stress_sections(1_000_000, seed=0)[case])
+
+    assert fields(noisy) == fields(clean)
+    assert clean.main_value is not None and clean.legal_fees is not None
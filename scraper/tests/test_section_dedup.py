@@ -0,0 +1,48 @@
+"""♻️ Deduplicação de seções por execução (única camada de reaproveitamento)"""
+
+import asyncio
+
+import pytest
+
+from src.models.diary_page import DiaryPageRef, DiaryPageText
+from src.services.dje_scraper import DJEScraper
+
+SECTION = (
+    "Processo 0012345-67.2024.8.26.0053 - Cumprimento - Josuel Anderson de Oliveira - Vistos. "
+    "R$ 1.000,00 - principal. Expeça-se RPV para pagamento pelo INSS.\n"
+)
+
+@pytest.fixture
+def scraper():
+    scraper = DJEScraper()
+    scraper.current_execution_id = 1
+    yield scraper
+    asyncio.run(scraper.close())
+
+def sections_from(scraper, *texts):
+    page = DiaryPageText(ref=DiaryPageRef(1, 1, 12, 1), url="url", text="")
+    return asyncio.run(scraper._publications_from_sections([(text, page) for text in texts], {}))
+
+def test_repeated_section_is_parsed_once_and_counted(scraper):
+    first = sections_from(scraper, SECTION, SECTION)
+    second = sections_from(scraper, SECTION)
+
+    assert [publication.process_number for publication in first] == ['0012345-67.2024.8.26.0053']
+    assert second == []
+    assert scraper._unique_sections == 1
+    assert scraper._duplicate_sections_skipped == 2
+
+def test_sections_without_keywords_still_count_as_seen(scraper):
+    without_keywords = SECTION.replace("RPV para pagamento pelo INSS", "ofício")
+
+    assert sections_from(scraper, without_keywords) == []
+    assert sections_from(scraper, without_keywords) == []
+    assert scraper._unique_sections == 1
+    assert scraper._duplicate_sections_skipped == 1
+
+def test_new_run_forgets_previous_sections(scraper):
+    sections_from(scraper, SECTION)
+    scraper._reset_run_state()
+
+    assert len(sections_from(scraper, SECTION)) == 1
+    assert scraper._duplicate_sections_skipped == 0
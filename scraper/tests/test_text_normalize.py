@@ -0,0 +1,36 @@
+"""🧽 Normalização de páginas e sombra case-folded"""
+
+import re
+
+from src.utils.text_normalize import FoldedText, normalize_page_text
+
+def test_page_normalization_keeps_line_breaks():
+    text = "Honorá-\nrios  advocatícios \tde R$ 1,00 \r\nVistos.\rIntime-se"
+
+    assert normalize_page_text(text) == "Honorários advocatícios de R$ 1,00\nVistos.\nIntime-se"
+
+def test_hyphenation_only_joins_lowercase_continuations():
+    assert normalize_page_text("Auxílio-\nDoença") == "Auxílio-\nDoença"
+    assert normalize_page_text("ano 2024-\n2025") == "ano 2024-\n2025"
+
+def test_nfc_composes_accents():
+    assert normalize_page_text("Sa\u0303o Paulo") == "S\u00e3o Paulo"
+
+def test_same_length_fold_maps_offsets_one_to_one():
+    folded = FoldedText("Josuel ANDERSON - Vistos")
+    match = re.search(r'- (\w+)', folded.folded)
+
+    assert folded.to_original(5) == 5
+    assert folded.group(match) == "Vistos"
+
+def test_expanding_fold_maps_back_to_original_characters():
+    folded = FoldedText("Straße Müller - Vistos")
+    assert folded.folded == "strasse müller - vistos"
+
+    match = re.search(r'([a-zü]+) ([a-zü]+) - vistos', folded.folded)
+
+    assert folded.group(match, 1) == "Straße"
+    assert folded.group(match, 2) == "Müller"
+    assert folded.to_original(folded.folded.index('müller')) == "Straße Müller".index('Müller')
+    assert folded.original(4, 6) == "ß"
+    assert folded.to_original(len(folded.folded)) == len(folded.text)